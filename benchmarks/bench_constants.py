@@ -0,0 +1,50 @@
+# Allocation counts of the mapping of the sample inputs, with fresh constant primitives and codings per resource
+# versus the shared frozen constants of --shared-constants
+import re
+import tracemalloc
+
+from mapping import load_mapping, parse_inputs, elements
+
+mapping = load_mapping()
+documents = parse_inputs(mapping)
+
+def transform(document, shared):
+    return mapping.transform_document(mapping.CdaToFhirBundle, document, mapping.malac.models.fhir.r4.Bundle(), shared_constants=shared)
+
+def allocations(document, shared):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    fhir_bundle = transform(document, shared)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    # the blocks and bytes still held (by the bundle) after the mapping
+    stats = after.compare_to(before, 'filename')
+    objects = sum(1 for _ in elements(fhir_bundle, mapping.malac.models.fhir.r4.GeneratedsSuper))
+    return objects, sum(stat.count_diff for stat in stats), sum(stat.size_diff for stat in stats)
+
+def without_ids(fhir_bundle):
+    return re.sub('[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', '', str(fhir_bundle.exportJson()))
+
+# the bundles are the same in both modes (but for the random resource ids), and a shared constant changed in a bundle
+# is copied on write
+for name, document in documents.items():
+    fresh, shared = transform(document, False), transform(document, True)
+    assert without_ids(shared) == without_ids(fresh), name
+    fhir_resource = mapping.unpack_container(shared.entry[0].resource)
+    profile = fhir_resource.meta.profile[0]
+    assert isinstance(profile, mapping.FrozenConstant), name
+    try:
+        profile.value = 'changed'
+        raise AssertionError('%s: the shared constant %s was changed' % (name, profile.value))
+    except AttributeError:
+        pass
+    mapping.writable(fhir_resource.meta, 'profile', 0).value = 'changed'
+    assert fhir_resource.meta.profile[0].value == 'changed' and profile.value != 'changed', name
+    assert mapping.unpack_container(transform(document, True).entry[0].resource).meta.profile[0] is profile, name
+
+for name, document in documents.items():
+    for shared in (False, True):
+        allocations(document, shared)  # the first run fills the translation cache and the constant pool
+        objects, blocks, size = allocations(document, shared)
+        print('%-45s %-17s %7d FHIR objects %8d blocks %9.1f KiB' % (
+            name, 'shared constants' if shared else 'fresh constants', objects, blocks, size / 1024))
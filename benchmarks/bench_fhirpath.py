@@ -0,0 +1,43 @@
+# Benchmark of the FHIRPath expressions lowered by python-maps/lower_fhirpath.py, the fhirpath_utils evaluation of
+# the compiled map versus the lowered Python for all matching elements of the sample inputs (with equal results)
+import os
+import sys
+
+from mapping import root, load_mapping, parse_inputs, elements, bench
+
+sys.path.insert(0, os.path.join(root, 'python-maps'))
+from lower_fhirpath import lower
+
+mapping = load_mapping()
+documents = parse_inputs(mapping)
+at_ext = mapping.malac.models.cda.at_ext
+
+# (element type, variable, test) as compiled by MaLaC-HD
+tests = [
+    (at_ext.POCD_MT000040_Author, 'cda_author',
+     "fhirpath_utils.get(cda_author,'assignedAuthor','assignedPerson')"),
+    (at_ext.POCD_MT000040_Section, 'cda_section',
+     "fhirpath.single([v1 for v1 in fhirpath_utils.get(cda_section,'code') if (v1.code == '10' and v1.codeSystem == '1.2.40.0.34.5.11')])"),
+    (at_ext.POCD_MT000040_EntryRelationship, 'cda_entryRelationship',
+     "fhirpath.single([v1 for v1 in fhirpath_utils.get(cda_entryRelationship,'organizer','templateId') if v1.root == '1.3.6.1.4.1.19376.1.3.1.4'])"),
+    (at_ext.POCD_MT000040_Observation, 'cda_laboratory_observation',
+     "fhirpath.single(fhirpath_utils.bool_or(fhirpath_utils.equals([v2 for v1 in [cda_laboratory_observation.code] for v2 in fhirpath_utils.get(v1,'codeSystem')], '!=', ['2.16.840.1.113883.6.1']), [bool([v4 for v3 in [cda_laboratory_observation.code] for v4 in fhirpath_utils.get(v3,'nullFlavor')])]))"),
+    (at_ext.POCD_MT000040_ClinicalDocument, 'cda',
+     "fhirpath_utils.get(next(iter(cda.documentationOf or []), None),'serviceEvent','performer')"),
+]
+
+def compile_test(variable, test):
+    namespace = {'fhirpath': mapping.fhirpath, 'fhirpath_utils': mapping.fhirpath_utils}
+    exec('def test(%s):\n    if %s:\n        return True\n    return False\n' % (variable, test), namespace)
+    return namespace['test']
+
+for element_type, variable, test in tests:
+    lowered_source, _ = lower('if %s:\n    pass\n' % test)
+    lowered_test = lowered_source[3:lowered_source.index(':\n    pass')]
+    compiled, lowered = compile_test(variable, test), compile_test(variable, lowered_test)
+    print(lowered_test)
+    for name, document in documents.items():
+        nodes = list(elements(document, element_type))
+        assert [compiled(node) for node in nodes] == [lowered(node) for node in nodes]
+        bench('  %s: %d elements, fhirpath_utils' % (name, len(nodes)), lambda: [compiled(node) for node in nodes], number=200)
+        bench('  %s: %d elements, lowered' % (name, len(nodes)), lambda: [lowered(node) for node in nodes], number=200)
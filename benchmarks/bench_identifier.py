@@ -0,0 +1,44 @@
+# Benchmark of II over all identifiers of the sample inputs, the memoized root classification (and the system
+# translated through the translation cache) versus the compiled fhirpath evaluation (kept below as reference)
+from mapping import load_mapping, parse_inputs, elements, bench
+
+mapping = load_mapping()
+fhirpath = mapping.fhirpath
+fhirpath_utils = mapping.fhirpath_utils
+string = mapping.string
+uri = mapping.uri
+uuid_pattern = '[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+
+def II_fhirpath(src, tgt):
+    r = src.root
+    if r:
+        if src.extension is not None:
+            tgt.system = string(value=mapping.translate_single('OIDtoURI', r, 'code'))
+    r = src.root
+    if r:
+        if fhirpath.single(fhirpath_utils.bool_and([(src.extension is None)], [v2 for v1 in fhirpath_utils.get(src,'root') for v2 in fhirpath_utils.matches(v1, ['[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'])])):
+            tgt.system = uri(value='urn:ietf:rfc:3986')
+            tgt.value = string(value=fhirpath.single(fhirpath_utils.add(['urn:uuid:'], fhirpath_utils.lower(r))))
+    r = src.root
+    if r:
+        if fhirpath.single(fhirpath_utils.bool_and([(src.extension is None)], [v2 for v1 in fhirpath_utils.get(src,'root') for v2 in fhirpath_utils.contains(v1, ['.'])])):
+            tgt.system = uri(value='urn:ietf:rfc:3986')
+            tgt.value = string(value=('urn:oid:' + r))
+    e = src.extension
+    if e:
+        tgt.value = string(value=e)
+
+for name, document in parse_inputs(mapping).items():
+    iis = [ii for ii in elements(document, mapping.malac.models.cda.at_ext.II) if not ii.assigningAuthorityName and not ii.displayable]
+    for ii in iis:
+        new, old = mapping.malac.models.fhir.r4.Identifier(), mapping.malac.models.fhir.r4.Identifier()
+        mapping.II(ii, new)
+        II_fhirpath(ii, old)
+        assert new.exportJson() == old.exportJson(), ii.root
+    kinds = '%d UUID, %d OID, %d with extension' % (
+        sum(1 for ii in iis if ii.extension is None and mapping.root_fullmatch(uuid_pattern, ii.root or '')),
+        sum(1 for ii in iis if ii.extension is None and '.' in (ii.root or '')),
+        sum(1 for ii in iis if ii.extension is not None))
+    print('%s: %d identifiers (%s)' % (name, len(iis), kinds))
+    bench('  fhirpath evaluation', lambda: [II_fhirpath(ii, mapping.malac.models.fhir.r4.Identifier()) for ii in iis], number=200)
+    bench('  memoized roots', lambda: [mapping.II(ii, mapping.malac.models.fhir.r4.Identifier()) for ii in iis], number=200)
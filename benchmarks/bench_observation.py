@@ -0,0 +1,43 @@
+# Benchmark of CdaLaboratoryObservationToFhirObservation over all laboratory observations of the lab samples,
+# optionally against another version of the map, e.g. of a previous commit:
+#   git show HEAD~1:python-maps/CdaToBundle.4.py > python-maps/baseline.py  (next to the conceptMaps it loads)
+#   python benchmarks/bench_observation.py python-maps/baseline.py
+import copy
+import os
+import sys
+
+from mapping import load_mapping, parse_inputs, elements, bench
+
+versions = [('current', load_mapping())]
+if len(sys.argv) > 1:
+    versions.append((os.path.basename(sys.argv[1]), load_mapping(sys.argv[1], 'baseline')))
+
+for label, mapping in versions:
+    at_ext, r4 = mapping.malac.models.cda.at_ext, mapping.malac.models.fhir.r4
+    for name, document in parse_inputs(mapping).items():
+        if name not in ('Lab_Allgemeiner_Laborbefund.xml', 'ELGA-043-Laborbefund_EIS-FullSupport.xml'):
+            continue
+        if hasattr(mapping, 'start_document'):
+            # the context of the document the observations are mapped in
+            mapping.start_document(document, {})
+        observations = [observation for observation in elements(document, at_ext.POCD_MT000040_Observation)
+                        if any(templateId.root == '1.3.6.1.4.1.19376.1.3.1.6' for templateId in observation.templateId)]
+        fhir_patient, fhir_practitionerRole, fhir_bundle = r4.Patient(id=r4.string(value='patient')), r4.PractitionerRole(id=r4.string(value='practitionerRole')), r4.Bundle()
+        bench('%s %s: %d observations' % (label, name, len(observations)),
+              lambda: [mapping.CdaLaboratoryObservationToFhirObservation(document, observation, r4.Observation(), fhir_practitionerRole, fhir_patient, fhir_bundle)
+                       for observation in observations], number=50)
+
+# the values are dispatched in the order of the map (PQ, IVL_PQ, CD, ST), not in the order of the document: of an IVL_PQ
+# and a PQ value (in this order), the valueQuantity of the IVL_PQ is the last one written, as with one loop per type
+mapping = versions[0][1]
+at_ext, r4 = mapping.malac.models.cda.at_ext, mapping.malac.models.fhir.r4
+name, document = next(iter(parse_inputs(mapping).items()))
+mapping.start_document(document, {})
+observation = next(observation for observation in elements(document, at_ext.POCD_MT000040_Observation) if any(type(value) is at_ext.PQ for value in observation.value))
+pq = next(value for value in observation.value if type(value) is at_ext.PQ)
+ivl_pq = at_ext.IVL_PQ(value=str(float(pq.value) + 1), unit=pq.unit)
+mixed = copy.copy(observation)
+mixed.value = [ivl_pq, pq]
+fhir_observation = r4.Observation()
+mapping.CdaLaboratoryObservationToFhirObservation(document, mixed, fhir_observation, r4.PractitionerRole(id=r4.string(value='practitionerRole')), r4.Patient(id=r4.string(value='patient')), r4.Bundle())
+assert float(fhir_observation.valueQuantity.value.value) == float(ivl_pq.value), (fhir_observation.valueQuantity.value.value, ivl_pq.value, pq.value)
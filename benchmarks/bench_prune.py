@@ -0,0 +1,31 @@
+# Benchmark of prune_bundle over the bundles of the sample inputs and the TmE discharge letter, with the checks that the
+# pruned bundle is not less valid than the unpruned one: no extension without value[x] and sub-extensions (FHIR ext-1)
+# and no reference to a removed resource
+import json
+import os
+import re
+
+from mapping import root, inputs, load_mapping, elements, bench
+
+mapping = load_mapping()
+r4 = mapping.malac.models.fhir.r4
+value_members = [name for name in mapping.element_members(r4.Extension) if name.startswith('value')]
+
+for input_path in inputs + [os.path.join(root, 'input', 'TmE_Herzinsuffizienz_maximal_Entlassungsbericht.xml')]:
+    name = os.path.basename(input_path)
+    document = mapping.malac.models.cda.at_ext.parse(input_path, silence=True)
+
+    def mapped():
+        return mapping.transform_document(mapping.CdaToFhirBundle, document, r4.Bundle(), keep_empty=True)
+
+    fhir_bundle = mapped()
+    count = len(fhir_bundle.entry)
+    pruned = mapping.prune_bundle(fhir_bundle)
+    for extension in elements(fhir_bundle, r4.Extension):
+        assert extension.extension or any(getattr(extension, member) is not None for member in value_members), extension.url
+    fullUrls = {fhir_bundle_entry.fullUrl.value for fhir_bundle_entry in fhir_bundle.entry}
+    references = set(re.findall(r'"(urn:uuid:[0-9a-f-]+)"', json.dumps(fhir_bundle.exportJson())))
+    assert references <= fullUrls, references - fullUrls
+    # every run prunes a freshly mapped bundle
+    bundles = [mapped() for _ in range(15)]
+    bench('%s: %d entries, %d pruned' % (name, count, pruned), lambda: mapping.prune_bundle(bundles.pop()), number=5, repeat=3)
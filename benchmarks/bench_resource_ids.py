@@ -0,0 +1,26 @@
+# Benchmark of the resource id strategies (--resource-ids), the cost of minting the ids of a document on their own and
+# of the whole transformation of the document to the bundle, and a check that the uuid5 bundles are the same in every run
+from mapping import load_mapping, parse_inputs, bench
+
+mapping = load_mapping()
+r4 = mapping.malac.models.fhir.r4
+
+def transform(document, strategy):
+    return mapping.transform_document(mapping.CdaToFhirBundle, document, r4.Bundle(), resource_id_strategy=strategy)
+
+for name, document in parse_inputs(mapping).items():
+    assert str(transform(document, 'uuid5').exportJson()) == str(transform(document, 'uuid5').exportJson()), name
+    assert str(transform(document, 'uuid4').exportJson()) != str(transform(document, 'uuid4').exportJson()), name
+    for strategy in ('uuid4', 'uuid5'):
+        count = len(transform(document, strategy).entry) + 1
+        paths = ['CdaToFhirBundle/Observation'] * count
+        options = mapping.start_document(document, {'resource_id_strategy': strategy})
+        context = mapping.document_context()
+
+        def mint():
+            context.id_names.clear()
+            return [mapping.resource_id(path) for path in paths]
+
+        bench('%s %s: minting %d ids' % (name, strategy, count), mint, number=200)
+        mapping.finish_document(r4.Bundle(), options)
+        bench('%s %s: CdaToFhirBundle' % (name, strategy), lambda: transform(document, strategy), number=10)
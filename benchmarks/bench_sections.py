@@ -0,0 +1,36 @@
+# Benchmark of the section routing of CdaBodyToFhirComposition over the sections of the sample inputs, the section kinds
+# classified once per section versus the compiled conditions evaluated per pass and target, and a check that a section
+# of several kinds (e.g. a laboratory specialty section with the code of an annotation section) is dispatched to each
+import copy
+
+from mapping import load_mapping, parse_inputs, bench
+
+mapping = load_mapping()
+kinds = mapping.CdaBodyToFhirComposition_section_kinds
+# the conditions of the compiled group per section, in the order of the passes of a document with one specimen
+passes = (0, 1, 2, 3)
+
+def sections(document):
+    return [component.section for component in document.component.structuredBody.component or [] if component.section]
+
+for name, document in parse_inputs(mapping).items():
+    mapping.index_document(document)
+    cda_sections = sections(document)
+    matched = [mapping.section_kinds_of(cda_section, kinds) for cda_section in cda_sections]
+    assert matched == [frozenset(kind for kind in passes if kinds[kind](cda_section)) for cda_section in cda_sections], name
+    print('%s: %d sections of the kinds %s' % (name, len(cda_sections), sorted(set().union(*matched))))
+    bench('  conditions per pass', lambda: [kinds[kind](cda_section) for cda_section in cda_sections for kind in passes], number=200)
+    mapping.index_document(document).section_kinds.clear()
+    bench('  section kinds', lambda: [kind in mapping.section_kinds_of(cda_section, kinds) for cda_section in cda_sections for kind in passes], number=200)
+
+# a laboratory specialty section that is coded as annotation (BRIEFT) too is mapped as both
+name, document = next(iter(parse_inputs(mapping).items()))
+specialty = next(cda_section for cda_section in sections(document) if mapping.index_document(document).has_template(cda_section, '1.2.40.0.34.6.0.11.2.102', '1.3.6.1.4.1.19376.1.3.3.2.1'))
+plain = mapping.transform_document(mapping.CdaToFhirBundle, document, mapping.malac.models.fhir.r4.Bundle())
+specialty.code = copy.copy(specialty.code)
+specialty.code.code, specialty.code.codeSystem = 'BRIEFT', '1.2.40.0.34.5.40'
+both = mapping.transform_document(mapping.CdaToFhirBundle, copy.deepcopy(document), mapping.malac.models.fhir.r4.Bundle())
+composition_sections = lambda fhir_bundle: len(mapping.unpack_container(fhir_bundle.entry[0].resource).section)
+assert composition_sections(both) == composition_sections(plain) + 1, name
+print('%s: a laboratory specialty section coded as annotation is mapped to %d composition sections instead of %d' % (
+    name, composition_sections(both), composition_sections(plain)))
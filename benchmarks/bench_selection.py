@@ -0,0 +1,28 @@
+# Benchmark of the selective mapping (--resource-types), the transformation of the documents to the bundle restricted
+# to the resource types of a few profiles, against the whole bundle, and a check that a restricted bundle has only
+# resources of the selected types and no references to the others
+from mapping import load_mapping, parse_inputs, bench, elements
+
+mapping = load_mapping()
+r4 = mapping.malac.models.fhir.r4
+
+profiles = (
+    ('all', None),
+    ('Observation Specimen', ['Observation', 'Specimen']),
+    ('Patient Composition', ['Patient', 'Composition']),
+    ('DiagnosticReport Media', ['DiagnosticReport', 'Media']),
+)
+
+def transform(document, resource_types):
+    return mapping.transform_document(mapping.CdaToFhirBundle, document, r4.Bundle(), resource_types=resource_types)
+
+for name, document in parse_inputs(mapping).items():
+    for label, resource_types in profiles:
+        fhir_bundle = transform(document, resource_types)
+        types = {mapping.container_resource_type(fhir_bundle_entry.resource) for fhir_bundle_entry in fhir_bundle.entry}
+        assert resource_types is None or types <= set(resource_types), (name, label, types)
+        fullUrls = {fhir_bundle_entry.fullUrl.value for fhir_bundle_entry in fhir_bundle.entry}
+        dangling = [reference.reference.value for reference in elements(fhir_bundle, r4.Reference)
+                    if reference.reference is not None and reference.reference.value.startswith('urn:uuid:') and reference.reference.value not in fullUrls]
+        assert not dangling, (name, label, dangling)
+        bench('%s %s: %d entries' % (name, label, len(fhir_bundle.entry)), lambda: transform(document, resource_types), number=10)
@@ -0,0 +1,35 @@
+# Benchmark of TELContactPoint over all telecoms of the sample inputs, the scheme table and the single use
+# block (translated through the translation cache) versus the compiled sequential checks (kept below as reference)
+from mapping import load_mapping, parse_inputs, elements, bench
+
+mapping = load_mapping()
+fhirpath = mapping.fhirpath
+fhirpath_utils = mapping.fhirpath_utils
+string = mapping.string
+translate_single = mapping.translate_single
+
+def TELContactPoint_sequential(src, tgt):
+    u = src.use
+    for uses in (lambda use: use.startswith('H') or use == 'EC', lambda use: use in ('WP', 'AS'),
+                 lambda use: use in ('MC', 'PG'), lambda use: use == 'TMP'):
+        if u and uses(src.use):
+            tgt.use = string(value=translate_single('ELGATelecomAddressUseFHIRContactPointUse', u, 'code'))
+    v = src.value
+    for prefix, offset, system in (('fax:', 4, 'fax'), ('file:', 5, 'other'), ('ftp:', 4, 'url'), ('http:', 7, 'url'),
+                                   ('mailto:', 7, 'email'), ('mllp:', 5, 'url'), ('modem:', 6, 'other'),
+                                   ('nfs:', 4, 'other'), ('tel:', 4, 'phone'), ('telnet:', 7, 'url')):
+        if v and (src.value or '').startswith(prefix):
+            tgt.value = string(value=fhirpath.single(fhirpath_utils.substring(v, [offset], [])))
+            tgt.system = string(value=system)
+
+for name, document in parse_inputs(mapping).items():
+    tels = list(elements(document, mapping.malac.models.cda.at_ext.TEL))
+    for tel in tels:
+        new, old = mapping.malac.models.fhir.r4.ContactPoint(), mapping.malac.models.fhir.r4.ContactPoint()
+        mapping.TELContactPoint(tel, new)
+        TELContactPoint_sequential(tel, old)
+        assert new.exportJson() == old.exportJson(), tel.value
+    bench('%s: %d telecoms, sequential checks' % (name, len(tels)),
+          lambda: [TELContactPoint_sequential(tel, mapping.malac.models.fhir.r4.ContactPoint()) for tel in tels], number=200)
+    bench('%s: %d telecoms, scheme table' % (name, len(tels)),
+          lambda: [mapping.TELContactPoint(tel, mapping.malac.models.fhir.r4.ContactPoint()) for tel in tels], number=200)
@@ -0,0 +1,20 @@
+# Benchmark of the conceptMap translations, forward and reverse
+from mapping import load_mapping, bench
+
+mapping = load_mapping()
+
+bench('translate OIDtoURI forward (LOINC OID)',
+      lambda: mapping.translate(url='OIDtoURI', code='2.16.840.1.113883.6.1', silent=True))
+bench('translate OIDtoURI reverse (icd-o-3 URI)',
+      lambda: mapping.translate(url='OIDtoURI', code='https://termgit.elga.gv.at/CodeSystem/icd-o-3', reverse=True, silent=True))
+bench('translate OIDtoURI forward miss (unknown OID)',
+      lambda: mapping.translate(url='OIDtoURI', code='1.2.3.4.5', silent=True))
+bench('translate OIDtoURI reverse miss (unknown URI)',
+      lambda: mapping.translate(url='OIDtoURI', code='http://example.org/unknown', reverse=True, silent=True))
+bench('translate_single OIDtoURI (cached)',
+      lambda: mapping.translate_single('OIDtoURI', '2.16.840.1.113883.6.1', 'code'))
+codes = ['2.16.840.1.113883.6.1', '2.16.840.1.113883.6.96', '1.2.40.0.34.5.227', '1.2.3.4.5'] * 25
+bench('translate_many OIDtoURI (100 codes, 4 distinct)',
+      lambda: mapping.translate_many('OIDtoURI', codes), number=200)
+bench('translate_single OIDtoURI (100 codes, 4 distinct)',
+      lambda: [mapping.translate_single('OIDtoURI', code, 'code') for code in codes], number=200)
@@ -0,0 +1,64 @@
+# Benchmark of the conceptMaps in process pool workers, each worker loading its own copy of the
+# conceptMaps versus attaching to the shared memory-mapped segment written by the parent process
+# The workers are spawned (not forked, so that they do not share the pages of the parent) and each of them reports its
+# unique (USS) and proportional (PSS) set size from /proc (Linux), measured while all workers are alive, so that the
+# pages of the segment are divided among all of them, e.g. python benchmarks/bench_workers.py 4 8 16 32 64
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from mapping import load_mapping
+
+worker_barrier = None
+
+def init_worker(barrier):
+    global worker_barrier
+    worker_barrier = barrier
+
+def memory_kib():
+    # (USS, PSS) of this process in KiB
+    values = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            name, _, value = line.partition(':')
+            if value.strip().endswith('kB'):
+                values[name] = int(value.split()[0])
+    return values['Private_Clean'] + values['Private_Dirty'], values['Pss']
+
+def worker(segment_path):
+    if segment_path:
+        os.environ['CDA2FHIR_CONCEPTMAP_SEGMENT'] = segment_path
+    else:
+        os.environ.pop('CDA2FHIR_CONCEPTMAP_SEGMENT', None)
+    mapping = load_mapping()
+    start = time.perf_counter()
+    for code in ('2.16.840.1.113883.6.1', '2.16.840.1.113883.6.96', '1.2.3.4.5'):
+        mapping.translate_single('OIDtoURI', code, 'code')
+    elapsed = time.perf_counter() - start
+    # all workers have loaded the conceptMaps, none exits before all are measured
+    worker_barrier.wait()
+    uss, pss = memory_kib()
+    worker_barrier.wait()
+    return elapsed, uss, pss
+
+if __name__ == '__main__':
+    counts = [int(arg) for arg in sys.argv[1:]] or [4, 8, 16, 32, 64]
+    context = multiprocessing.get_context('spawn')
+    mapping = load_mapping()
+    segment_path = os.path.join(tempfile.mkdtemp(), 'conceptmaps.segment')
+    mapping.write_conceptMap_segment(segment_path)
+    for workers in counts:
+        for label, path in (('own copy per worker', None), ('attached shared segment', segment_path)):
+            barrier = context.Barrier(workers, timeout=600)
+            # one task per worker process, so that every worker is measured once and all of them at the same time
+            with ProcessPoolExecutor(workers, mp_context=context, initializer=init_worker, initargs=(barrier,), max_tasks_per_child=1) as pool:
+                results = list(pool.map(worker, [path] * workers))
+            print('%-25s %3d workers: %8.2f ms, USS %8.1f MiB and PSS %8.1f MiB per worker, PSS %8.1f MiB altogether' % (
+                label, workers,
+                1000 * sum(elapsed for elapsed, _, _ in results) / workers,
+                sum(uss for _, uss, _ in results) / workers / 1024,
+                sum(pss for _, _, pss in results) / workers / 1024,
+                sum(pss for _, _, pss in results) / 1024))
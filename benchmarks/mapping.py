@@ -0,0 +1,38 @@
+# Shared helpers for the benchmarks of the compiled Python map (python-maps/CdaToBundle.4.py).
+# Run the benchmarks from the repository root, e.g. python benchmarks/bench_translate.py
+import importlib.util
+import os
+import timeit
+
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+inputs = [os.path.join(root, 'input', input_file) for input_file in (
+    'Lab_Allgemeiner_Laborbefund.xml',
+    'ELGA-043-Laborbefund_EIS-FullSupport.xml',
+    'Mibi_Mikrobiologie.xml',
+)]
+
+def load_mapping(path=os.path.join(root, 'python-maps', 'CdaToBundle.4.py'), name='CdaToBundle'):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def parse_inputs(mapping):
+    return {os.path.basename(input_path): mapping.malac.models.cda.at_ext.parse(input_path, silence=True) for input_path in inputs}
+
+def bench(label, function, number=1000, repeat=5):
+    best = min(timeit.repeat(function, number=number, repeat=repeat)) / number
+    print('%-60s %10.2f us' % (label, best * 1e6))
+    return best
+
+def elements(obj, element_type, seen=None):
+    # all elements of the type reachable from the parsed document
+    seen = set() if seen is None else seen
+    if id(obj) in seen or not hasattr(obj, '__dict__'):
+        return
+    seen.add(id(obj))
+    if isinstance(obj, element_type):
+        yield obj
+    for value in vars(obj).values():
+        for item in (value if isinstance(value, list) else [value]):
+            yield from elements(item, element_type, seen)
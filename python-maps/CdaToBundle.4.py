@@ -2,19 +2,24 @@
 import sys
 import argparse
 import time
-import uuid
 import builtins
 import re
 import io
 import json
 from datetime import datetime
-import dateutil.parser
 from html import escape as html_escape
 import malac.models.cda.at_ext
 import malac.models.fhir.r4
 from malac.models.fhir.r4 import string, base64Binary, markdown, code, dateTime, uri, boolean, decimal
 from malac.models.fhir import utils
 from malac.utils import fhirpath
+import os
+
+# the runtime of the map, see cda2fhir_runtime.py
+if os.path.dirname(os.path.abspath(__file__)) not in sys.path:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import cda2fhir_runtime
+from cda2fhir_runtime import *
 
 description_text = "This has been compiled by the MApping LAnguage compiler for Health Data, short MaLaC-HD. See arguments for more details."
 one_timestamp = datetime.now()
@@ -29,18 +34,19 @@ def init_argparse() -> argparse.ArgumentParser:
     parser.add_argument(
        '-t', '--target', help='the target file path the result will be written to', required=True
     )
-    return parser
+    return add_arguments(parser)
 
-def transform(source_path, target_path):
+def transform(source_path, target_path, **options):
     start = time.time()
     print('+++++++ Transformation from '+source_path+' to '+target_path+' started +++++++')
+    options = start_transform(options)
 
     if source_path.endswith('.xml'):
         cda = malac.models.cda.at_ext.parse(source_path, silence=True)
     else:
         raise BaseException('Unknown source file ending: ' + source_path)
     fhir_bundle = malac.models.fhir.r4.Bundle()
-    CdaToFhirBundle(cda, fhir_bundle)
+    transform_document(CdaToFhirBundle, cda, fhir_bundle, **options)
     with open(target_path, 'w', newline='', encoding='utf-8') as f:
         if target_path.endswith('.xml'):
             f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
@@ -50,112 +56,122 @@ def transform(source_path, target_path):
         else:
             raise BaseException('Unknown target file ending')
 
+    finish_transform(options)
     print('altogether in '+str(round(time.time()-start,3))+' seconds.')
     print('+++++++ Transformation from '+source_path+' to '+target_path+' ended  +++++++')
+    return fhir_bundle
 
 def CdaToFhirBundle(cda, fhir_bundle):
-    fhir_bundle.id = string(value=str(uuid.uuid4()))
-    fhir_bundle.type_ = string(value='document')
+    fhir_bundle.id = string(value=resource_id('CdaToFhirBundle/Bundle'))
+    fhir_bundle.type_ = constant(string, 'document')
     if fhir_bundle.meta is None:
         fhir_bundle.meta = malac.models.fhir.r4.Meta()
     fhir_bundle_meta = fhir_bundle.meta
-    fhir_bundle_meta.profile.append(string(value='http://fhir.ehdsi.eu/laboratory/StructureDefinition/Bundle-lab-myhealtheu'))
+    fhir_bundle_meta.profile.append(constant(string, 'http://fhir.ehdsi.eu/laboratory/StructureDefinition/Bundle-lab-myhealtheu'))
     if cda.id:
         fhir_bundle.identifier = malac.models.fhir.r4.Identifier()
         II(cda.id, fhir_bundle.identifier)
     if cda.effectiveTime:
         fhir_bundle.timestamp = malac.models.fhir.r4.instant()
         TSInstant(cda.effectiveTime, fhir_bundle.timestamp)
-    fhir_bundle_entry_1 = malac.models.fhir.r4.Bundle_Entry()
-    fhir_bundle.entry.append(fhir_bundle_entry_1)
     fhir_composition = malac.models.fhir.r4.Composition()
-    fhir_bundle_entry_1.resource = malac.models.fhir.r4.ResourceContainer(Composition=fhir_composition)
-    fhir_composition_uuid = string(value=str(uuid.uuid4()))
+    fhir_composition_uuid = string(value=resource_id('CdaToFhirBundle/Composition'))
     fhir_composition.id = fhir_composition_uuid
-    fhir_bundle_entry_1.fullUrl = uri(value=('urn:uuid:' + fhir_composition_uuid.value))
-    fhir_bundle_entry_4 = malac.models.fhir.r4.Bundle_Entry()
-    fhir_bundle.entry.append(fhir_bundle_entry_4)
+    if selected_resources('Composition'):
+        fhir_bundle_entry_1 = malac.models.fhir.r4.Bundle_Entry()
+        fhir_bundle_entry_1.resource = make_resource_container('Composition', fhir_composition)
+        fhir_bundle_entry_1.fullUrl = uri(value=('urn:uuid:' + fhir_composition_uuid.value))
+        add_bundle_entry(fhir_bundle, fhir_bundle_entry_1)
     fhir_diagnosticReport = malac.models.fhir.r4.DiagnosticReport()
-    fhir_bundle_entry_4.resource = malac.models.fhir.r4.ResourceContainer(DiagnosticReport=fhir_diagnosticReport)
-    fhir_diagnosticReport_id = string(value=str(uuid.uuid4()))
+    fhir_diagnosticReport_id = string(value=resource_id('CdaToFhirBundle/DiagnosticReport'))
     fhir_diagnosticReport.id = fhir_diagnosticReport_id
-    fhir_bundle_entry_4.fullUrl = uri(value=('urn:uuid:' + fhir_diagnosticReport_id.value))
-    fhir_bundle_entry_2 = malac.models.fhir.r4.Bundle_Entry()
-    fhir_bundle.entry.append(fhir_bundle_entry_2)
+    if selected_resources('DiagnosticReport'):
+        fhir_bundle_entry_4 = malac.models.fhir.r4.Bundle_Entry()
+        fhir_bundle_entry_4.resource = make_resource_container('DiagnosticReport', fhir_diagnosticReport)
+        fhir_bundle_entry_4.fullUrl = uri(value=('urn:uuid:' + fhir_diagnosticReport_id.value))
+        add_bundle_entry(fhir_bundle, fhir_bundle_entry_4)
     fhir_patient = malac.models.fhir.r4.Patient()
-    fhir_bundle_entry_2.resource = malac.models.fhir.r4.ResourceContainer(Patient=fhir_patient)
-    fhir_patient_uuid = string(value=str(uuid.uuid4()))
+    fhir_patient_uuid = string(value=resource_id('CdaToFhirBundle/Patient'))
     fhir_patient.id = fhir_patient_uuid
-    fhir_bundle_entry_2.fullUrl = uri(value=('urn:uuid:' + fhir_patient_uuid.value))
-    fhir_bundle_entry_5 = malac.models.fhir.r4.Bundle_Entry()
-    fhir_bundle.entry.append(fhir_bundle_entry_5)
+    if selected_resources('Patient'):
+        fhir_bundle_entry_2 = malac.models.fhir.r4.Bundle_Entry()
+        fhir_bundle_entry_2.resource = make_resource_container('Patient', fhir_patient)
+        fhir_bundle_entry_2.fullUrl = uri(value=('urn:uuid:' + fhir_patient_uuid.value))
+        add_bundle_entry(fhir_bundle, fhir_bundle_entry_2)
     fhir_serviceRequest = malac.models.fhir.r4.ServiceRequest()
-    fhir_bundle_entry_5.resource = malac.models.fhir.r4.ResourceContainer(ServiceRequest=fhir_serviceRequest)
-    fhir_serviceRequest_id = string(value=str(uuid.uuid4()))
+    fhir_serviceRequest_id = string(value=resource_id('CdaToFhirBundle/ServiceRequest'))
     fhir_serviceRequest.id = fhir_serviceRequest_id
-    fhir_bundle_entry_5.fullUrl = uri(value=('urn:uuid:' + fhir_serviceRequest_id.value))
+    if selected_resources('ServiceRequest'):
+        fhir_bundle_entry_5 = malac.models.fhir.r4.Bundle_Entry()
+        fhir_bundle_entry_5.resource = make_resource_container('ServiceRequest', fhir_serviceRequest)
+        fhir_bundle_entry_5.fullUrl = uri(value=('urn:uuid:' + fhir_serviceRequest_id.value))
+        add_bundle_entry(fhir_bundle, fhir_bundle_entry_5)
     if fhir_serviceRequest.meta is None:
         fhir_serviceRequest.meta = malac.models.fhir.r4.Meta()
     fhir_serviceRequest_meta = fhir_serviceRequest.meta
-    fhir_serviceRequest_meta.profile.append(string(value='http://fhir.ehdsi.eu/laboratory/StructureDefinition/ServiceRequest-lab-myhealtheu'))
+    fhir_serviceRequest_meta.profile.append(constant(string, 'http://fhir.ehdsi.eu/laboratory/StructureDefinition/ServiceRequest-lab-myhealtheu'))
     fhir_composition_extenstion_01 = malac.models.fhir.r4.Extension()
     fhir_composition.extension.append(fhir_composition_extenstion_01)
     fhir_composition_extenstion_01.url = 'http://hl7.eu/fhir/StructureDefinition/composition-basedOn-order-or-requisition'
     fhir_diagnosticReport_composition_reference = malac.models.fhir.r4.Reference()
     fhir_composition_extenstion_01.valueReference = fhir_diagnosticReport_composition_reference
     fhir_diagnosticReport_composition_reference.reference = string(value=('urn:uuid:' + fhir_serviceRequest_id.value))
-    fhir_diagnosticReport_composition_reference.type_ = uri(value='ServiceRequest')
+    fhir_diagnosticReport_composition_reference.type_ = constant(uri, 'ServiceRequest')
     fhir_composition_subject_reference = malac.models.fhir.r4.Reference()
     fhir_composition.subject = fhir_composition_subject_reference
     fhir_composition_subject_reference.reference = string(value=('urn:uuid:' + fhir_patient_uuid.value))
-    fhir_composition_subject_reference.type_ = uri(value='Patient')
+    fhir_composition_subject_reference.type_ = constant(uri, 'Patient')
     fhir_composition_extenstion_02 = malac.models.fhir.r4.Extension()
     fhir_composition.extension.append(fhir_composition_extenstion_02)
     fhir_composition_extenstion_02.url = 'http://hl7.eu/fhir/laboratory/StructureDefinition/composition-diagnosticReportReference'
     fhir_composition_diagnosticReport_reference = malac.models.fhir.r4.Reference()
     fhir_composition_extenstion_02.valueReference = fhir_composition_diagnosticReport_reference
     fhir_composition_diagnosticReport_reference.reference = string(value=('urn:uuid:' + fhir_diagnosticReport_id.value))
-    fhir_composition_diagnosticReport_reference.type_ = uri(value='DiagnosticReport')
+    fhir_composition_diagnosticReport_reference.type_ = constant(uri, 'DiagnosticReport')
     fhir_diagnosticReport_extension = malac.models.fhir.r4.Extension()
     fhir_diagnosticReport.extension.append(fhir_diagnosticReport_extension)
     fhir_diagnosticReport_extension.url = 'http://hl7.org/fhir/5.0/StructureDefinition/extension-DiagnosticReport.composition'
     fhir_diagnosticReport_composition_reference = malac.models.fhir.r4.Reference()
     fhir_diagnosticReport_extension.valueReference = fhir_diagnosticReport_composition_reference
     fhir_diagnosticReport_composition_reference.reference = string(value=('urn:uuid:' + fhir_composition_uuid.value))
-    fhir_diagnosticReport_composition_reference.type_ = uri(value='Composition')
+    fhir_diagnosticReport_composition_reference.type_ = constant(uri, 'Composition')
     fhir_diagnosticReport_basedOn_reference = malac.models.fhir.r4.Reference()
     fhir_diagnosticReport.basedOn.append(fhir_diagnosticReport_basedOn_reference)
     fhir_diagnosticReport_basedOn_reference.reference = string(value=('urn:uuid:' + fhir_serviceRequest_id.value))
-    fhir_diagnosticReport_basedOn_reference.type_ = uri(value='ServiceRequest')
+    fhir_diagnosticReport_basedOn_reference.type_ = constant(uri, 'ServiceRequest')
     fhir_diagnosticReport_subject_reference = malac.models.fhir.r4.Reference()
     fhir_diagnosticReport.subject = fhir_diagnosticReport_subject_reference
     fhir_diagnosticReport_subject_reference.reference = string(value=('urn:uuid:' + fhir_patient_uuid.value))
-    fhir_diagnosticReport_subject_reference.type_ = uri(value='Patient')
+    fhir_diagnosticReport_subject_reference.type_ = constant(uri, 'Patient')
     fhir_serviceRequest_subject_reference = malac.models.fhir.r4.Reference()
     fhir_serviceRequest.subject = fhir_serviceRequest_subject_reference
     fhir_serviceRequest_subject_reference.reference = string(value=('urn:uuid:' + fhir_patient_uuid.value))
-    fhir_serviceRequest_subject_reference.type_ = uri(value='Patient')
-    fhir_bundle_entry01 = malac.models.fhir.r4.Bundle_Entry()
-    fhir_bundle.entry.append(fhir_bundle_entry01)
+    fhir_serviceRequest_subject_reference.type_ = constant(uri, 'Patient')
     fhir_practitionerRole = malac.models.fhir.r4.PractitionerRole()
-    fhir_bundle_entry01.resource = malac.models.fhir.r4.ResourceContainer(PractitionerRole=fhir_practitionerRole)
-    fhir_practitionerRole_id = string(value=str(uuid.uuid4()))
+    fhir_practitionerRole_id = string(value=resource_id('CdaToFhirBundle/PractitionerRole'))
     fhir_practitionerRole.id = fhir_practitionerRole_id
-    fhir_bundle_entry01.fullUrl = uri(value=('urn:uuid:' + fhir_practitionerRole_id.value))
-    CdaHeaderToFhirComposition(cda, fhir_composition, fhir_patient, fhir_diagnosticReport, fhir_serviceRequest, fhir_bundle)
-    CdaHeaderToFhirDiagnosticReport(cda, fhir_diagnosticReport)
+    if selected_resources('PractitionerRole'):
+        fhir_bundle_entry01 = malac.models.fhir.r4.Bundle_Entry()
+        fhir_bundle_entry01.resource = make_resource_container('PractitionerRole', fhir_practitionerRole)
+        fhir_bundle_entry01.fullUrl = uri(value=('urn:uuid:' + fhir_practitionerRole_id.value))
+        add_bundle_entry(fhir_bundle, fhir_bundle_entry01)
+    if selected_resources('Composition', 'Patient', 'ServiceRequest', 'Device', 'Encounter', 'PractitionerRole', 'Practitioner', 'Organization'):
+        CdaHeaderToFhirComposition(cda, fhir_composition, fhir_patient, fhir_diagnosticReport, fhir_serviceRequest, fhir_bundle)
+    if selected_resources('DiagnosticReport'):
+        CdaHeaderToFhirDiagnosticReport(cda, fhir_diagnosticReport)
     cda_component = cda.component
     if cda_component:
         cda_structuredBody = cda_component.structuredBody
         if cda_structuredBody:
-            CdaToPractitionerRole(cda, fhir_practitionerRole, fhir_bundle)
+            if selected_resources('PractitionerRole', 'Practitioner', 'Organization'):
+                CdaToPractitionerRole(cda, fhir_practitionerRole, fhir_bundle)
             CdaBodyToFhirComposition(cda, cda_structuredBody, fhir_composition, fhir_practitionerRole, fhir_patient, fhir_diagnosticReport, fhir_bundle)
 
 def CdaHeaderToFhirComposition(cda, fhir_composition, fhir_patient, fhir_diagnosticReport, fhir_serviceRequest, fhir_bundle):
     if fhir_composition.meta is None:
         fhir_composition.meta = malac.models.fhir.r4.Meta()
     fhir_composition_meta = fhir_composition.meta
-    fhir_composition_meta.profile.append(string(value='http://fhir.ehdsi.eu/laboratory/StructureDefinition/Composition-lab-myhealtheu'))
+    fhir_composition_meta.profile.append(constant(string, 'http://fhir.ehdsi.eu/laboratory/StructureDefinition/Composition-lab-myhealtheu'))
     cda_code = cda.code
     if cda_code:
         code_code = cda_code.code
@@ -171,13 +187,10 @@ def CdaHeaderToFhirComposition(cda, fhir_composition, fhir_patient, fhir_diagnos
         if not cda_code.translation:
             type_coding = malac.models.fhir.r4.CodeableConcept()
             fhir_composition.type_ = type_coding
-            coding_coding = malac.models.fhir.r4.Coding()
-            type_coding.coding.append(coding_coding)
-            coding_coding.system = uri(value='http://loinc.org')
-            coding_coding.code = string(value='11502-2')
+            type_coding.coding.append(constant_coding('http://loinc.org', '11502-2'))
     cda_title = cda.title
     if cda_title:
-        fhir_composition.title = string(value=fhirpath.single(fhirpath_utils.get(cda_title,'valueOf_',strip=True)))
+        fhir_composition.title = string(value=(str(cda_title.valueOf_).strip() or None if cda_title.valueOf_ else None))
     cda_statusCode = cda.statusCode
     if cda_statusCode:
         if fhirpath_utils.get(cda,'sdtcStatusCode'):
@@ -185,7 +198,7 @@ def CdaHeaderToFhirComposition(cda, fhir_composition, fhir_patient, fhir_diagnos
             if cda_code:
                 fhir_composition.status = string(value=translate_single('cda-sdtc-statuscode-2-fhir-composition-status', (cda_code if isinstance(cda_code, str) else cda_code.value), 'code'))
     if not fhirpath_utils.get(cda,'sdtcStatusCode'):
-        fhir_composition.status = string(value='final')
+        fhir_composition.status = constant(string, 'final')
     if cda.effectiveTime:
         fhir_composition.date = malac.models.fhir.r4.dateTime()
         TSDateTime(cda.effectiveTime, fhir_composition.date)
@@ -211,32 +224,32 @@ def CdaHeaderToFhirComposition(cda, fhir_composition, fhir_patient, fhir_diagnos
         if cda_patientRole:
             CdaPatientRoleToFhirPatient(cda_patientRole, fhir_patient, fhir_bundle)
     for cda_author in cda.author or []:
-        if fhirpath_utils.get(cda_author,'assignedAuthor','assignedPerson'):
+        if cda_author is not None and cda_author.assignedAuthor and cda_author.assignedAuthor.assignedPerson:
             fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-            fhir_bundle.entry.append(fhir_bundle_entry)
             fhir_practitionerRole = malac.models.fhir.r4.PractitionerRole()
-            fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(PractitionerRole=fhir_practitionerRole)
-            fhir_practitionerRole_id = string(value=str(uuid.uuid4()))
+            fhir_bundle_entry.resource = make_resource_container('PractitionerRole', fhir_practitionerRole)
+            fhir_practitionerRole_id = string(value=resource_id('CdaHeaderToFhirComposition/PractitionerRole'))
             fhir_practitionerRole.id = fhir_practitionerRole_id
             fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_practitionerRole_id.value))
+            add_bundle_entry(fhir_bundle, fhir_bundle_entry)
             fhir_composition_author_reference = malac.models.fhir.r4.Reference()
             fhir_composition.author.append(fhir_composition_author_reference)
             fhir_composition_author_reference.reference = string(value=('urn:uuid:' + fhir_practitionerRole_id.value))
-            fhir_composition_author_reference.type_ = uri(value='PractitionerRole')
+            fhir_composition_author_reference.type_ = constant(uri, 'PractitionerRole')
             CdaAuthorToFhirPractitionerRole(cda_author, fhir_practitionerRole, fhir_bundle)
     for cda_author in cda.author or []:
-        if fhirpath_utils.get(cda_author,'assignedAuthor','assignedAuthoringDevice'):
+        if cda_author is not None and cda_author.assignedAuthor and cda_author.assignedAuthor.assignedAuthoringDevice:
             fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-            fhir_bundle.entry.append(fhir_bundle_entry)
             fhir_device = malac.models.fhir.r4.Device()
-            fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(Device=fhir_device)
-            fhir_device_id = string(value=str(uuid.uuid4()))
+            fhir_bundle_entry.resource = make_resource_container('Device', fhir_device)
+            fhir_device_id = string(value=resource_id('CdaHeaderToFhirComposition/Device'))
             fhir_device.id = fhir_device_id
             fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_device_id.value))
+            add_bundle_entry(fhir_bundle, fhir_bundle_entry)
             fhir_composition_author_reference = malac.models.fhir.r4.Reference()
             fhir_composition.author.append(fhir_composition_author_reference)
             fhir_composition_author_reference.reference = string(value=('urn:uuid:' + fhir_device_id.value))
-            fhir_composition_author_reference.type_ = uri(value='Device')
+            fhir_composition_author_reference.type_ = constant(uri, 'Device')
             CdaAuthorToFhirDevice(cda_author, fhir_device, fhir_bundle)
     cda_custodian = cda.custodian
     if cda_custodian:
@@ -245,16 +258,16 @@ def CdaHeaderToFhirComposition(cda, fhir_composition, fhir_patient, fhir_diagnos
             cda_representedCustodianOrganization = cda_assignedCustodian.representedCustodianOrganization
             if cda_representedCustodianOrganization:
                 fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-                fhir_bundle.entry.append(fhir_bundle_entry)
                 fhir_custodian_organization = malac.models.fhir.r4.Organization()
-                fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(Organization=fhir_custodian_organization)
-                fhir_custodian_organization_id = string(value=str(uuid.uuid4()))
+                fhir_bundle_entry.resource = make_resource_container('Organization', fhir_custodian_organization)
+                fhir_custodian_organization_id = string(value=resource_id('CdaHeaderToFhirComposition/Organization'))
                 fhir_custodian_organization.id = fhir_custodian_organization_id
                 fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_custodian_organization_id.value))
+                add_bundle_entry(fhir_bundle, fhir_bundle_entry)
                 fhir_composition_custodian_reference = malac.models.fhir.r4.Reference()
                 fhir_composition.custodian = fhir_composition_custodian_reference
                 fhir_composition_custodian_reference.reference = string(value=('urn:uuid:' + fhir_custodian_organization_id.value))
-                fhir_composition_custodian_reference.type_ = uri(value='Organization')
+                fhir_composition_custodian_reference.type_ = constant(uri, 'Organization')
                 for id_ in cda_representedCustodianOrganization.id or []:
                     fhir_custodian_organization.identifier.append(malac.models.fhir.r4.Identifier())
                     II(id_, fhir_custodian_organization.identifier[-1])
@@ -273,55 +286,55 @@ def CdaHeaderToFhirComposition(cda, fhir_composition, fhir_patient, fhir_diagnos
         if cda_legalAuthenticator.time:
             fhir_composition_attester.time = malac.models.fhir.r4.dateTime()
             TSDateTime(cda_legalAuthenticator.time, fhir_composition_attester.time)
-        fhir_composition_attester.mode = string(value='legal')
+        fhir_composition_attester.mode = constant(string, 'legal')
         cda_legalAuthenticator_assignedEntity = cda_legalAuthenticator.assignedEntity
         if cda_legalAuthenticator_assignedEntity:
             fhir_bundle_entry01 = malac.models.fhir.r4.Bundle_Entry()
-            fhir_bundle.entry.append(fhir_bundle_entry01)
             fhir_practitionerRole = malac.models.fhir.r4.PractitionerRole()
-            fhir_bundle_entry01.resource = malac.models.fhir.r4.ResourceContainer(PractitionerRole=fhir_practitionerRole)
-            fhir_practitionerRole_id = string(value=str(uuid.uuid4()))
+            fhir_bundle_entry01.resource = make_resource_container('PractitionerRole', fhir_practitionerRole)
+            fhir_practitionerRole_id = string(value=resource_id('CdaHeaderToFhirComposition/PractitionerRole'))
             fhir_practitionerRole.id = fhir_practitionerRole_id
             fhir_bundle_entry01.fullUrl = uri(value=('urn:uuid:' + fhir_practitionerRole_id.value))
+            add_bundle_entry(fhir_bundle, fhir_bundle_entry01)
             fhir_composition_attester_reference = malac.models.fhir.r4.Reference()
             fhir_composition_attester.party = fhir_composition_attester_reference
             fhir_composition_attester_reference.reference = string(value=('urn:uuid:' + fhir_practitionerRole_id.value))
-            fhir_composition_attester_reference.type_ = uri(value='PractitionerRole')
+            fhir_composition_attester_reference.type_ = constant(uri, 'PractitionerRole')
             CdaAssignedEntityToFhirPractitionerRole(cda_legalAuthenticator_assignedEntity, fhir_practitionerRole, fhir_bundle)
     for cda_orderingProvider in cda.participant or []:
         if cda_orderingProvider.typeCode == 'REF':
             fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-            fhir_bundle.entry.append(fhir_bundle_entry)
             fhir_practitionerRole = malac.models.fhir.r4.PractitionerRole()
-            fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(PractitionerRole=fhir_practitionerRole)
-            fhir_practitionerRole_id = string(value=str(uuid.uuid4()))
+            fhir_bundle_entry.resource = make_resource_container('PractitionerRole', fhir_practitionerRole)
+            fhir_practitionerRole_id = string(value=resource_id('CdaHeaderToFhirComposition/PractitionerRole'))
             fhir_practitionerRole.id = fhir_practitionerRole_id
             fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_practitionerRole_id.value))
+            add_bundle_entry(fhir_bundle, fhir_bundle_entry)
             fhir_serviceRequest_requester_reference = malac.models.fhir.r4.Reference()
             fhir_serviceRequest.requester = fhir_serviceRequest_requester_reference
             fhir_serviceRequest_requester_reference.reference = string(value=('urn:uuid:' + fhir_practitionerRole_id.value))
-            fhir_serviceRequest_requester_reference.type_ = uri(value='PractitionerRole')
+            fhir_serviceRequest_requester_reference.type_ = constant(uri, 'PractitionerRole')
             cda_orderingProvider_time = cda_orderingProvider.time
             if cda_orderingProvider_time:
                 v = cda_orderingProvider_time.value
                 if v:
-                    fhir_serviceRequest.authoredOn = dateTime(value=dateutil.parser.parse(v).isoformat())
+                    fhir_serviceRequest.authoredOn = dateTime(value=parse_ts(v).dateTime)
             cda_associatedEntity = cda_orderingProvider.associatedEntity
             if cda_associatedEntity:
                 CdaAssociatedEntityToFhirPractitionerRole(cda_associatedEntity, fhir_practitionerRole, fhir_bundle)
     for cda_generalPractitioner in cda.participant or []:
-        if fhirpath.single([v1 for v1 in fhirpath_utils.get(cda_generalPractitioner,'templateId') if v1.root == '1.2.40.0.34.6.0.11.1.23']):
+        if document_index().has_template(cda_generalPractitioner, '1.2.40.0.34.6.0.11.1.23'):
             fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-            fhir_bundle.entry.append(fhir_bundle_entry)
             fhir_practitionerRole = malac.models.fhir.r4.PractitionerRole()
-            fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(PractitionerRole=fhir_practitionerRole)
-            fhir_practitionerRole_id = string(value=str(uuid.uuid4()))
+            fhir_bundle_entry.resource = make_resource_container('PractitionerRole', fhir_practitionerRole)
+            fhir_practitionerRole_id = string(value=resource_id('CdaHeaderToFhirComposition/PractitionerRole'))
             fhir_practitionerRole.id = fhir_practitionerRole_id
             fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_practitionerRole_id.value))
+            add_bundle_entry(fhir_bundle, fhir_bundle_entry)
             fhir_patient_generalPractitioner_reference = malac.models.fhir.r4.Reference()
             fhir_patient.generalPractitioner.append(fhir_patient_generalPractitioner_reference)
             fhir_patient_generalPractitioner_reference.reference = string(value=('urn:uuid:' + fhir_practitionerRole_id.value))
-            fhir_patient_generalPractitioner_reference.type_ = uri(value='PractitionerRole')
+            fhir_patient_generalPractitioner_reference.type_ = constant(uri, 'PractitionerRole')
             cda_generalPractitioner_associatedEntity = cda_generalPractitioner.associatedEntity
             if cda_generalPractitioner_associatedEntity:
                 CdaAssociatedEntityToFhirPractitionerRole(cda_generalPractitioner_associatedEntity, fhir_practitionerRole, fhir_bundle)
@@ -331,8 +344,8 @@ def CdaHeaderToFhirComposition(cda, fhir_composition, fhir_patient, fhir_diagnos
             for id__ in cda_inFulFillmentOf_order.id or []:
                 fhir_serviceRequest.identifier.append(malac.models.fhir.r4.Identifier())
                 II(id__, fhir_serviceRequest.identifier[-1])
-            fhir_serviceRequest.status = string(value='completed')
-            fhir_serviceRequest.intent = string(value='order')
+            fhir_serviceRequest.status = constant(string, 'completed')
+            fhir_serviceRequest.intent = constant(string, 'order')
     for cda_documentationOf in cda.documentationOf or []:
         cda_documentationOf_serviceEvent = cda_documentationOf.serviceEvent
         if cda_documentationOf_serviceEvent:
@@ -358,7 +371,7 @@ def CdaHeaderToFhirComposition(cda, fhir_composition, fhir_patient, fhir_diagnos
         if cda_parentDocument:
             fhir_composition_relatesTo = malac.models.fhir.r4.Composition_RelatesTo()
             fhir_composition.relatesTo.append(fhir_composition_relatesTo)
-            fhir_composition_relatesTo.code = string(value='replaces')
+            fhir_composition_relatesTo.code = constant(string, 'replaces')
             for cda_parentDocument_id in cda_parentDocument.id or []:
                 fhir_target_identifier = malac.models.fhir.r4.Identifier()
                 fhir_composition_relatesTo.targetIdentifier = fhir_target_identifier
@@ -368,27 +381,27 @@ def CdaHeaderToFhirComposition(cda, fhir_composition, fhir_patient, fhir_diagnos
         cda_encompassingEncounter = cda_componentOf.encompassingEncounter
         if cda_encompassingEncounter:
             fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-            fhir_bundle.entry.append(fhir_bundle_entry)
             fhir_encounter = malac.models.fhir.r4.Encounter()
-            fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(Encounter=fhir_encounter)
-            fhir_encounter_id = string(value=str(uuid.uuid4()))
+            fhir_bundle_entry.resource = make_resource_container('Encounter', fhir_encounter)
+            fhir_encounter_id = string(value=resource_id('CdaHeaderToFhirComposition/Encounter'))
             fhir_encounter.id = fhir_encounter_id
             fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_encounter_id.value))
+            add_bundle_entry(fhir_bundle, fhir_bundle_entry)
             fhir_composition_encounter_reference = malac.models.fhir.r4.Reference()
             fhir_composition.encounter = fhir_composition_encounter_reference
             fhir_composition_encounter_reference.reference = string(value=('urn:uuid:' + fhir_encounter_id.value))
-            fhir_composition_encounter_reference.type_ = uri(value='Encounter')
+            fhir_composition_encounter_reference.type_ = constant(uri, 'Encounter')
             fhir_diagnosticReport_encounter_reference = malac.models.fhir.r4.Reference()
             fhir_diagnosticReport.encounter = fhir_diagnosticReport_encounter_reference
             fhir_diagnosticReport_encounter_reference.reference = string(value=('urn:uuid:' + fhir_encounter_id.value))
-            fhir_diagnosticReport_encounter_reference.type_ = uri(value='Encounter')
+            fhir_diagnosticReport_encounter_reference.type_ = constant(uri, 'Encounter')
             CdaEncompassingEncounterToFhirEncounter(cda_encompassingEncounter, fhir_encounter, fhir_bundle)
 
 def CdaHeaderToFhirDiagnosticReport(cda, fhir_diagnosticReport):
     if fhir_diagnosticReport.meta is None:
         fhir_diagnosticReport.meta = malac.models.fhir.r4.Meta()
     fhir_diagnosticReport_meta = fhir_diagnosticReport.meta
-    fhir_diagnosticReport_meta.profile.append(string(value='http://fhir.ehdsi.eu/laboratory/StructureDefinition/DiagnosticReport-lab-myhealtheu'))
+    fhir_diagnosticReport_meta.profile.append(constant(string, 'http://fhir.ehdsi.eu/laboratory/StructureDefinition/DiagnosticReport-lab-myhealtheu'))
     cda_code = cda.code
     if cda_code:
         code_code = cda_code.code
@@ -404,10 +417,7 @@ def CdaHeaderToFhirDiagnosticReport(cda, fhir_diagnosticReport):
         if not cda_code.translation:
             code_coding = malac.models.fhir.r4.CodeableConcept()
             fhir_diagnosticReport.code = code_coding
-            coding_coding = malac.models.fhir.r4.Coding()
-            code_coding.coding.append(coding_coding)
-            coding_coding.system = uri(value='http://loinc.org')
-            coding_coding.code = string(value='11502-2')
+            code_coding.coding.append(constant_coding('http://loinc.org', '11502-2'))
     cda_statusCode = cda.statusCode
     if cda_statusCode:
         if fhirpath_utils.get(cda,'sdtcStatusCode'):
@@ -415,7 +425,7 @@ def CdaHeaderToFhirDiagnosticReport(cda, fhir_diagnosticReport):
             if cda_code:
                 fhir_diagnosticReport.status = string(value=translate_single('cda-sdtc-statuscode-2-fhir-diagnosticreport-status', (cda_code if isinstance(cda_code, str) else cda_code.value), 'code'))
     if not fhirpath_utils.get(cda,'sdtcStatusCode'):
-        fhir_diagnosticReport.status = string(value='final')
+        fhir_diagnosticReport.status = constant(string, 'final')
     cda_effectiveTime = cda.effectiveTime
     if cda_effectiveTime:
         fhir_diagnosticReport_effective = malac.models.fhir.r4.dateTime()
@@ -429,7 +439,7 @@ def CdaPatientRoleToFhirPatient(cda_patientRole, fhir_patient, fhir_bundle):
     if fhir_patient.meta is None:
         fhir_patient.meta = malac.models.fhir.r4.Meta()
     fhir_patient_meta = fhir_patient.meta
-    fhir_patient_meta.profile.append(string(value='http://fhir.ehdsi.eu/laboratory/StructureDefinition/Patient-lab-myhealtheu'))
+    fhir_patient_meta.profile.append(constant(string, 'http://fhir.ehdsi.eu/laboratory/StructureDefinition/Patient-lab-myhealtheu'))
     if len(cda_patientRole.id) > 0:
         cda_patientRole_id = cda_patientRole.id[0]
         fhir_patient_identifier = malac.models.fhir.r4.Identifier()
@@ -440,9 +450,9 @@ def CdaPatientRoleToFhirPatient(cda_patientRole, fhir_patient, fhir_bundle):
         identifier_type = fhir_patient_identifier.type_
         type_coding = malac.models.fhir.r4.Coding()
         identifier_type.coding.append(type_coding)
-        type_coding.system = uri(value='http://terminology.hl7.org/CodeSystem/v2-0203')
-        type_coding.code = string(value='PI')
-        type_coding.display = string(value='Patient internal identifier')
+        type_coding.system = constant(uri, 'http://terminology.hl7.org/CodeSystem/v2-0203')
+        type_coding.code = constant(string, 'PI')
+        type_coding.display = constant(string, 'Patient internal identifier')
     for cda_patientRole_id in cda_patientRole.id[1:]:
         if cda_patientRole_id.nullFlavor is None:
             fhir_patient_identifier = malac.models.fhir.r4.Identifier()
@@ -452,28 +462,28 @@ def CdaPatientRoleToFhirPatient(cda_patientRole, fhir_patient, fhir_bundle):
                 if fhir_patient_identifier.assigner is None:
                     fhir_patient_identifier.assigner = malac.models.fhir.r4.Reference()
                 assigner = fhir_patient_identifier.assigner
-                assigner.display = string(value='Dachverband der österreichischen Sozialversicherungsträger')
+                assigner.display = constant(string, 'Dachverband der österreichischen Sozialversicherungsträger')
                 if fhir_patient_identifier.type_ is None:
                     fhir_patient_identifier.type_ = malac.models.fhir.r4.CodeableConcept()
                 identifier_type = fhir_patient_identifier.type_
                 type_coding = malac.models.fhir.r4.Coding()
                 identifier_type.coding.append(type_coding)
-                type_coding.system = uri(value='http://terminology.hl7.org/CodeSystem/v2-0203')
-                type_coding.code = string(value='SS')
-                type_coding.display = string(value='Social Security Number')
+                type_coding.system = constant(uri, 'http://terminology.hl7.org/CodeSystem/v2-0203')
+                type_coding.code = constant(string, 'SS')
+                type_coding.display = constant(string, 'Social Security Number')
             if cda_patientRole_id.root == '1.2.40.0.10.2.1.1.149':
                 if fhir_patient_identifier.assigner is None:
                     fhir_patient_identifier.assigner = malac.models.fhir.r4.Reference()
                 assigner = fhir_patient_identifier.assigner
-                assigner.display = string(value='Bundesministerium für Inneres')
+                assigner.display = constant(string, 'Bundesministerium für Inneres')
                 if fhir_patient_identifier.type_ is None:
                     fhir_patient_identifier.type_ = malac.models.fhir.r4.CodeableConcept()
                 identifier_type = fhir_patient_identifier.type_
                 type_coding = malac.models.fhir.r4.Coding()
                 identifier_type.coding.append(type_coding)
-                type_coding.system = uri(value='http://terminology.hl7.org/CodeSystem/v2-0203')
-                type_coding.code = string(value='NI')
-                type_coding.display = string(value='National unique individual identifier')
+                type_coding.system = constant(uri, 'http://terminology.hl7.org/CodeSystem/v2-0203')
+                type_coding.code = constant(string, 'NI')
+                type_coding.display = constant(string, 'National unique individual identifier')
     for addr in cda_patientRole.addr or []:
         fhir_patient.address.append(malac.models.fhir.r4.Address())
         CdaAdressCompilationToFhirAustrianAddress(addr, fhir_patient.address[-1])
@@ -502,7 +512,7 @@ def CdaPatientRoleToFhirPatient(cda_patientRole, fhir_patient, fhir_bundle):
                     fhir_patient_gender_extension.valueCoding = fhir_gender_extension_coding
                     CECoding(cda_patient_gender, fhir_gender_extension_coding)
             if cda_patient_gender.nullFlavor == 'UNK':
-                fhir_patient.gender = string(value='unknown')
+                fhir_patient.gender = constant(string, 'unknown')
             for cda_patient_gender_translation in cda_patient_gender.translation or []:
                 if fhir_patient.gender is None:
                     fhir_patient.gender = malac.models.fhir.r4.AdministrativeGender()
@@ -513,7 +523,7 @@ def CdaPatientRoleToFhirPatient(cda_patientRole, fhir_patient, fhir_bundle):
                 fhir_gender_extension_codeableconcept = malac.models.fhir.r4.CodeableConcept()
                 fhir_patient_gender_extension.valueCodeableConcept = fhir_gender_extension_codeableconcept
                 CDCodeableConcept(cda_patient_gender_translation, fhir_gender_extension_codeableconcept)
-        if not fhirpath_utils.get(cda_patient.birthTime,'nullFlavor'):
+        if not (cda_patient.birthTime is not None and cda_patient.birthTime.nullFlavor):
             if fhir_patient.birthDate is None:
                 fhir_patient.birthDate = malac.models.fhir.r4.date()
             fhir_patient_birthDate = fhir_patient.birthDate
@@ -567,13 +577,13 @@ def CdaPatientRoleToFhirPatient(cda_patientRole, fhir_patient, fhir_bundle):
             if cda_guardian_organization:
                 for cda_organization_name in cda_guardian_organization.name or []:
                     fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-                    fhir_bundle.entry.append(fhir_bundle_entry)
                     fhir_contact_organization = malac.models.fhir.r4.Organization()
-                    fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(Organization=fhir_contact_organization)
-                    fhir_contact_organization_id = string(value=str(uuid.uuid4()))
+                    fhir_bundle_entry.resource = make_resource_container('Organization', fhir_contact_organization)
+                    fhir_contact_organization_id = string(value=resource_id('CdaPatientRoleToFhirPatient/Organization'))
                     fhir_contact_organization.id = fhir_contact_organization_id
-                    fhir_contact_organization.name = string(value=fhirpath.single(fhirpath_utils.get(cda_organization_name,'valueOf_',strip=True)))
+                    fhir_contact_organization.name = string(value=(str(cda_organization_name.valueOf_).strip() or None if cda_organization_name.valueOf_ else None))
                     fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_contact_organization_id.value))
+                    add_bundle_entry(fhir_bundle, fhir_bundle_entry)
                     fhir_contact_organization_reference = malac.models.fhir.r4.Reference()
                     fhir_patient_contact.organization = fhir_contact_organization_reference
                     fhir_contact_organization_reference.reference = string(value=('urn:uuid:' + fhir_contact_organization_id.value))
@@ -601,7 +611,7 @@ def CdaPatientRoleToFhirPatient(cda_patientRole, fhir_patient, fhir_bundle):
                     fhir_patient_communication_language = fhir_patient_communication.language
                     fhir_patient_communication_language_coding = malac.models.fhir.r4.Coding()
                     fhir_patient_communication_language.coding.append(fhir_patient_communication_language_coding)
-                    fhir_patient_communication_language_coding.system = uri(value='urn:ietf:bcp:47')
+                    fhir_patient_communication_language_coding.system = constant(uri, 'urn:ietf:bcp:47')
                     fhir_patient_communication_language_coding.code = string(value=cda_patient_languageCode_code)
             if cda_patient_language.preferenceInd:
                 fhir_patient_communication.preferred = malac.models.fhir.r4.boolean()
@@ -629,16 +639,16 @@ def CdaPatientRoleToFhirPatient(cda_patientRole, fhir_patient, fhir_bundle):
 
 def CdaAuthorToFhirPractitionerRole(cda_author, fhir_practitionerRole, fhir_bundle):
     fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-    fhir_bundle.entry.append(fhir_bundle_entry)
     fhir_practitioner = malac.models.fhir.r4.Practitioner()
-    fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(Practitioner=fhir_practitioner)
-    fhir_practitioner_id = string(value=str(uuid.uuid4()))
+    fhir_bundle_entry.resource = make_resource_container('Practitioner', fhir_practitioner)
+    fhir_practitioner_id = string(value=resource_id('CdaAuthorToFhirPractitionerRole/Practitioner'))
     fhir_practitioner.id = fhir_practitioner_id
     fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_practitioner_id.value))
+    add_bundle_entry(fhir_bundle, fhir_bundle_entry)
     fhir_practitionerRole_practitioner_reference = malac.models.fhir.r4.Reference()
     fhir_practitionerRole.practitioner = fhir_practitionerRole_practitioner_reference
     fhir_practitionerRole_practitioner_reference.reference = string(value=('urn:uuid:' + fhir_practitioner_id.value))
-    fhir_practitionerRole_practitioner_reference.type_ = uri(value='Practitioner')
+    fhir_practitionerRole_practitioner_reference.type_ = constant(uri, 'Practitioner')
     cda_author_assignedAuthor = cda_author.assignedAuthor
     if cda_author_assignedAuthor:
         for id_ in cda_author_assignedAuthor.id or []:
@@ -664,16 +674,16 @@ def CdaAuthorToFhirPractitionerRole(cda_author, fhir_practitionerRole, fhir_bund
         cda_representedOrganization = cda_author_assignedAuthor.representedOrganization
         if cda_representedOrganization:
             fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-            fhir_bundle.entry.append(fhir_bundle_entry)
             fhir_organization = malac.models.fhir.r4.Organization()
-            fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(Organization=fhir_organization)
-            fhir_organization_id = string(value=str(uuid.uuid4()))
+            fhir_bundle_entry.resource = make_resource_container('Organization', fhir_organization)
+            fhir_organization_id = string(value=resource_id('CdaAuthorToFhirPractitionerRole/Organization'))
             fhir_organization.id = fhir_organization_id
             fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_organization_id.value))
+            add_bundle_entry(fhir_bundle, fhir_bundle_entry)
             fhir_practitionerRole_organization = malac.models.fhir.r4.Reference()
             fhir_practitionerRole.organization = fhir_practitionerRole_organization
             fhir_practitionerRole_organization.reference = string(value=('urn:uuid:' + fhir_organization_id.value))
-            fhir_practitionerRole_organization.type_ = uri(value='Organization')
+            fhir_practitionerRole_organization.type_ = constant(uri, 'Organization')
             CdaOrganizationCompilationToFhirOrganization(cda_representedOrganization, fhir_organization)
 
 def CdaAuthorToFhirDevice(cda_author, fhir_device, fhir_bundle):
@@ -695,27 +705,27 @@ def CdaAuthorToFhirDevice(cda_author, fhir_device, fhir_bundle):
             if cda_manufacturerModelName:
                 fhir_device_deviceName = malac.models.fhir.r4.Device_DeviceName()
                 fhir_device.deviceName.append(fhir_device_deviceName)
-                fhir_device_deviceName.name = string(value=fhirpath.single(fhirpath_utils.get(cda_manufacturerModelName,'valueOf_',strip=True)))
-                fhir_device_deviceName.type_ = string(value='model-name')
+                fhir_device_deviceName.name = string(value=(str(cda_manufacturerModelName.valueOf_).strip() or None if cda_manufacturerModelName.valueOf_ else None))
+                fhir_device_deviceName.type_ = constant(string, 'model-name')
             cda_softwareName = cda_assignedAuthoringDevice.softwareName
             if cda_softwareName:
                 fhir_device_deviceName = malac.models.fhir.r4.Device_DeviceName()
                 fhir_device.deviceName.append(fhir_device_deviceName)
-                fhir_device_deviceName.name = string(value=fhirpath.single(fhirpath_utils.get(cda_softwareName,'valueOf_',strip=True)))
-                fhir_device_deviceName.type_ = string(value='other')
+                fhir_device_deviceName.name = string(value=(str(cda_softwareName.valueOf_).strip() or None if cda_softwareName.valueOf_ else None))
+                fhir_device_deviceName.type_ = constant(string, 'other')
         cda_representedOrganization = cda_author_assignedAuthor.representedOrganization
         if cda_representedOrganization:
             fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-            fhir_bundle.entry.append(fhir_bundle_entry)
             fhir_organization = malac.models.fhir.r4.Organization()
-            fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(Organization=fhir_organization)
-            fhir_organization_id = string(value=str(uuid.uuid4()))
+            fhir_bundle_entry.resource = make_resource_container('Organization', fhir_organization)
+            fhir_organization_id = string(value=resource_id('CdaAuthorToFhirDevice/Organization'))
             fhir_organization.id = fhir_organization_id
             fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_organization_id.value))
+            add_bundle_entry(fhir_bundle, fhir_bundle_entry)
             fhir_device_owner = malac.models.fhir.r4.Reference()
             fhir_device.owner = fhir_device_owner
             fhir_device_owner.reference = string(value=('urn:uuid:' + fhir_organization_id.value))
-            fhir_device_owner.type_ = uri(value='Organization')
+            fhir_device_owner.type_ = constant(uri, 'Organization')
             CdaOrganizationCompilationToFhirOrganization(cda_representedOrganization, fhir_organization)
 
 def CdaEncompassingEncounterToFhirEncounter(cda_encompassingEncounter, fhir_encounter, fhir_bundle):
@@ -723,7 +733,7 @@ def CdaEncompassingEncounterToFhirEncounter(cda_encompassingEncounter, fhir_enco
         if id_.nullFlavor is None:
             fhir_encounter.identifier.append(malac.models.fhir.r4.Identifier())
             II(id_, fhir_encounter.identifier[-1])
-    fhir_encounter.status = string(value='finished')
+    fhir_encounter.status = constant(string, 'finished')
     if cda_encompassingEncounter.code:
         fhir_encounter.class_ = malac.models.fhir.r4.Coding()
         transform_default(cda_encompassingEncounter.code, fhir_encounter.class_)
@@ -737,16 +747,16 @@ def CdaEncompassingEncounterToFhirEncounter(cda_encompassingEncounter, fhir_enco
             fhir_encounter_participant = malac.models.fhir.r4.Encounter_Participant()
             fhir_encounter.participant.append(fhir_encounter_participant)
             fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-            fhir_bundle.entry.append(fhir_bundle_entry)
             fhir_practitionerRole = malac.models.fhir.r4.PractitionerRole()
-            fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(PractitionerRole=fhir_practitionerRole)
-            fhir_practitionerRole_id = string(value=str(uuid.uuid4()))
+            fhir_bundle_entry.resource = make_resource_container('PractitionerRole', fhir_practitionerRole)
+            fhir_practitionerRole_id = string(value=resource_id('CdaEncompassingEncounterToFhirEncounter/PractitionerRole'))
             fhir_practitionerRole.id = fhir_practitionerRole_id
             fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_practitionerRole_id.value))
+            add_bundle_entry(fhir_bundle, fhir_bundle_entry)
             fhir_practitionerRole_reference = malac.models.fhir.r4.Reference()
             fhir_encounter_participant.individual = fhir_practitionerRole_reference
             fhir_practitionerRole_reference.reference = string(value=('urn:uuid:' + fhir_practitionerRole_id.value))
-            fhir_practitionerRole_reference.type_ = uri(value='PractitionerRole')
+            fhir_practitionerRole_reference.type_ = constant(uri, 'PractitionerRole')
             CdaAssignedEntityToFhirPractitionerRole(cda_assignedEntity, fhir_practitionerRole, fhir_bundle)
     cda_location = cda_encompassingEncounter.location
     if cda_location:
@@ -755,80 +765,87 @@ def CdaEncompassingEncounterToFhirEncounter(cda_encompassingEncounter, fhir_enco
             fhir_encounter_location = malac.models.fhir.r4.Encounter_Location()
             fhir_encounter.location.append(fhir_encounter_location)
             fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-            fhir_bundle.entry.append(fhir_bundle_entry)
             fhir_location = malac.models.fhir.r4.Location()
-            fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(Location=fhir_location)
-            fhir_location_id = string(value=str(uuid.uuid4()))
+            fhir_bundle_entry.resource = make_resource_container('Location', fhir_location)
+            fhir_location_id = string(value=resource_id('CdaEncompassingEncounterToFhirEncounter/Location'))
             fhir_location.id = fhir_location_id
             fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_location_id.value))
+            add_bundle_entry(fhir_bundle, fhir_bundle_entry)
             fhir_location_reference = malac.models.fhir.r4.Reference()
             fhir_encounter_location.location = fhir_location_reference
             fhir_location_reference.reference = string(value=('urn:uuid:' + fhir_location_id.value))
-            fhir_location_reference.type_ = uri(value='Location')
+            fhir_location_reference.type_ = constant(uri, 'Location')
             if cda_healthCareFacility.code:
                 fhir_location.type_.append(malac.models.fhir.r4.CodeableConcept())
                 transform_default(cda_healthCareFacility.code, fhir_location.type_[-1])
             cda_serviceProviderOrganization = cda_healthCareFacility.serviceProviderOrganization
             if cda_serviceProviderOrganization:
                 fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-                fhir_bundle.entry.append(fhir_bundle_entry)
                 fhir_organization = malac.models.fhir.r4.Organization()
-                fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(Organization=fhir_organization)
-                fhir_organization_id = string(value=str(uuid.uuid4()))
+                fhir_bundle_entry.resource = make_resource_container('Organization', fhir_organization)
+                fhir_organization_id = string(value=resource_id('CdaEncompassingEncounterToFhirEncounter/Organization'))
                 fhir_organization.id = fhir_organization_id
                 fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_organization_id.value))
+                add_bundle_entry(fhir_bundle, fhir_bundle_entry)
                 fhir_location_managingOrganization = malac.models.fhir.r4.Reference()
                 fhir_location.managingOrganization = fhir_location_managingOrganization
                 fhir_location_managingOrganization.reference = string(value=('urn:uuid:' + fhir_organization_id.value))
-                fhir_location_managingOrganization.type_ = uri(value='Organization')
+                fhir_location_managingOrganization.type_ = constant(uri, 'Organization')
                 CdaOrganizationCompilationToFhirOrganization(cda_serviceProviderOrganization, fhir_organization)
 
+CdaBodyToFhirComposition_section_kinds = (
+    lambda cda_section: fhirpath.single(fhirpath_utils.bool_or([v1 for g2 in [cda_section] if g2 is not None for v1 in [g2.code] if v1 if (v1.code == 'BRIEFT' and v1.codeSystem == '1.2.40.0.34.5.40')], fhirpath_utils.bool_and([v2 for g3 in [cda_section] if g3 is not None for v2 in [g3.code] if v2 if (v2.code == '46239-0' and v2.codeSystem == '2.16.840.1.113883.6.1')], fhirpath_utils.bool_or([v3 for g4 in [cda_section] if g4 is not None for v3 in g4.templateId if v3.root == '1.2.40.0.34.6.0.11.2.114'], [v4 for g5 in [cda_section] if g5 is not None for v4 in g5.templateId if v4.root == '1.2.40.0.34.11.4.2.4'])), fhirpath_utils.bool_and([v5 for g6 in [cda_section] if g6 is not None for v5 in [g6.code] if v5 if (v5.code == '10164-2' and v5.codeSystem == '2.16.840.1.113883.6.1')], [v6 for g7 in [cda_section] if g7 is not None for v6 in g7.templateId if v6.root == '1.2.40.0.34.6.0.11.2.111']), fhirpath_utils.bool_and([v7 for g8 in [cda_section] if g8 is not None for v7 in [g8.code] if v7 if (v7.code == '400999005' and v7.codeSystem == '2.16.840.1.113883.6.96')], [v8 for g9 in [cda_section] if g9 is not None for v8 in g9.templateId if v8.root == '1.2.40.0.34.6.0.11.2.112']), [v9 for g10 in [cda_section] if g10 is not None for v9 in [g10.code] if v9 if (v9.code == '20' and v9.codeSystem == '1.2.40.0.34.5.11')], fhirpath_utils.bool_and([v10 for g11 in [cda_section] if g11 is not None for v10 in [g11.code] if v10 if (v10.code == 'ABBEM' and v10.codeSystem == '1.2.40.0.34.5.40')], [v11 for g12 in [cda_section] if g12 is not None for v11 in g12.templateId if v11.root == '1.2.40.0.34.6.0.11.2.70']))),
+    lambda cda_section: document_index().has_code(cda_section, 'BEIL', '1.2.40.0.34.5.40'),
+    lambda cda_section: document_index().has_code(cda_section, '10', '1.2.40.0.34.5.11'),
+    lambda cda_section: document_index().has_template(cda_section, '1.2.40.0.34.6.0.11.2.102', '1.3.6.1.4.1.19376.1.3.3.2.1'),
+)
+
 def CdaBodyToFhirComposition(cda, cda_structuredBody, fhir_composition, fhir_practitionerRole, fhir_patient, fhir_diagnosticReport, fhir_bundle):
     for cda_component in cda_structuredBody.component or []:
         cda_section = cda_component.section
         if cda_section:
-            if fhirpath.single(fhirpath_utils.bool_or([v1 for v1 in fhirpath_utils.get(cda_section,'code') if (v1.code == 'BRIEFT' and v1.codeSystem == '1.2.40.0.34.5.40')], fhirpath_utils.bool_and([v2 for v2 in fhirpath_utils.get(cda_section,'code') if (v2.code == '46239-0' and v2.codeSystem == '2.16.840.1.113883.6.1')], fhirpath_utils.bool_or([v3 for v3 in fhirpath_utils.get(cda_section,'templateId') if v3.root == '1.2.40.0.34.6.0.11.2.114'], [v4 for v4 in fhirpath_utils.get(cda_section,'templateId') if v4.root == '1.2.40.0.34.11.4.2.4'])), fhirpath_utils.bool_and([v5 for v5 in fhirpath_utils.get(cda_section,'code') if (v5.code == '10164-2' and v5.codeSystem == '2.16.840.1.113883.6.1')], [v6 for v6 in fhirpath_utils.get(cda_section,'templateId') if v6.root == '1.2.40.0.34.6.0.11.2.111']), fhirpath_utils.bool_and([v7 for v7 in fhirpath_utils.get(cda_section,'code') if (v7.code == '400999005' and v7.codeSystem == '2.16.840.1.113883.6.96')], [v8 for v8 in fhirpath_utils.get(cda_section,'templateId') if v8.root == '1.2.40.0.34.6.0.11.2.112']), [v9 for v9 in fhirpath_utils.get(cda_section,'code') if (v9.code == '20' and v9.codeSystem == '1.2.40.0.34.5.11')], fhirpath_utils.bool_and([v10 for v10 in fhirpath_utils.get(cda_section,'code') if (v10.code == 'ABBEM' and v10.codeSystem == '1.2.40.0.34.5.40')], [v11 for v11 in fhirpath_utils.get(cda_section,'templateId') if v11.root == '1.2.40.0.34.6.0.11.2.70']))):
+            if 0 in section_kinds_of(cda_section, CdaBodyToFhirComposition_section_kinds):
                 fhir_section = malac.models.fhir.r4.Composition_Section()
                 fhir_composition.section.append(fhir_section)
                 CdaAnnotationSectionToFhirSection(cda_section, fhir_section, fhir_bundle)
         cda_section = cda_component.section
         if cda_section:
-            if fhirpath.single([v1 for v1 in fhirpath_utils.get(cda_section,'code') if (v1.code == 'BEIL' and v1.codeSystem == '1.2.40.0.34.5.40')]):
+            if 1 in section_kinds_of(cda_section, CdaBodyToFhirComposition_section_kinds):
                 CdaBeilagenSectionToFhirDiagnosticReportMedia(cda_section, fhir_diagnosticReport, fhir_bundle, fhir_patient)
-    if len([v1 for v1 in fhirpath_utils.descendants([cda]) if fhirpath_utils.equals(fhirpath_utils.get(v1,'root'), '==', ['1.3.6.1.4.1.19376.1.3.1.2']) == [True]]) == 1:
+    if document_index().root_count('1.3.6.1.4.1.19376.1.3.1.2') == 1:
         fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-        fhir_bundle.entry.append(fhir_bundle_entry)
         fhir_specimen = malac.models.fhir.r4.Specimen()
-        fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(Specimen=fhir_specimen)
-        fhir_specimen_uuid = string(value=str(uuid.uuid4()))
+        fhir_bundle_entry.resource = make_resource_container('Specimen', fhir_specimen)
+        fhir_specimen_uuid = string(value=resource_id('CdaBodyToFhirComposition/Specimen'))
         fhir_specimen.id = fhir_specimen_uuid
         fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_specimen_uuid.value))
+        add_bundle_entry(fhir_bundle, fhir_bundle_entry)
         for cda_component in cda_structuredBody.component or []:
             cda_section = cda_component.section
             if cda_section:
-                if fhirpath.single([v1 for v1 in fhirpath_utils.get(cda_section,'code') if (v1.code == '10' and v1.codeSystem == '1.2.40.0.34.5.11')]):
+                if 2 in section_kinds_of(cda_section, CdaBodyToFhirComposition_section_kinds):
                     CdaSpecimenSectionToFhirSpecimenWithSpecimen(cda_section, fhir_patient, fhir_diagnosticReport, fhir_specimen, fhir_bundle)
             cda_section = cda_component.section
             if cda_section:
-                if fhirpath.single([v1 for v1 in fhirpath_utils.get(cda_section,'templateId') if (v1.root == '1.2.40.0.34.6.0.11.2.102' or v1.root == '1.3.6.1.4.1.19376.1.3.3.2.1')]):
+                if 3 in section_kinds_of(cda_section, CdaBodyToFhirComposition_section_kinds):
                     fhir_section = malac.models.fhir.r4.Composition_Section()
                     fhir_composition.section.append(fhir_section)
                     CdaLaboratorySpecialtySectionToFhirSectionWithSpecimen(cda, cda_section, fhir_section, fhir_practitionerRole, fhir_patient, fhir_diagnosticReport, fhir_bundle, fhir_specimen)
-    if len([v1 for v1 in fhirpath_utils.descendants([cda]) if fhirpath_utils.equals(fhirpath_utils.get(v1,'root'), '==', ['1.3.6.1.4.1.19376.1.3.1.2']) == [True]]) == 0 or len([v2 for v2 in fhirpath_utils.descendants([cda]) if fhirpath_utils.equals(fhirpath_utils.get(v2,'root'), '==', ['1.3.6.1.4.1.19376.1.3.1.2']) == [True]]) > 1:
+    if document_index().root_count('1.3.6.1.4.1.19376.1.3.1.2') == 0 or document_index().root_count('1.3.6.1.4.1.19376.1.3.1.2') > 1:
         for cda_component in cda_structuredBody.component or []:
             cda_section = cda_component.section
             if cda_section:
-                if fhirpath.single([v1 for v1 in fhirpath_utils.get(cda_section,'code') if (v1.code == '10' and v1.codeSystem == '1.2.40.0.34.5.11')]):
+                if 2 in section_kinds_of(cda_section, CdaBodyToFhirComposition_section_kinds):
                     CdaSpecimenSectionToFhirSpecimen(cda_section, fhir_patient, fhir_diagnosticReport, fhir_bundle)
             cda_section = cda_component.section
             if cda_section:
-                if fhirpath.single([v1 for v1 in fhirpath_utils.get(cda_section,'templateId') if (v1.root == '1.2.40.0.34.6.0.11.2.102' or v1.root == '1.3.6.1.4.1.19376.1.3.3.2.1')]):
+                if 3 in section_kinds_of(cda_section, CdaBodyToFhirComposition_section_kinds):
                     fhir_section = malac.models.fhir.r4.Composition_Section()
                     fhir_composition.section.append(fhir_section)
                     CdaLaboratorySpecialtySectionToFhirSection(cda, cda_section, fhir_section, fhir_practitionerRole, fhir_patient, fhir_diagnosticReport, fhir_bundle)
 
 def CdaToPractitionerRole(cda, fhir_practitionerRole, fhir_bundle):
-    if fhirpath_utils.get(next(iter(cda.documentationOf or []), None),'serviceEvent','performer'):
+    if any(True for g15 in [next(iter(cda.documentationOf or []), None)] if g15 is not None for g16 in [g15.serviceEvent] if g16 for g17 in g16.performer):
         if len(cda.documentationOf) > 0:
             cda_documentationOf = cda.documentationOf[0]
             cda_documentationOf_serviceEvent = cda_documentationOf.serviceEvent
@@ -837,9 +854,9 @@ def CdaToPractitionerRole(cda, fhir_practitionerRole, fhir_bundle):
                     cda_performer_assignedEntity = cda_documentationOf_serviceEvent_performer.assignedEntity
                     if cda_performer_assignedEntity:
                         CdaAssignedEntityToFhirPractitionerRole(cda_performer_assignedEntity, fhir_practitionerRole, fhir_bundle)
-    if not fhirpath_utils.get(next(iter(cda.documentationOf or []), None),'serviceEvent','performer'):
+    if not any(True for g18 in [next(iter(cda.documentationOf or []), None)] if g18 is not None for g19 in [g18.serviceEvent] if g19 for g20 in g19.performer):
         for cda_author in cda.author:
-            if fhirpath_utils.get(cda_author,'assignedAuthor','assignedPerson'):
+            if cda_author is not None and cda_author.assignedAuthor and cda_author.assignedAuthor.assignedPerson:
                 CdaAuthorToFhirPractitionerRole(cda_author, fhir_practitionerRole, fhir_bundle)
 
 def CdaAnnotationSectionToFhirSection(cda_section, fhir_section, fhir_bundle):
@@ -849,14 +866,14 @@ def CdaAnnotationSectionToFhirSection(cda_section, fhir_section, fhir_bundle):
     fhir_section_code = fhir_section.code
     fhir_section_coding = malac.models.fhir.r4.Coding()
     fhir_section_code.coding.append(fhir_section_coding)
-    fhir_section_coding.code = string(value='48767-8')
-    fhir_section_coding.system = uri(value='http://loinc.org')
+    fhir_section_coding.code = constant(string, '48767-8')
+    fhir_section_coding.system = constant(uri, 'http://loinc.org')
 
 def CdaSpecimenSectionToFhirSpecimenWithSpecimen(cda_section, fhir_patient, fhir_diagnosticReport, fhir_specimen, fhir_bundle):
     for cda_section_entry in cda_section.entry or []:
         cda_act = cda_section_entry.act
         if cda_act:
-            if fhirpath.single([v1 for v1 in fhirpath_utils.get(cda_act,'code') if v1.code == '10']):
+            if document_index().has_code(cda_act, '10'):
                 for cda_entryRelationship in cda_act.entryRelationship or []:
                     cda_procedure = cda_entryRelationship.procedure
                     if cda_procedure:
@@ -866,38 +883,32 @@ def CdaSpecimenSectionToFhirSpecimen(cda_section, fhir_patient, fhir_diagnosticR
     for cda_section_entry in cda_section.entry or []:
         cda_act = cda_section_entry.act
         if cda_act:
-            if fhirpath.single([v1 for v1 in fhirpath_utils.get(cda_act,'code') if v1.code == '10']):
+            if document_index().has_code(cda_act, '10'):
                 for cda_entryRelationship in cda_act.entryRelationship or []:
                     cda_procedure = cda_entryRelationship.procedure
                     if cda_procedure:
                         fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-                        fhir_bundle.entry.append(fhir_bundle_entry)
                         fhir_specimen = malac.models.fhir.r4.Specimen()
-                        fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(Specimen=fhir_specimen)
-                        fhir_specimen_id = string(value=str(uuid.uuid4()))
+                        fhir_bundle_entry.resource = make_resource_container('Specimen', fhir_specimen)
+                        fhir_specimen_id = string(value=resource_id('CdaSpecimenSectionToFhirSpecimen/Specimen', cda_procedure))
                         fhir_specimen.id = fhir_specimen_id
                         fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_specimen_id.value))
+                        add_bundle_entry(fhir_bundle, fhir_bundle_entry)
                         CdaSpecimenCollectionToFhirSpecimen(cda_procedure, fhir_specimen, fhir_patient, fhir_diagnosticReport, fhir_bundle)
 
 def CdaSpecimenCollectionToFhirSpecimen(cda_procedure, fhir_specimen, fhir_patient, fhir_diagnosticReport, fhir_bundle):
     if fhir_specimen.meta is None:
         fhir_specimen.meta = malac.models.fhir.r4.Meta()
     fhir_specimen_meta = fhir_specimen.meta
-    fhir_specimen_meta.profile.append(string(value='http://fhir.ehdsi.eu/laboratory/StructureDefinition/Specimen-lab-myhealtheu'))
+    fhir_specimen_meta.profile.append(constant(string, 'http://fhir.ehdsi.eu/laboratory/StructureDefinition/Specimen-lab-myhealtheu'))
     fhir_specimen_patient_reference = malac.models.fhir.r4.Reference()
     fhir_specimen.subject = fhir_specimen_patient_reference
-    if fhir_patient.id is None:
-        fhir_patient.id = malac.models.fhir.r4.string()
-    fhir_patient_id = fhir_patient.id
-    fhir_specimen_patient_reference.reference = string(value=('urn:uuid:' + fhir_patient_id.value))
-    fhir_specimen_patient_reference.type_ = uri(value='Patient')
+    fhir_specimen_patient_reference.reference = string(value=document_context().reference(fhir_patient))
+    fhir_specimen_patient_reference.type_ = constant(uri, 'Patient')
     fhir_diagnosticReport_specimen_reference = malac.models.fhir.r4.Reference()
     fhir_diagnosticReport.specimen.append(fhir_diagnosticReport_specimen_reference)
-    if fhir_specimen.id is None:
-        fhir_specimen.id = malac.models.fhir.r4.string()
-    fhir_specimen_id = fhir_specimen.id
-    fhir_diagnosticReport_specimen_reference.reference = string(value=('urn:uuid:' + fhir_specimen_id.value))
-    fhir_diagnosticReport_specimen_reference.type_ = uri(value='Specimen')
+    fhir_diagnosticReport_specimen_reference.reference = string(value=document_context().reference(fhir_specimen))
+    fhir_diagnosticReport_specimen_reference.type_ = constant(uri, 'Specimen')
     if fhir_specimen.collection is None:
         fhir_specimen.collection = malac.models.fhir.r4.Specimen_Collection()
     fhir_specimen_collection = fhir_specimen.collection
@@ -919,25 +930,17 @@ def CdaSpecimenCollectionToFhirSpecimen(cda_procedure, fhir_specimen, fhir_patie
     if fhir_specimen_collection.bodySite is None:
         fhir_specimen_collection.bodySite = malac.models.fhir.r4.CodeableConcept()
     fhir_specimen_collection_bodySite = fhir_specimen_collection.bodySite
-    fhir_specimen_collection_bodySite_coding = malac.models.fhir.r4.Coding()
-    fhir_specimen_collection_bodySite.coding.append(fhir_specimen_collection_bodySite_coding)
-    fhir_specimen_collection_bodySite_coding.system = uri(value='http://terminology.hl7.org/CodeSystem/v3-NullFlavor')
-    fhir_specimen_collection_bodySite_coding.code = string(value='OTH')
+    fhir_specimen_collection_bodySite.coding.append(constant_coding('http://terminology.hl7.org/CodeSystem/v3-NullFlavor', 'OTH'))
     for cda_procedure_performer in cda_procedure.performer or []:
         cda_procedure_performer_assignedEntity = cda_procedure_performer.assignedEntity
         if cda_procedure_performer_assignedEntity:
-            fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-            fhir_bundle.entry.append(fhir_bundle_entry)
-            fhir_practitionerRole = malac.models.fhir.r4.PractitionerRole()
-            fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(PractitionerRole=fhir_practitionerRole)
-            fhir_practitionerRole_id = string(value=str(uuid.uuid4()))
-            fhir_practitionerRole.id = fhir_practitionerRole_id
-            fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_practitionerRole_id.value))
+            fhir_practitionerRole, fhir_practitionerRole_new = document_context().bundle_resource(fhir_bundle, 'PractitionerRole', (entity_key(cda_procedure_performer_assignedEntity), entity_key(cda_procedure_performer_assignedEntity.representedOrganization)))
             fhir_specimen_collection_collector_reference = malac.models.fhir.r4.Reference()
             fhir_specimen_collection.collector = fhir_specimen_collection_collector_reference
-            fhir_specimen_collection_collector_reference.reference = string(value=('urn:uuid:' + fhir_practitionerRole_id.value))
-            fhir_specimen_collection_collector_reference.type_ = uri(value='PractitionerRole')
-            CdaAssignedEntityToFhirPractitionerRole(cda_procedure_performer_assignedEntity, fhir_practitionerRole, fhir_bundle)
+            fhir_specimen_collection_collector_reference.reference = string(value=document_context().reference(fhir_practitionerRole))
+            fhir_specimen_collection_collector_reference.type_ = constant(uri, 'PractitionerRole')
+            if fhir_practitionerRole_new:
+                CdaAssignedEntityToFhirPractitionerRole(cda_procedure_performer_assignedEntity, fhir_practitionerRole, fhir_bundle)
     for cda_participant in cda_procedure.participant or []:
         cda_participantRole = cda_participant.participantRole
         if cda_participantRole:
@@ -965,41 +968,41 @@ def CdaLaboratorySpecialtySectionToFhirSectionWithSpecimen(cda, cda_section, fhi
         cda_act = cda_section_entry.act
         if cda_act:
             for cda_entryRelationship in cda_act.entryRelationship or []:
-                if fhirpath.single([v1 for v1 in fhirpath_utils.get(cda_entryRelationship,'procedure','templateId') if v1.root == '1.3.6.1.4.1.19376.1.3.1.2']):
+                if document_index().has_template(cda_entryRelationship.procedure, '1.3.6.1.4.1.19376.1.3.1.2'):
                     cda_procedure = cda_entryRelationship.procedure
                     if cda_procedure:
                         CdaSpecimenCollectionToFhirSpecimen(cda_procedure, fhir_specimen, fhir_patient, fhir_diagnosticReport, fhir_bundle)
             for cda_entryRelationship in cda_act.entryRelationship or []:
-                if fhirpath.single([v1 for v1 in fhirpath_utils.get(cda_entryRelationship,'organizer','templateId') if v1.root == '1.3.6.1.4.1.19376.1.3.1.4']):
+                if document_index().has_template(cda_entryRelationship.organizer, '1.3.6.1.4.1.19376.1.3.1.4'):
                     cda_laboratory_battery_organizer = cda_entryRelationship.organizer
                     if cda_laboratory_battery_organizer:
                         fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-                        fhir_bundle.entry.append(fhir_bundle_entry)
                         fhir_observation = malac.models.fhir.r4.Observation()
-                        fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(Observation=fhir_observation)
-                        fhir_observation_id = string(value=str(uuid.uuid4()))
+                        fhir_bundle_entry.resource = make_resource_container('Observation', fhir_observation)
+                        fhir_observation_id = string(value=resource_id('CdaLaboratorySpecialtySectionToFhirSectionWithSpecimen/Observation', cda_laboratory_battery_organizer))
                         fhir_observation.id = fhir_observation_id
                         fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_observation_id.value))
+                        add_bundle_entry(fhir_bundle, fhir_bundle_entry)
                         fhir_section_entry_reference = malac.models.fhir.r4.Reference()
                         fhir_section.entry.append(fhir_section_entry_reference)
                         fhir_section_entry_reference.reference = string(value=('urn:uuid:' + fhir_observation_id.value))
-                        fhir_section_entry_reference.type_ = uri(value='Observation')
+                        fhir_section_entry_reference.type_ = constant(uri, 'Observation')
                         CdaOrganizerToFhirObservationWithSpecimen(cda, cda_laboratory_battery_organizer, fhir_observation, fhir_patient, fhir_practitionerRole, fhir_specimen)
                         for cda_component in cda_laboratory_battery_organizer.component or []:
-                            if fhirpath.single([v1 for v1 in fhirpath_utils.get(cda_component,'observation','templateId') if v1.root == '1.3.6.1.4.1.19376.1.3.1.6']):
+                            if document_index().has_template(cda_component.observation, '1.3.6.1.4.1.19376.1.3.1.6'):
                                 cda_laboratory_observation = cda_component.observation
                                 if cda_laboratory_observation:
                                     fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-                                    fhir_bundle.entry.append(fhir_bundle_entry)
                                     fhir_laboratory_observation = malac.models.fhir.r4.Observation()
-                                    fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(Observation=fhir_laboratory_observation)
-                                    fhir_laboratory_observation_id = string(value=str(uuid.uuid4()))
+                                    fhir_bundle_entry.resource = make_resource_container('Observation', fhir_laboratory_observation)
+                                    fhir_laboratory_observation_id = string(value=resource_id('CdaLaboratorySpecialtySectionToFhirSectionWithSpecimen/Observation', cda_laboratory_observation))
                                     fhir_laboratory_observation.id = fhir_laboratory_observation_id
                                     fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_laboratory_observation_id.value))
+                                    add_bundle_entry(fhir_bundle, fhir_bundle_entry)
                                     fhir_observation_hasMember_reference = malac.models.fhir.r4.Reference()
                                     fhir_observation.hasMember.append(fhir_observation_hasMember_reference)
                                     fhir_observation_hasMember_reference.reference = string(value=('urn:uuid:' + fhir_laboratory_observation_id.value))
-                                    fhir_observation_hasMember_reference.type_ = uri(value='Observation')
+                                    fhir_observation_hasMember_reference.type_ = constant(uri, 'Observation')
                                     CdaLaboratoryObservationToFhirObservationWithSpecimen(cda, cda_laboratory_observation, fhir_laboratory_observation, fhir_practitionerRole, fhir_patient, fhir_bundle, fhir_specimen)
 
 def CdaLaboratorySpecialtySectionToFhirSection(cda, cda_section, fhir_section, fhir_practitionerRole, fhir_patient, fhir_diagnosticReport, fhir_bundle):
@@ -1008,64 +1011,64 @@ def CdaLaboratorySpecialtySectionToFhirSection(cda, cda_section, fhir_section, f
         cda_act = cda_section_entry.act
         if cda_act:
             for cda_entryRelationship in cda_act.entryRelationship or []:
-                if fhirpath.single([v1 for v1 in fhirpath_utils.get(cda_entryRelationship,'procedure','templateId') if v1.root == '1.3.6.1.4.1.19376.1.3.1.2']):
+                if document_index().has_template(cda_entryRelationship.procedure, '1.3.6.1.4.1.19376.1.3.1.2'):
                     cda_procedure = cda_entryRelationship.procedure
                     if cda_procedure:
                         fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-                        fhir_bundle.entry.append(fhir_bundle_entry)
                         fhir_specimen = malac.models.fhir.r4.Specimen()
-                        fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(Specimen=fhir_specimen)
-                        fhir_specimen_id = string(value=str(uuid.uuid4()))
+                        fhir_bundle_entry.resource = make_resource_container('Specimen', fhir_specimen)
+                        fhir_specimen_id = string(value=resource_id('CdaLaboratorySpecialtySectionToFhirSection/Specimen', cda_procedure))
                         fhir_specimen.id = fhir_specimen_id
                         fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_specimen_id.value))
+                        add_bundle_entry(fhir_bundle, fhir_bundle_entry)
                         CdaSpecimenCollectionToFhirSpecimen(cda_procedure, fhir_specimen, fhir_patient, fhir_diagnosticReport, fhir_bundle)
             for cda_entryRelationship in cda_act.entryRelationship or []:
-                if fhirpath.single([v1 for v1 in fhirpath_utils.get(cda_entryRelationship,'organizer','templateId') if v1.root == '1.3.6.1.4.1.19376.1.3.1.4']):
+                if document_index().has_template(cda_entryRelationship.organizer, '1.3.6.1.4.1.19376.1.3.1.4'):
                     cda_laboratory_battery_organizer = cda_entryRelationship.organizer
                     if cda_laboratory_battery_organizer:
                         fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-                        fhir_bundle.entry.append(fhir_bundle_entry)
                         fhir_observation = malac.models.fhir.r4.Observation()
-                        fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(Observation=fhir_observation)
-                        fhir_observation_id = string(value=str(uuid.uuid4()))
+                        fhir_bundle_entry.resource = make_resource_container('Observation', fhir_observation)
+                        fhir_observation_id = string(value=resource_id('CdaLaboratorySpecialtySectionToFhirSection/Observation', cda_laboratory_battery_organizer))
                         fhir_observation.id = fhir_observation_id
                         fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_observation_id.value))
+                        add_bundle_entry(fhir_bundle, fhir_bundle_entry)
                         fhir_section_entry_reference = malac.models.fhir.r4.Reference()
                         fhir_section.entry.append(fhir_section_entry_reference)
                         fhir_section_entry_reference.reference = string(value=('urn:uuid:' + fhir_observation_id.value))
-                        fhir_section_entry_reference.type_ = uri(value='Observation')
+                        fhir_section_entry_reference.type_ = constant(uri, 'Observation')
                         CdaOrganizerToFhirObservation(cda, cda_laboratory_battery_organizer, fhir_observation, fhir_patient, fhir_practitionerRole)
                         for cda_component in cda_laboratory_battery_organizer.component or []:
-                            if fhirpath.single([v1 for v1 in fhirpath_utils.get(cda_component,'observation','templateId') if v1.root == '1.3.6.1.4.1.19376.1.3.1.6']):
+                            if document_index().has_template(cda_component.observation, '1.3.6.1.4.1.19376.1.3.1.6'):
                                 cda_laboratory_observation = cda_component.observation
                                 if cda_laboratory_observation:
                                     fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-                                    fhir_bundle.entry.append(fhir_bundle_entry)
                                     fhir_laboratory_observation = malac.models.fhir.r4.Observation()
-                                    fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(Observation=fhir_laboratory_observation)
-                                    fhir_laboratory_observation_id = string(value=str(uuid.uuid4()))
+                                    fhir_bundle_entry.resource = make_resource_container('Observation', fhir_laboratory_observation)
+                                    fhir_laboratory_observation_id = string(value=resource_id('CdaLaboratorySpecialtySectionToFhirSection/Observation', cda_laboratory_observation))
                                     fhir_laboratory_observation.id = fhir_laboratory_observation_id
                                     fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_laboratory_observation_id.value))
+                                    add_bundle_entry(fhir_bundle, fhir_bundle_entry)
                                     fhir_observation_hasMember_reference = malac.models.fhir.r4.Reference()
                                     fhir_observation.hasMember.append(fhir_observation_hasMember_reference)
                                     fhir_observation_hasMember_reference.reference = string(value=('urn:uuid:' + fhir_laboratory_observation_id.value))
-                                    fhir_observation_hasMember_reference.type_ = uri(value='Observation')
+                                    fhir_observation_hasMember_reference.type_ = constant(uri, 'Observation')
                                     CdaLaboratoryObservationToFhirObservation(cda, cda_laboratory_observation, fhir_laboratory_observation, fhir_practitionerRole, fhir_patient, fhir_bundle)
 
 def CdaBeilagenSectionToFhirDiagnosticReportMedia(cda_section, fhir_diagnosticReport, fhir_bundle, fhir_patient):
     fhir_bundle_entry_01 = malac.models.fhir.r4.Bundle_Entry()
-    fhir_bundle.entry.append(fhir_bundle_entry_01)
     fhir_media = malac.models.fhir.r4.Media()
-    fhir_bundle_entry_01.resource = malac.models.fhir.r4.ResourceContainer(Media=fhir_media)
-    fhir_media_id = string(value=str(uuid.uuid4()))
+    fhir_bundle_entry_01.resource = make_resource_container('Media', fhir_media)
+    fhir_media_id = string(value=resource_id('CdaBeilagenSectionToFhirDiagnosticReportMedia/Media'))
     fhir_media.id = fhir_media_id
     fhir_bundle_entry_01.fullUrl = uri(value=('urn:uuid:' + fhir_media_id.value))
+    add_bundle_entry(fhir_bundle, fhir_bundle_entry_01)
     fhir_diagnosticReport_media = malac.models.fhir.r4.DiagnosticReport_Media()
     fhir_diagnosticReport.media.append(fhir_diagnosticReport_media)
     fhir_diagnosticReport_media_link_reference = malac.models.fhir.r4.Reference()
     fhir_diagnosticReport_media.link = fhir_diagnosticReport_media_link_reference
     fhir_diagnosticReport_media_link_reference.reference = string(value=('urn:uuid:' + fhir_media_id.value))
-    fhir_diagnosticReport_media_link_reference.type_ = uri(value='Media')
+    fhir_diagnosticReport_media_link_reference.type_ = constant(uri, 'Media')
     for cda_section_entry in cda_section.entry or []:
         cda_observationMedia = cda_section_entry.observationMedia
         if cda_observationMedia:
@@ -1074,7 +1077,7 @@ def CdaBeilagenSectionToFhirDiagnosticReportMedia(cda_section, fhir_diagnosticRe
                 fhir_media_identifier = malac.models.fhir.r4.Identifier()
                 fhir_media.identifier.append(fhir_media_identifier)
                 fhir_media_identifier.value = string(value=cda_observationMedia_ID)
-            fhir_media.status = string(value='completed')
+            fhir_media.status = constant(string, 'completed')
             cda_observationMedia_value = cda_observationMedia.value
             if cda_observationMedia_value:
                 if fhir_media.content is None:
@@ -1083,39 +1086,30 @@ def CdaBeilagenSectionToFhirDiagnosticReportMedia(cda_section, fhir_diagnosticRe
                 cda_mediaType = cda_observationMedia_value.mediaType
                 if cda_mediaType:
                     fhir_media_content.contentType = string(value=cda_mediaType)
-                fhir_media_content.data = base64Binary(value=fhirpath.single(fhirpath_utils.get(cda_observationMedia_value,'valueOf_',strip=True)))
+                fhir_media_content.data = base64Binary(value=(str(cda_observationMedia_value.valueOf_).strip() or None if cda_observationMedia_value.valueOf_ else None))
 
 def CdaOrganizerToFhirObservation(cda, cda_organizer, fhir_observation, fhir_patient, fhir_practitionerRole):
     if fhir_observation.meta is None:
         fhir_observation.meta = malac.models.fhir.r4.Meta()
     fhir_observation_meta = fhir_observation.meta
-    fhir_observation_meta.profile.append(string(value='http://fhir.ehdsi.eu/laboratory/StructureDefinition/Observation-resultslab-lab-myhealtheu'))
+    fhir_observation_meta.profile.append(constant(string, 'http://fhir.ehdsi.eu/laboratory/StructureDefinition/Observation-resultslab-lab-myhealtheu'))
     fhir_category = malac.models.fhir.r4.CodeableConcept()
     fhir_observation.category.append(fhir_category)
-    fhir_category_coding = malac.models.fhir.r4.Coding()
-    fhir_category.coding.append(fhir_category_coding)
-    fhir_category_coding.system = uri(value='http://terminology.hl7.org/CodeSystem/observation-category')
-    fhir_category_coding.code = string(value='laboratory')
+    fhir_category.coding.append(constant_coding('http://terminology.hl7.org/CodeSystem/observation-category', 'laboratory'))
     fhir_observation_subject_reference = malac.models.fhir.r4.Reference()
     fhir_observation.subject = fhir_observation_subject_reference
-    if fhir_patient.id is None:
-        fhir_patient.id = malac.models.fhir.r4.string()
-    fhir_patient_id = fhir_patient.id
-    fhir_observation_subject_reference.reference = string(value=('urn:uuid:' + fhir_patient_id.value))
+    fhir_observation_subject_reference.reference = string(value=document_context().reference(fhir_patient))
     if cda_organizer.code:
         fhir_observation.category.append(malac.models.fhir.r4.CodeableConcept())
         CDCodeableConcept(cda_organizer.code, fhir_observation.category[-1])
     if cda_organizer.code:
         fhir_observation.code = malac.models.fhir.r4.CodeableConcept()
         CDCodeableConcept(cda_organizer.code, fhir_observation.code)
-    if fhirpath.single(fhirpath_utils.equals([v2 for v1 in [cda_organizer.code] for v2 in fhirpath_utils.get(v1,'codeSystem')], '!=', ['2.16.840.1.113883.6.1'])):
+    if cda_organizer.code is not None and cda_organizer.code.codeSystem and cda_organizer.code.codeSystem != '2.16.840.1.113883.6.1':
         if fhir_observation.code is None:
             fhir_observation.code = malac.models.fhir.r4.CodeableConcept()
         fhir_observation_code = fhir_observation.code
-        fhir_observation_code_coding = malac.models.fhir.r4.Coding()
-        fhir_observation_code.coding.append(fhir_observation_code_coding)
-        fhir_observation_code_coding.system = uri(value='http://terminology.hl7.org/CodeSystem/v3-NullFlavor')
-        fhir_observation_code_coding.code = string(value='OTH')
+        fhir_observation_code.coding.append(constant_coding('http://terminology.hl7.org/CodeSystem/v3-NullFlavor', 'OTH'))
     organizer_statusCode = cda_organizer.statusCode
     if organizer_statusCode:
         cda_code = organizer_statusCode.code
@@ -1145,32 +1139,19 @@ def CdaOrganizerToFhirObservation(cda, cda_organizer, fhir_observation, fhir_pat
         if cda_organizer.performer:
             CdaPerformerToFhirObservationPerformer(cda_organizer_performer, fhir_observation, fhir_bundle)
     if not cda_organizer.performer:
-        if fhirpath_utils.get(next(iter(cda.documentationOf or []), None),'serviceEvent','performer'):
-            if len(cda.documentationOf) > 0:
-                cda_documentationOf = cda.documentationOf[0]
-                cda_documentationOf_serviceEvent = cda_documentationOf.serviceEvent
-                if cda_documentationOf_serviceEvent:
-                    for cda_documentationOf_serviceEvent_performer in cda_documentationOf_serviceEvent.performer or []:
-                        if cda_documentationOf_serviceEvent_performer.time:
-                            fhir_observation.issued = malac.models.fhir.r4.instant()
-                            transform_default(cda_documentationOf_serviceEvent_performer.time, fhir_observation.issued)
+        for issued in document_context().organizer_issued:
+            fhir_observation.issued = malac.models.fhir.r4.instant(value=issued)
         fhir_observation_performer_reference = malac.models.fhir.r4.Reference()
         fhir_observation.performer.append(fhir_observation_performer_reference)
-        if fhir_practitionerRole.id is None:
-            fhir_practitionerRole.id = malac.models.fhir.r4.string()
-        fhir_practitionerRole_id = fhir_practitionerRole.id
-        fhir_observation_performer_reference.reference = string(value=('urn:uuid:' + fhir_practitionerRole_id.value))
-        fhir_observation_performer_reference.type_ = uri(value='PractitionerRole')
+        fhir_observation_performer_reference.reference = string(value=document_context().reference(fhir_practitionerRole))
+        fhir_observation_performer_reference.type_ = constant(uri, 'PractitionerRole')
 
 def CdaOrganizerToFhirObservationWithSpecimen(cda, cda_organizer, fhir_observation, fhir_patient, fhir_practitionerRole, fhir_specimen):
     CdaOrganizerToFhirObservation(cda, cda_organizer, fhir_observation, fhir_patient, fhir_practitionerRole)
     fhir_observation_specimen_reference = malac.models.fhir.r4.Reference()
     fhir_observation.specimen = fhir_observation_specimen_reference
-    if fhir_specimen.id is None:
-        fhir_specimen.id = malac.models.fhir.r4.string()
-    fhir_specimen_id = fhir_specimen.id
-    fhir_observation_specimen_reference.reference = string(value=('urn:uuid:' + fhir_specimen_id.value))
-    fhir_observation_specimen_reference.type_ = uri(value='Specimen')
+    fhir_observation_specimen_reference.reference = string(value=document_context().reference(fhir_specimen))
+    fhir_observation_specimen_reference.type_ = constant(uri, 'Specimen')
 
 def CdaObservationToFhirObservation(cda_observation, fhir_observation):
     for id_ in cda_observation.id or []:
@@ -1181,54 +1162,46 @@ def CdaLaboratoryObservationToFhirObservation(cda, cda_laboratory_observation, f
     if fhir_observation.meta is None:
         fhir_observation.meta = malac.models.fhir.r4.Meta()
     fhir_observation_meta = fhir_observation.meta
-    fhir_observation_meta.profile.append(string(value='http://fhir.ehdsi.eu/laboratory/StructureDefinition/Observation-resultslab-lab-myhealtheu'))
+    fhir_observation_meta.profile.append(constant(string, 'http://fhir.ehdsi.eu/laboratory/StructureDefinition/Observation-resultslab-lab-myhealtheu'))
     for id_ in cda_laboratory_observation.id or []:
         fhir_observation.identifier.append(malac.models.fhir.r4.Identifier())
         II(id_, fhir_observation.identifier[-1])
     fhir_category = malac.models.fhir.r4.CodeableConcept()
     fhir_observation.category.append(fhir_category)
-    fhir_category_coding = malac.models.fhir.r4.Coding()
-    fhir_category.coding.append(fhir_category_coding)
-    fhir_category_coding.system = uri(value='http://terminology.hl7.org/CodeSystem/observation-category')
-    fhir_category_coding.code = string(value='laboratory')
+    fhir_category.coding.append(constant_coding('http://terminology.hl7.org/CodeSystem/observation-category', 'laboratory'))
     fhir_observation_subject_reference = malac.models.fhir.r4.Reference()
     fhir_observation.subject = fhir_observation_subject_reference
-    if fhir_patient.id is None:
-        fhir_patient.id = malac.models.fhir.r4.string()
-    fhir_patient_id = fhir_patient.id
-    fhir_observation_subject_reference.reference = string(value=('urn:uuid:' + fhir_patient_id.value))
+    fhir_observation_subject_reference.reference = string(value=document_context().reference(fhir_patient))
     if cda_laboratory_observation.code:
         fhir_observation.code = malac.models.fhir.r4.CodeableConcept()
         CDCodeableConcept(cda_laboratory_observation.code, fhir_observation.code)
-    if fhirpath.single(fhirpath_utils.bool_or(fhirpath_utils.equals([v2 for v1 in [cda_laboratory_observation.code] for v2 in fhirpath_utils.get(v1,'codeSystem')], '!=', ['2.16.840.1.113883.6.1']), [bool([v4 for v3 in [cda_laboratory_observation.code] for v4 in fhirpath_utils.get(v3,'nullFlavor')])])):
+    if ((cda_laboratory_observation.code is not None and cda_laboratory_observation.code.codeSystem and cda_laboratory_observation.code.codeSystem != '2.16.840.1.113883.6.1') or (cda_laboratory_observation.code is not None and cda_laboratory_observation.code.nullFlavor)):
         if fhir_observation.code is None:
             fhir_observation.code = malac.models.fhir.r4.CodeableConcept()
         fhir_observation_code = fhir_observation.code
-        fhir_observation_code_coding = malac.models.fhir.r4.Coding()
-        fhir_observation_code.coding.append(fhir_observation_code_coding)
-        fhir_observation_code_coding.system = uri(value='http://terminology.hl7.org/CodeSystem/v3-NullFlavor')
-        fhir_observation_code_coding.code = string(value='OTH')
-    if not [v1 for v1 in fhirpath_utils.get(cda_laboratory_observation,'value') if fhirpath_utils.bool_and(fhirpath_utils.equals(fhirpath_utils.get(v1,'code'), '==', ['255599008']), fhirpath_utils.equals(fhirpath_utils.get(v1,'codeSystem'), '==', ['2.16.840.1.113883.6.96'])) == [True]]:
+        fhir_observation_code.coding.append(constant_coding('http://terminology.hl7.org/CodeSystem/v3-NullFlavor', 'OTH'))
+    cda_laboratory_observation_value_255599008 = has_value_code(cda_laboratory_observation.value, '255599008', '2.16.840.1.113883.6.96')
+    if not cda_laboratory_observation_value_255599008:
         observation_statusCode = cda_laboratory_observation.statusCode
         if observation_statusCode:
             cda_code = observation_statusCode.code
             if cda_code:
                 fhir_observation.status = string(value=translate_single('act-status-2-observation-status', (cda_code if isinstance(cda_code, str) else cda_code.value), 'code'))
-    if [v1 for v1 in fhirpath_utils.get(cda_laboratory_observation,'value') if fhirpath_utils.bool_and(fhirpath_utils.equals(fhirpath_utils.get(v1,'code'), '==', ['255599008']), fhirpath_utils.equals(fhirpath_utils.get(v1,'codeSystem'), '==', ['2.16.840.1.113883.6.96'])) == [True]]:
-        fhir_observation.status = string(value='preliminary')
+    if cda_laboratory_observation_value_255599008:
+        fhir_observation.status = constant(string, 'preliminary')
         if fhir_observation.dataAbsentReason is None:
             fhir_observation.dataAbsentReason = malac.models.fhir.r4.CodeableConcept()
         fhir_observation_dataAbsentReason = fhir_observation.dataAbsentReason
         fhir_observation_dataAbsentReason_coding = malac.models.fhir.r4.Coding()
         fhir_observation_dataAbsentReason.coding.append(fhir_observation_dataAbsentReason_coding)
-        fhir_observation_dataAbsentReason_coding.code = string(value='temp-unknown')
-        fhir_observation_dataAbsentReason_coding.system = uri(value='http://terminology.hl7.org/CodeSystem/data-absent-reason')
+        fhir_observation_dataAbsentReason_coding.code = constant(string, 'temp-unknown')
+        fhir_observation_dataAbsentReason_coding.system = constant(uri, 'http://terminology.hl7.org/CodeSystem/data-absent-reason')
     cda_effectiveTime = cda_laboratory_observation.effectiveTime
     if cda_effectiveTime:
         fhir_observation_effective = malac.models.fhir.r4.dateTime()
         fhir_observation.effectiveDateTime = fhir_observation_effective
         TSDateTime(cda_effectiveTime, fhir_observation_effective)
-    if fhirpath.single([v1 for v1 in fhirpath_utils.get(cda_laboratory_observation,'effectiveTime') if v1.nullFlavor == 'UNK']):
+    if cda_effectiveTime and cda_effectiveTime.nullFlavor == 'UNK':
         fhir_observation_effective = malac.models.fhir.r4.dateTime()
         fhir_observation.effectiveDateTime = fhir_observation_effective
         fhir_observation_effective_extenstion = malac.models.fhir.r4.Extension()
@@ -1237,58 +1210,46 @@ def CdaLaboratoryObservationToFhirObservation(cda, cda_laboratory_observation, f
         fhir_observation_effective_extenstion_code = malac.models.fhir.r4.code()
         fhir_observation_effective_extenstion.valueCode = fhir_observation_effective_extenstion_code
         fhir_observation_effective_extenstion_code.value = 'unknown'
-    for cda_observation_value in cda_laboratory_observation.value or []:
-        if type(cda_observation_value) is malac.models.cda.at_ext.PQ:
+    cda_laboratory_observation_values = values_by_type(cda_laboratory_observation.value)
+    for cda_observation_value in cda_laboratory_observation_values.get(malac.models.cda.at_ext.PQ, ()):
+        fhir_observation_value = malac.models.fhir.r4.Quantity()
+        fhir_observation.valueQuantity = fhir_observation_value
+        PQQuantity(cda_observation_value, fhir_observation_value)
+    for cda_observation_value in cda_laboratory_observation_values.get(malac.models.cda.at_ext.IVL_PQ, ()):
+        if cda_observation_value.value is not None:
             fhir_observation_value = malac.models.fhir.r4.Quantity()
             fhir_observation.valueQuantity = fhir_observation_value
             PQQuantity(cda_observation_value, fhir_observation_value)
-    for cda_observation_value in cda_laboratory_observation.value or []:
-        if type(cda_observation_value) is malac.models.cda.at_ext.IVL_PQ:
-            if cda_observation_value.value is not None:
-                fhir_observation_value = malac.models.fhir.r4.Quantity()
-                fhir_observation.valueQuantity = fhir_observation_value
-                PQQuantity(cda_observation_value, fhir_observation_value)
-            if cda_observation_value.value is None:
-                fhir_observation_value = malac.models.fhir.r4.Range()
-                fhir_observation.valueRange = fhir_observation_value
-                IVLPQRange(cda_observation_value, fhir_observation_value)
-    if not [v1 for v1 in fhirpath_utils.get(cda_laboratory_observation,'value') if fhirpath_utils.bool_and(fhirpath_utils.equals(fhirpath_utils.get(v1,'code'), '==', ['255599008']), fhirpath_utils.equals(fhirpath_utils.get(v1,'codeSystem'), '==', ['2.16.840.1.113883.6.96'])) == [True]]:
-        for cda_observation_value in cda_laboratory_observation.value or []:
-            if type(cda_observation_value) is malac.models.cda.at_ext.CD:
-                fhir_observation_value = malac.models.fhir.r4.CodeableConcept()
-                fhir_observation.valueCodeableConcept = fhir_observation_value
-                CDCodeableConcept(cda_observation_value, fhir_observation_value)
-    for cda_observation_value in cda_laboratory_observation.value or []:
-        if type(cda_observation_value) is malac.models.cda.at_ext.ST:
-            fhir_observation_value = malac.models.fhir.r4.string()
-            fhir_observation.valueString = fhir_observation_value
-            STstring(cda_observation_value, fhir_observation_value)
+        if cda_observation_value.value is None:
+            fhir_observation_value = malac.models.fhir.r4.Range()
+            fhir_observation.valueRange = fhir_observation_value
+            IVLPQRange(cda_observation_value, fhir_observation_value)
+    if not cda_laboratory_observation_value_255599008:
+        for cda_observation_value in cda_laboratory_observation_values.get(malac.models.cda.at_ext.CD, ()):
+            fhir_observation_value = malac.models.fhir.r4.CodeableConcept()
+            fhir_observation.valueCodeableConcept = fhir_observation_value
+            CDCodeableConcept(cda_observation_value, fhir_observation_value)
+    for cda_observation_value in cda_laboratory_observation_values.get(malac.models.cda.at_ext.ST, ()):
+        fhir_observation_value = malac.models.fhir.r4.string()
+        fhir_observation.valueString = fhir_observation_value
+        STstring(cda_observation_value, fhir_observation_value)
     for cda_laboratory_observation_interpretationCode in cda_laboratory_observation.interpretationCode or []:
         fhir_observation_interpretation = malac.models.fhir.r4.CodeableConcept()
         fhir_observation.interpretation.append(fhir_observation_interpretation)
         fhir_observation_interpretation_coding_01 = malac.models.fhir.r4.Coding()
         fhir_observation_interpretation.coding.append(fhir_observation_interpretation_coding_01)
-        fhir_observation_interpretation_coding_02 = malac.models.fhir.r4.Coding()
-        fhir_observation_interpretation.coding.append(fhir_observation_interpretation_coding_02)
-        fhir_observation_interpretation_coding_02.system = uri(value='http://terminology.hl7.org/CodeSystem/v3-NullFlavor')
-        fhir_observation_interpretation_coding_02.code = string(value='OTH')
+        fhir_observation_interpretation.coding.append(constant_coding('http://terminology.hl7.org/CodeSystem/v3-NullFlavor', 'OTH'))
         CECoding(cda_laboratory_observation_interpretationCode, fhir_observation_interpretation_coding_01)
     for cda_laboratory_observation_performer in cda_laboratory_observation.performer:
         if cda_laboratory_observation.performer:
             CdaPerformerToFhirObservationPerformer(cda_laboratory_observation_performer, fhir_observation, fhir_bundle)
     if not cda_laboratory_observation.performer:
-        for cda_legalAuthenticator in cda.legalAuthenticator or []:
-            if cda_legalAuthenticator.time:
-                if cda_legalAuthenticator.time.nullFlavor is None:
-                    fhir_observation.issued = malac.models.fhir.r4.instant()
-                    TSInstant(cda_legalAuthenticator.time, fhir_observation.issued)
+        for issued in document_context().observation_issued:
+            fhir_observation.issued = malac.models.fhir.r4.instant(value=issued)
         fhir_observation_performer_reference = malac.models.fhir.r4.Reference()
         fhir_observation.performer.append(fhir_observation_performer_reference)
-        if fhir_practitionerRole.id is None:
-            fhir_practitionerRole.id = malac.models.fhir.r4.string()
-        fhir_practitionerRole_id = fhir_practitionerRole.id
-        fhir_observation_performer_reference.reference = string(value=('urn:uuid:' + fhir_practitionerRole_id.value))
-        fhir_observation_performer_reference.type_ = uri(value='PractitionerRole')
+        fhir_observation_performer_reference.reference = string(value=document_context().reference(fhir_practitionerRole))
+        fhir_observation_performer_reference.type_ = constant(uri, 'PractitionerRole')
     for cda_observation_referenceRange in cda_laboratory_observation.referenceRange or []:
         cda_referenceRange_observationRange = cda_observation_referenceRange.observationRange
         if cda_referenceRange_observationRange:
@@ -1305,107 +1266,81 @@ def CdaLaboratoryObservationToFhirObservation(cda, cda_laboratory_observation, f
             if fhir_observation_referenceRange.type_ is None:
                 fhir_observation_referenceRange.type_ = malac.models.fhir.r4.CodeableConcept()
             fhir_referenceRange_type = fhir_observation_referenceRange.type_
-            fhir_type_coding = malac.models.fhir.r4.Coding()
-            fhir_referenceRange_type.coding.append(fhir_type_coding)
-            fhir_type_coding.system = uri(value='http://terminology.hl7.org/CodeSystem/referencerange-meaning')
-            fhir_type_coding.code = string(value='normal')
+            fhir_referenceRange_type.coding.append(constant_coding('http://terminology.hl7.org/CodeSystem/referencerange-meaning', 'normal'))
 
 def CdaLaboratoryObservationToFhirObservationWithSpecimen(cda, cda_laboratory_observation, fhir_observation, fhir_practitionerRole, fhir_patient, fhir_bundle, fhir_specimen):
     CdaLaboratoryObservationToFhirObservation(cda, cda_laboratory_observation, fhir_observation, fhir_practitionerRole, fhir_patient, fhir_bundle)
     fhir_observation_specimen_reference = malac.models.fhir.r4.Reference()
     fhir_observation.specimen = fhir_observation_specimen_reference
-    if fhir_specimen.id is None:
-        fhir_specimen.id = malac.models.fhir.r4.string()
-    fhir_specimen_id = fhir_specimen.id
-    fhir_observation_specimen_reference.reference = string(value=('urn:uuid:' + fhir_specimen_id.value))
-    fhir_observation_specimen_reference.type_ = uri(value='Specimen')
+    fhir_observation_specimen_reference.reference = string(value=document_context().reference(fhir_specimen))
+    fhir_observation_specimen_reference.type_ = constant(uri, 'Specimen')
 
 def CdaAssignedEntityToFhirPractitionerRole(cda_assignedEntity, fhir_practitionerRole, fhir_bundle):
-    fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-    fhir_bundle.entry.append(fhir_bundle_entry)
-    fhir_practitioner = malac.models.fhir.r4.Practitioner()
-    fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(Practitioner=fhir_practitioner)
-    fhir_practitioner_id = string(value=str(uuid.uuid4()))
-    fhir_practitioner.id = fhir_practitioner_id
-    fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_practitioner_id.value))
+    fhir_practitioner, fhir_practitioner_new = document_context().bundle_resource(fhir_bundle, 'Practitioner', entity_key(cda_assignedEntity))
     fhir_practitionerRole_practitioner_reference = malac.models.fhir.r4.Reference()
     fhir_practitionerRole.practitioner = fhir_practitionerRole_practitioner_reference
-    fhir_practitionerRole_practitioner_reference.reference = string(value=('urn:uuid:' + fhir_practitioner_id.value))
-    fhir_practitionerRole_practitioner_reference.type_ = uri(value='Practitioner')
-    for id_ in cda_assignedEntity.id or []:
-        if id_.nullFlavor is None:
-            fhir_practitioner.identifier.append(malac.models.fhir.r4.Identifier())
-            II(id_, fhir_practitioner.identifier[-1])
-    for addr in cda_assignedEntity.addr or []:
-        if addr.nullFlavor is None:
-            fhir_practitioner.address.append(malac.models.fhir.r4.Address())
-            CdaAdressCompilationToFhirAustrianAddress(addr, fhir_practitioner.address[-1])
-    for telecom in cda_assignedEntity.telecom or []:
-        if telecom.nullFlavor is None:
-            fhir_practitioner.telecom.append(malac.models.fhir.r4.ContactPoint())
-            TELContactPoint(telecom, fhir_practitioner.telecom[-1])
-    cda_assignedPerson = cda_assignedEntity.assignedPerson
-    if cda_assignedPerson:
-        for name in cda_assignedPerson.name or []:
-            fhir_practitioner.name.append(malac.models.fhir.r4.HumanName())
-            CdaPersonNameCompilationToFhirHumanName(name, fhir_practitioner.name[-1])
+    fhir_practitionerRole_practitioner_reference.reference = string(value=document_context().reference(fhir_practitioner))
+    fhir_practitionerRole_practitioner_reference.type_ = constant(uri, 'Practitioner')
+    if fhir_practitioner_new:
+        for id_ in cda_assignedEntity.id or []:
+            if id_.nullFlavor is None:
+                fhir_practitioner.identifier.append(malac.models.fhir.r4.Identifier())
+                II(id_, fhir_practitioner.identifier[-1])
+        for addr in cda_assignedEntity.addr or []:
+            if addr.nullFlavor is None:
+                fhir_practitioner.address.append(malac.models.fhir.r4.Address())
+                CdaAdressCompilationToFhirAustrianAddress(addr, fhir_practitioner.address[-1])
+        for telecom in cda_assignedEntity.telecom or []:
+            if telecom.nullFlavor is None:
+                fhir_practitioner.telecom.append(malac.models.fhir.r4.ContactPoint())
+                TELContactPoint(telecom, fhir_practitioner.telecom[-1])
+        cda_assignedPerson = cda_assignedEntity.assignedPerson
+        if cda_assignedPerson:
+            for name in cda_assignedPerson.name or []:
+                fhir_practitioner.name.append(malac.models.fhir.r4.HumanName())
+                CdaPersonNameCompilationToFhirHumanName(name, fhir_practitioner.name[-1])
     cda_representedOrganization = cda_assignedEntity.representedOrganization
     if cda_representedOrganization:
-        fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-        fhir_bundle.entry.append(fhir_bundle_entry)
-        fhir_organization = malac.models.fhir.r4.Organization()
-        fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(Organization=fhir_organization)
-        fhir_organization_id = string(value=str(uuid.uuid4()))
-        fhir_organization.id = fhir_organization_id
-        fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_organization_id.value))
+        fhir_organization, fhir_organization_new = document_context().bundle_resource(fhir_bundle, 'Organization', entity_key(cda_representedOrganization))
         fhir_practitionerRole_organization = malac.models.fhir.r4.Reference()
         fhir_practitionerRole.organization = fhir_practitionerRole_organization
-        fhir_practitionerRole_organization.reference = string(value=('urn:uuid:' + fhir_organization_id.value))
-        fhir_practitionerRole_organization.type_ = uri(value='Organization')
-        CdaOrganizationCompilationToFhirOrganization(cda_representedOrganization, fhir_organization)
+        fhir_practitionerRole_organization.reference = string(value=document_context().reference(fhir_organization))
+        fhir_practitionerRole_organization.type_ = constant(uri, 'Organization')
+        if fhir_organization_new:
+            CdaOrganizationCompilationToFhirOrganization(cda_representedOrganization, fhir_organization)
 
 def CdaAssociatedEntityToFhirPractitionerRole(cda_associatedEntity, fhir_practitionerRole, fhir_bundle):
-    fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-    fhir_bundle.entry.append(fhir_bundle_entry)
-    fhir_practitioner = malac.models.fhir.r4.Practitioner()
-    fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(Practitioner=fhir_practitioner)
-    fhir_practitioner_id = string(value=str(uuid.uuid4()))
-    fhir_practitioner.id = fhir_practitioner_id
-    fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_practitioner_id.value))
+    fhir_practitioner, fhir_practitioner_new = document_context().bundle_resource(fhir_bundle, 'Practitioner', entity_key(cda_associatedEntity))
     fhir_practitionerRole_practitioner_reference = malac.models.fhir.r4.Reference()
     fhir_practitionerRole.practitioner = fhir_practitionerRole_practitioner_reference
-    fhir_practitionerRole_practitioner_reference.reference = string(value=('urn:uuid:' + fhir_practitioner_id.value))
-    fhir_practitionerRole_practitioner_reference.type_ = uri(value='Practitioner')
-    for id_ in cda_associatedEntity.id or []:
-        fhir_practitioner.identifier.append(malac.models.fhir.r4.Identifier())
-        II(id_, fhir_practitioner.identifier[-1])
-    for addr in cda_associatedEntity.addr or []:
-        if addr.nullFlavor is None:
-            fhir_practitioner.address.append(malac.models.fhir.r4.Address())
-            CdaAdressCompilationToFhirAustrianAddress(addr, fhir_practitioner.address[-1])
-    for telecom in cda_associatedEntity.telecom or []:
-        if telecom.nullFlavor is None:
-            fhir_practitioner.telecom.append(malac.models.fhir.r4.ContactPoint())
-            TELContactPoint(telecom, fhir_practitioner.telecom[-1])
-    cda_associatedPerson = cda_associatedEntity.associatedPerson
-    if cda_associatedPerson:
-        for name in cda_associatedPerson.name or []:
-            fhir_practitioner.name.append(malac.models.fhir.r4.HumanName())
-            CdaPersonNameCompilationToFhirHumanName(name, fhir_practitioner.name[-1])
+    fhir_practitionerRole_practitioner_reference.reference = string(value=document_context().reference(fhir_practitioner))
+    fhir_practitionerRole_practitioner_reference.type_ = constant(uri, 'Practitioner')
+    if fhir_practitioner_new:
+        for id_ in cda_associatedEntity.id or []:
+            fhir_practitioner.identifier.append(malac.models.fhir.r4.Identifier())
+            II(id_, fhir_practitioner.identifier[-1])
+        for addr in cda_associatedEntity.addr or []:
+            if addr.nullFlavor is None:
+                fhir_practitioner.address.append(malac.models.fhir.r4.Address())
+                CdaAdressCompilationToFhirAustrianAddress(addr, fhir_practitioner.address[-1])
+        for telecom in cda_associatedEntity.telecom or []:
+            if telecom.nullFlavor is None:
+                fhir_practitioner.telecom.append(malac.models.fhir.r4.ContactPoint())
+                TELContactPoint(telecom, fhir_practitioner.telecom[-1])
+        cda_associatedPerson = cda_associatedEntity.associatedPerson
+        if cda_associatedPerson:
+            for name in cda_associatedPerson.name or []:
+                fhir_practitioner.name.append(malac.models.fhir.r4.HumanName())
+                CdaPersonNameCompilationToFhirHumanName(name, fhir_practitioner.name[-1])
     cda_scopingOrganization = cda_associatedEntity.scopingOrganization
     if cda_scopingOrganization:
-        fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-        fhir_bundle.entry.append(fhir_bundle_entry)
-        fhir_organization = malac.models.fhir.r4.Organization()
-        fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(Organization=fhir_organization)
-        fhir_organization_id = string(value=str(uuid.uuid4()))
-        fhir_organization.id = fhir_organization_id
-        fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_organization_id.value))
+        fhir_organization, fhir_organization_new = document_context().bundle_resource(fhir_bundle, 'Organization', entity_key(cda_scopingOrganization))
         fhir_practitionerRole_organization = malac.models.fhir.r4.Reference()
         fhir_practitionerRole.organization = fhir_practitionerRole_organization
-        fhir_practitionerRole_organization.reference = string(value=('urn:uuid:' + fhir_organization_id.value))
-        fhir_practitionerRole_organization.type_ = uri(value='Organization')
-        CdaOrganizationCompilationToFhirOrganization(cda_scopingOrganization, fhir_organization)
+        fhir_practitionerRole_organization.reference = string(value=document_context().reference(fhir_organization))
+        fhir_practitionerRole_organization.type_ = constant(uri, 'Organization')
+        if fhir_organization_new:
+            CdaOrganizationCompilationToFhirOrganization(cda_scopingOrganization, fhir_organization)
 
 def CdaPerformerToFhirObservationPerformer(cda_performer, fhir_observation, fhir_bundle):
     if cda_performer.time:
@@ -1413,18 +1348,13 @@ def CdaPerformerToFhirObservationPerformer(cda_performer, fhir_observation, fhir
         transform_default(cda_performer.time, fhir_observation.issued)
     cda_performer_assignedEntity = cda_performer.assignedEntity
     if cda_performer_assignedEntity:
-        fhir_bundle_entry01 = malac.models.fhir.r4.Bundle_Entry()
-        fhir_bundle.entry.append(fhir_bundle_entry01)
-        fhir_practitionerRole = malac.models.fhir.r4.PractitionerRole()
-        fhir_bundle_entry01.resource = malac.models.fhir.r4.ResourceContainer(PractitionerRole=fhir_practitionerRole)
-        fhir_practitionerRole_id = string(value=str(uuid.uuid4()))
-        fhir_practitionerRole.id = fhir_practitionerRole_id
-        fhir_bundle_entry01.fullUrl = uri(value=('urn:uuid:' + fhir_practitionerRole_id.value))
+        fhir_practitionerRole, fhir_practitionerRole_new = document_context().bundle_resource(fhir_bundle, 'PractitionerRole', (entity_key(cda_performer_assignedEntity), entity_key(cda_performer_assignedEntity.representedOrganization)))
         fhir_observation_performer_reference = malac.models.fhir.r4.Reference()
         fhir_observation.performer.append(fhir_observation_performer_reference)
-        fhir_observation_performer_reference.reference = string(value=('urn:uuid:' + fhir_practitionerRole_id.value))
-        fhir_observation_performer_reference.type_ = uri(value='PractitionerRole')
-        CdaAssignedEntityToFhirPractitionerRole(cda_performer_assignedEntity, fhir_practitionerRole, fhir_bundle)
+        fhir_observation_performer_reference.reference = string(value=document_context().reference(fhir_practitionerRole))
+        fhir_observation_performer_reference.type_ = constant(uri, 'PractitionerRole')
+        if fhir_practitionerRole_new:
+            CdaAssignedEntityToFhirPractitionerRole(cda_performer_assignedEntity, fhir_practitionerRole, fhir_bundle)
 
 def CdaSectionToFhirSection(cda_section, fhir_section, fhir_bundle):
     if cda_section.code:
@@ -1433,19 +1363,16 @@ def CdaSectionToFhirSection(cda_section, fhir_section, fhir_bundle):
     if fhir_section.code is None:
         fhir_section.code = malac.models.fhir.r4.CodeableConcept()
     fhir_section_code = fhir_section.code
-    fhir_section_code_coding = malac.models.fhir.r4.Coding()
-    fhir_section_code.coding.append(fhir_section_code_coding)
-    fhir_section_code_coding.system = uri(value='http://terminology.hl7.org/CodeSystem/v3-NullFlavor')
-    fhir_section_code_coding.code = string(value='OTH')
+    fhir_section_code.coding.append(constant_coding('http://terminology.hl7.org/CodeSystem/v3-NullFlavor', 'OTH'))
     cda_section_title = cda_section.title
     if cda_section_title:
-        fhir_section.title = string(value=fhirpath.single(fhirpath_utils.get(cda_section_title,'valueOf_',strip=True)))
+        fhir_section.title = string(value=(str(cda_section_title.valueOf_).strip() or None if cda_section_title.valueOf_ else None))
     cda_section_text = cda_section.text
     if cda_section_text:
         if fhir_section.text is None:
             fhir_section.text = malac.models.fhir.r4.Narrative()
         fhir_section_text = fhir_section.text
-        fhir_section_text.status = string(value='generated')
+        fhir_section_text.status = constant(string, 'generated')
         if cda_section.languageCode is None:
             fhir_section_text.div = utils.strucdoctext2html(malac.models.fhir.r4, cda_section_text)
         if cda_section.languageCode is not None:
@@ -1456,4571 +1383,28 @@ def CdaSectionToFhirSection(cda_section, fhir_section, fhir_bundle):
                     fhir_section_text.div = utils.strucdoctext2html(malac.models.fhir.r4, cda_section_text)
     for cda_section_author in cda_section.author or []:
         fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
-        fhir_bundle.entry.append(fhir_bundle_entry)
         fhir_practitionerRole = malac.models.fhir.r4.PractitionerRole()
-        fhir_bundle_entry.resource = malac.models.fhir.r4.ResourceContainer(PractitionerRole=fhir_practitionerRole)
-        fhir_practitionerRole_id = string(value=str(uuid.uuid4()))
+        fhir_bundle_entry.resource = make_resource_container('PractitionerRole', fhir_practitionerRole)
+        fhir_practitionerRole_id = string(value=resource_id('CdaSectionToFhirSection/PractitionerRole'))
         fhir_practitionerRole.id = fhir_practitionerRole_id
         fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_practitionerRole_id.value))
+        add_bundle_entry(fhir_bundle, fhir_bundle_entry)
         fhir_section_author_reference = malac.models.fhir.r4.Reference()
         fhir_section.author.append(fhir_section_author_reference)
         fhir_section_author_reference.reference = string(value=('urn:uuid:' + fhir_practitionerRole_id.value))
-        fhir_section_author_reference.type_ = uri(value='PractitionerRole')
+        fhir_section_author_reference.type_ = constant(uri, 'PractitionerRole')
         CdaAuthorToFhirPractitionerRole(cda_section_author, fhir_practitionerRole, fhir_bundle)
-
-# output
-# 1..1 result (boolean)
-# 0..1 message with error details for human (string)
-# 0..* match with (list)
-#   0..1 equivalence/relationship
-#   0..1 concept
-#       0..1 system
-#       0..1 version
-#       0..1 code
-#       0..1 display 
-#       0..1 userSelected will always be false, because this is a translation
-#   0..1 source (conceptMap url)
-# TODO implement reverse
-def translate(url=None, conceptMapVersion=None, code=None, system=None, version=None, source=None, coding=None, codeableConcept=None, target=None, targetsystem=None, reverse=None, silent=False)              -> dict [bool, str, list[dict[str, dict[str, str, str, str, bool], str]]]:
-    start = time.time()
-    
-    # start validation and recall of translate in simple from
-    if codeableConcept:
-        if isinstance(codeableConcept, str): 
-            codeableConcept = malac.models.fhir.r4.parseString(codeableConcept, silent)
-        elif isinstance(coding, malac.models.fhir.r4.CodeableConcept):
-            pass
-        else:
-            raise BaseException("The codeableConcept parameter has to be a string or a CodeableConcept Object (called method as library)!")
-        # the first fit will be returned, else the last unfitted value will be returned
-        # TODO check translate params
-        for one_coding in codeableConcept.get_coding:
-            if (ret := translate(url=url, source=source, coding=one_coding, 
-                                 target=target, targetsystem=targetsystem, 
-                                 reverse=reverse, silent=True))[0]:
-                return ret
-        else: return ret
-    elif coding:
-        if isinstance(coding, str): 
-            coding = malac.models.fhir.r4.parseString(coding, silent)
-        elif isinstance(coding, malac.models.fhir.r4.Coding):
-            pass
-        else:
-            raise BaseException("The coding parameter has to be a string or a Coding Object (called method as library)!")
-        # TODO check translate params
-        return translate(url=url,  source=source, coding=one_coding, 
-                         target=target, targetsystem=targetsystem, 
-                         reverse=reverse, silent=True)
-    elif code:
-        if not isinstance(code,str): 
-            raise BaseException("The code parameter has to be a string!")
-    elif target:
-        if not isinstance(code,str): 
-            raise BaseException("The target parameter has to be a string!")
-    elif targetsystem:
-        if not isinstance(code,str): 
-            raise BaseException("The targetsystem parameter has to be a string!")
-    else:
-        raise BaseException("At least codeableConcept, coding, code, target or targetSystem has to be given!")
-    # end validation and recall of translate in simplier from
-
-    # look for any information from the one ore more generated conceptMaps into conceptMap_as_7dimension_dict
-    match = []
-    unmapped = []
-    if url and url not in conceptMap_as_7dimension_dict.keys():
-        print('   #ERROR# ConceptMap with URL "'+ url +'" is not loaded to this compiled conceptMap #ERROR#')
-    else:
-        for url_lvl in conceptMap_as_7dimension_dict:
-            if url_lvl == "%" or not url or url_lvl == str(url or ""):#+str(("/?version=" and conceptMapVersion) or ""):
-                for source_lvl in conceptMap_as_7dimension_dict[url_lvl]:
-                    if source_lvl == "%" or not source or source_lvl == source:
-                        for target_lvl in conceptMap_as_7dimension_dict[url_lvl][source_lvl]:
-                            if target_lvl == "%" or not target or target_lvl == target:
-                                for system_lvl in conceptMap_as_7dimension_dict[url_lvl][source_lvl][target_lvl]:
-                                    if system_lvl == "%" or not system or system_lvl == system:#+str(("/?version=" and version) or ""):
-                                        for targetsystem_lvl in conceptMap_as_7dimension_dict[url_lvl][source_lvl][target_lvl][system_lvl]:
-                                            if targetsystem_lvl == "%" or not targetsystem or targetsystem_lvl == targetsystem:
-                                                for code_lvl in conceptMap_as_7dimension_dict[url_lvl][source_lvl][target_lvl][system_lvl][targetsystem_lvl]:
-                                                    if code_lvl == "|" or code_lvl == "~" or code_lvl == "#":
-                                                        unmapped += conceptMap_as_7dimension_dict[url_lvl][source_lvl][target_lvl][system_lvl][targetsystem_lvl][code_lvl]
-                                                    if code_lvl == "%" or not code or code_lvl == code:
-                                                        match += conceptMap_as_7dimension_dict[url_lvl][source_lvl][target_lvl][system_lvl][targetsystem_lvl][code_lvl]                
-                                                    
-    if not match:
-        for one_unmapped in unmapped:
-            tmp_system = ""
-            tmp_version = ""
-            tmp_code = ""
-            tmp_display = ""
-            # replace all "|" values with to translated code (provided from https://hl7.org/fhir/R4B/conceptmap-definitions.html#ConceptMap.group.unmapped.mode)
-            if one_unmapped["concept"]["code"].startswith("|"):
-                tmp_system = system
-                tmp_version = version
-                tmp_code = one_unmapped["concept"]["code"][1:] + code
-            # replace all "~" values with fixed code (provided from https://hl7.org/fhir/R4B/conceptmap-definitions.html#ConceptMap.group.unmapped.mode)
-            elif one_unmapped["concept"]["code"].startswith("~"):
-                if tmp := one_unmapped["concept"]["system"]: tmp_system = tmp 
-                tmp_code = one_unmapped["concept"]["code"][1:]
-                tmp_display = one_unmapped["concept"]["display"]
-            elif one_unmapped["concept"]["code"].startswith("#"):
-                # TODO detect recursion like conceptMapA -> conceptMapB -> ConceptMapA -> ...
-                return translate(one_unmapped["concept"]["code"][1:], None, code, system, version, source, 
-                                 coding, codeableConcept, target, targetsystem, reverse, silent)
-            # prepare the match.concept results
-            concept = {}
-            if tmp_system: concept["system"] = tmp_system
-            if tmp_version: concept["version"] = tmp_version
-            if tmp_code: concept["code"] = tmp_code
-            if tmp_display: concept["display"] = tmp_display
-
-            # if the concept dict is empty, than skip this broken value and give a warning, that there is a empty group
-            if concept == {}:
-                # TODO do a warning, that it seems like the conceptmap is broken, because there is a empty group
-                continue
-            
-            match.append({"relationship": one_unmapped["relationship"], 
-                          "concept": concept,
-                          "source": one_unmapped["source"]})
-
-    # see if any match is not in R4 "unmatched" or "disjoint" and in R5 "not-related-to"
-    result = False
-    message = ""
-    for one_match in match:
-        if one_match["relationship"] not in ['not-related-to']:
-            result = True 
-            # for printing only, if no url was initially given use the conceptmap
-            if not url:
-                url = one_match["source"]
-
-    if not silent:
-        print('Translation in '+str(round(time.time()-start,3))+' seconds for code "'+(code or "NONE")+'" with ConceptMap "'+url+'"')
-    return {"result": result, "message": message, "match": match}
-
-conceptMap_as_7dimension_dict = {}
-
-
-conceptMap_as_7dimension_dict["cda-clinicaldocument-code-2-fhir-composition-type"] = {
-    "%": {
-        "%": {
-            "http://loinc.org": {
-                "http://loinc.org": {
-                    "11502-2": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://loinc.org",
-                                "code": "26436-6"
-                            },
-                            "source": "cda-clinicaldocument-code-2-fhir-composition-type"
-                        }
-                    ],
-                    "18725-2": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://loinc.org",
-                                "code": "18725-2"
-                            },
-                            "source": "cda-clinicaldocument-code-2-fhir-composition-type"
-                        }
-                    ]
-                }
-            }
-        }
-    }
-}
-
-conceptMap_as_7dimension_dict["cda-sdtc-statuscode-2-fhir-composition-status"] = {
-    "%": {
-        "%": {
-            "http://terminology.hl7.org/CodeSystem/v3-ActStatus": {
-                "http://hl7.org/fhir/composition-status": {
-                    "active": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/composition-status",
-                                "code": "preliminary"
-                            },
-                            "source": "cda-sdtc-statuscode-2-fhir-composition-status"
-                        }
-                    ],
-                    "nullified": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/composition-status",
-                                "code": "entered-in-error"
-                            },
-                            "source": "cda-sdtc-statuscode-2-fhir-composition-status"
-                        }
-                    ]
-                }
-            }
-        }
-    }
-}
-
-conceptMap_as_7dimension_dict["cda-sdtc-statuscode-2-fhir-diagnosticreport-status"] = {
-    "%": {
-        "%": {
-            "http://terminology.hl7.org/CodeSystem/v3-ActStatus": {
-                "http://hl7.org/fhir/diagnostic-report-status": {
-                    "active": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/diagnostic-report-status",
-                                "code": "preliminary"
-                            },
-                            "source": "cda-sdtc-statuscode-2-fhir-diagnosticreport-status"
-                        }
-                    ],
-                    "nullified": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/diagnostic-report-status",
-                                "code": "entered-in-error"
-                            },
-                            "source": "cda-sdtc-statuscode-2-fhir-diagnosticreport-status"
-                        }
-                    ]
-                }
-            }
-        }
-    }
-}
-
-conceptMap_as_7dimension_dict["ELGAAdministrativeGenderFHIRGender"] = {
-    "%": {
-        "%": {
-            "https://termgit.elga.gv.at/ValueSet-elga-administrativegender": {
-                "http://hl7.org/fhir/administrative-gender": {
-                    "F": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/administrative-gender",
-                                "code": "female"
-                            },
-                            "source": "ELGAAdministrativeGenderFHIRGender"
-                        }
-                    ],
-                    "M": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/administrative-gender",
-                                "code": "male"
-                            },
-                            "source": "ELGAAdministrativeGenderFHIRGender"
-                        }
-                    ],
-                    "UN": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/administrative-gender",
-                                "code": "other"
-                            },
-                            "source": "ELGAAdministrativeGenderFHIRGender"
-                        }
-                    ],
-                    "D": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/administrative-gender",
-                                "code": "other"
-                            },
-                            "source": "ELGAAdministrativeGenderFHIRGender"
-                        }
-                    ],
-                    "I": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/administrative-gender",
-                                "code": "other"
-                            },
-                            "source": "ELGAAdministrativeGenderFHIRGender"
-                        }
-                    ],
-                    "O": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/administrative-gender",
-                                "code": "other"
-                            },
-                            "source": "ELGAAdministrativeGenderFHIRGender"
-                        }
-                    ]
-                }
-            }
-        }
-    }
-}
-
-conceptMap_as_7dimension_dict["act-status-2-observation-status"] = {
-    "%": {
-        "%": {
-            "http://terminology.hl7.org/CodeSystem/v3-ActStatus": {
-                "http://hl7.org/fhir/observation-status": {
-                    "completed": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/observation-status",
-                                "code": "final"
-                            },
-                            "source": "act-status-2-observation-status"
-                        }
-                    ],
-                    "active": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/observation-status",
-                                "code": "preliminary"
-                            },
-                            "source": "act-status-2-observation-status"
-                        }
-                    ],
-                    "aborted": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/observation-status",
-                                "code": "cancelled"
-                            },
-                            "source": "act-status-2-observation-status"
-                        }
-                    ]
-                }
-            }
-        }
-    }
-}
-
-conceptMap_as_7dimension_dict["ELGA2FHIRAddressUse"] = {
-    "%": {
-        "%": {
-            "http://terminology.hl7.org/CodeSystem/v3-AddressUse": {
-                "http://hl7.org/fhir/address-use": {
-                    "H": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/address-use",
-                                "code": "home"
-                            },
-                            "source": "ELGA2FHIRAddressUse"
-                        }
-                    ],
-                    "HP": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/address-use",
-                                "code": "home"
-                            },
-                            "source": "ELGA2FHIRAddressUse"
-                        }
-                    ],
-                    "HV": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/address-use",
-                                "code": "home"
-                            },
-                            "source": "ELGA2FHIRAddressUse"
-                        }
-                    ],
-                    "WP": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/address-use",
-                                "code": "work"
-                            },
-                            "source": "ELGA2FHIRAddressUse"
-                        }
-                    ],
-                    "DIR": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/address-use",
-                                "code": "work"
-                            },
-                            "source": "ELGA2FHIRAddressUse"
-                        }
-                    ],
-                    "PUB": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/address-use",
-                                "code": "work"
-                            },
-                            "source": "ELGA2FHIRAddressUse"
-                        }
-                    ],
-                    "TMP": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/address-use",
-                                "code": "temp"
-                            },
-                            "source": "ELGA2FHIRAddressUse"
-                        }
-                    ],
-                    "PHYS": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/address-use",
-                                "code": "home"
-                            },
-                            "source": "ELGA2FHIRAddressUse"
-                        }
-                    ],
-                    "PST": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/address-use",
-                                "code": "home"
-                            },
-                            "source": "ELGA2FHIRAddressUse"
-                        }
-                    ]
-                }
-            }
-        }
-    }
-}
-
-conceptMap_as_7dimension_dict["ELGATelecomAddressUseFHIRContactPointUse"] = {
-    "%": {
-        "%": {
-            "http://terminology.hl7.org/CodeSystem/v3-AddressUse": {
-                "http://hl7.org/fhir/contact-point-use": {
-                    "H": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/contact-point-use",
-                                "code": "home"
-                            },
-                            "source": "ELGATelecomAddressUseFHIRContactPointUse"
-                        }
-                    ],
-                    "HP": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/contact-point-use",
-                                "code": "home"
-                            },
-                            "source": "ELGATelecomAddressUseFHIRContactPointUse"
-                        }
-                    ],
-                    "HV": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/contact-point-use",
-                                "code": "home"
-                            },
-                            "source": "ELGATelecomAddressUseFHIRContactPointUse"
-                        }
-                    ],
-                    "WP": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/contact-point-use",
-                                "code": "work"
-                            },
-                            "source": "ELGATelecomAddressUseFHIRContactPointUse"
-                        }
-                    ],
-                    "AS": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/contact-point-use",
-                                "code": "work"
-                            },
-                            "source": "ELGATelecomAddressUseFHIRContactPointUse"
-                        }
-                    ],
-                    "EC": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/contact-point-use",
-                                "code": "home"
-                            },
-                            "source": "ELGATelecomAddressUseFHIRContactPointUse"
-                        }
-                    ],
-                    "MC": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/contact-point-use",
-                                "code": "mobile"
-                            },
-                            "source": "ELGATelecomAddressUseFHIRContactPointUse"
-                        }
-                    ],
-                    "PG": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/contact-point-use",
-                                "code": "mobile"
-                            },
-                            "source": "ELGATelecomAddressUseFHIRContactPointUse"
-                        }
-                    ],
-                    "TMP": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/contact-point-use",
-                                "code": "temp"
-                            },
-                            "source": "ELGATelecomAddressUseFHIRContactPointUse"
-                        }
-                    ]
-                }
-            }
-        }
-    }
-}
-
-conceptMap_as_7dimension_dict["ELGAEntityNameUseFHIRNameUse"] = {
-    "%": {
-        "%": {
-            "http://terminology.hl7.org/CodeSystem/v3-EntityNameUse": {
-                "http://hl7.org/fhir/name-use": {
-                    "ASGN": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/name-use",
-                                "code": "usual"
-                            },
-                            "source": "ELGAEntityNameUseFHIRNameUse"
-                        }
-                    ],
-                    "C": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/name-use",
-                                "code": "usual"
-                            },
-                            "source": "ELGAEntityNameUseFHIRNameUse"
-                        }
-                    ],
-                    "I": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/name-use",
-                                "code": "anonymous"
-                            },
-                            "source": "ELGAEntityNameUseFHIRNameUse"
-                        }
-                    ],
-                    "L": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/name-use",
-                                "code": "official"
-                            },
-                            "source": "ELGAEntityNameUseFHIRNameUse"
-                        }
-                    ],
-                    "OR": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/name-use",
-                                "code": "official"
-                            },
-                            "source": "ELGAEntityNameUseFHIRNameUse"
-                        }
-                    ],
-                    "P": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/name-use",
-                                "code": "anonymous"
-                            },
-                            "source": "ELGAEntityNameUseFHIRNameUse"
-                        }
-                    ],
-                    "A": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/name-use",
-                                "code": "anonymous"
-                            },
-                            "source": "ELGAEntityNameUseFHIRNameUse"
-                        }
-                    ],
-                    "R": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/name-use",
-                                "code": "anonymous"
-                            },
-                            "source": "ELGAEntityNameUseFHIRNameUse"
-                        }
-                    ],
-                    "SRCH": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/name-use",
-                                "code": "temp"
-                            },
-                            "source": "ELGAEntityNameUseFHIRNameUse"
-                        }
-                    ],
-                    "PHON": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/name-use",
-                                "code": "nickname"
-                            },
-                            "source": "ELGAEntityNameUseFHIRNameUse"
-                        }
-                    ],
-                    "SNDX": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/name-use",
-                                "code": "nickname"
-                            },
-                            "source": "ELGAEntityNameUseFHIRNameUse"
-                        }
-                    ],
-                    "ABC": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/name-use",
-                                "code": "nickname"
-                            },
-                            "source": "ELGAEntityNameUseFHIRNameUse"
-                        }
-                    ],
-                    "IDE": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/name-use",
-                                "code": "nickname"
-                            },
-                            "source": "ELGAEntityNameUseFHIRNameUse"
-                        }
-                    ],
-                    "SYL": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://hl7.org/fhir/name-use",
-                                "code": "nickname"
-                            },
-                            "source": "ELGAEntityNameUseFHIRNameUse"
-                        }
-                    ]
-                }
-            }
-        }
-    }
-}
-
-conceptMap_as_7dimension_dict["ELGAEntityNamePartQualifierFHIRNamePartQualifier"] = {
-    "%": {
-        "%": {
-            "http://terminology.hl7.org/CodeSystem/v3-EntityNamePartQualifier": {
-                "http://terminology.hl7.org/CodeSystem/v3-EntityNamePartQualifierR2": {
-                    "AC": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://terminology.hl7.org/CodeSystem/v3-EntityNamePartQualifierR2",
-                                "code": "AC"
-                            },
-                            "source": "ELGAEntityNamePartQualifierFHIRNamePartQualifier"
-                        }
-                    ],
-                    "AD": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://terminology.hl7.org/CodeSystem/v3-EntityNamePartQualifierR2",
-                                "code": "AD"
-                            },
-                            "source": "ELGAEntityNamePartQualifierFHIRNamePartQualifier"
-                        }
-                    ],
-                    "BR": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://terminology.hl7.org/CodeSystem/v3-EntityNamePartQualifierR2",
-                                "code": "BR"
-                            },
-                            "source": "ELGAEntityNamePartQualifierFHIRNamePartQualifier"
-                        }
-                    ],
-                    "CL": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://terminology.hl7.org/CodeSystem/v3-EntityNamePartQualifierR2",
-                                "code": "CL"
-                            },
-                            "source": "ELGAEntityNamePartQualifierFHIRNamePartQualifier"
-                        }
-                    ],
-                    "IN": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://terminology.hl7.org/CodeSystem/v3-EntityNamePartQualifierR2",
-                                "code": "IN"
-                            },
-                            "source": "ELGAEntityNamePartQualifierFHIRNamePartQualifier"
-                        }
-                    ],
-                    "LS": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://terminology.hl7.org/CodeSystem/v3-EntityNamePartQualifierR2",
-                                "code": "LS"
-                            },
-                            "source": "ELGAEntityNamePartQualifierFHIRNamePartQualifier"
-                        }
-                    ],
-                    "NB": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://terminology.hl7.org/CodeSystem/v3-EntityNamePartQualifierR2",
-                                "code": "NB"
-                            },
-                            "source": "ELGAEntityNamePartQualifierFHIRNamePartQualifier"
-                        }
-                    ],
-                    "PR": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://terminology.hl7.org/CodeSystem/v3-EntityNamePartQualifierR2",
-                                "code": "PR"
-                            },
-                            "source": "ELGAEntityNamePartQualifierFHIRNamePartQualifier"
-                        }
-                    ],
-                    "SP": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://terminology.hl7.org/CodeSystem/v3-EntityNamePartQualifierR2",
-                                "code": "SP"
-                            },
-                            "source": "ELGAEntityNamePartQualifierFHIRNamePartQualifier"
-                        }
-                    ],
-                    "VV": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://terminology.hl7.org/CodeSystem/v3-EntityNamePartQualifierR2",
-                                "code": "VV"
-                            },
-                            "source": "ELGAEntityNamePartQualifierFHIRNamePartQualifier"
-                        }
-                    ]
-                }
-            }
-        }
-    }
-}
-
-conceptMap_as_7dimension_dict["OIDtoURI"] = {
-    "%": {
-        "%": {
-            "http://cda.oid": {
-                "http://fhir.system": {
-                    "2.16.840.1.113883.6.96": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://snomed.info/sct"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.6.1": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://loinc.org"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.6.8": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://unitsofmeasure.org"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.6.3": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://hl7.org/fhir/sid/icd-10"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.6.73": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://www.whocc.no/atc"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.2.16.1.4.9": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "urn:oid:2.16.840.1.113883.2.16.1.4.9"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.83": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v3-ObservationInterpretation"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "0.4.0.127.0.16.1.1.2.1": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ehdsi-edqm-auszug"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.0.3166.1.2.2": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/iso-3166-alpha-2-code"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.0.3166.1.2.3": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/iso-3166-1-alpha-3"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.0.5218": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/geschlechtercodes-iso-iec-5218"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.0.639.2": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/iso-639-2"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.276.0.76.5.547": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/atc-deutsch-wido"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.10.1.4.3.4.3.2": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-medikationmengenartalternativ"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.10.1.4.3.4.3.3": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/medikationrezeptart"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.10.1.4.3.4.3.4": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/medikationartanwendung"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.10.1.4.3.4.3.5": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/medikationdarreichungsform"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.10.1.4.3.4.3.6": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/medikationtherapieart"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.10.1.4.3.4.3.7": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/medikationrezeptpflichtstatus"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.10": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-languagecode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.11": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-maritalstatus"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.13": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-observationinterpretation"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.14": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/langid-at"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.15": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-participationfunctioncode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.150": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-auditeventid"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.151": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-auditeventtype"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.152": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-auditsourcetype"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.153": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-auditroleid"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.154": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-auditparticipantobjecttype"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.155": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-auditparticipantobjecttyperole"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.156": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-auditparticipantobjectidtype"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.158": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/dicom-sopclasses"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.159": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-medikationabgabeart"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.16": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-addressuse"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.160": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-actcode-abginfo"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.161": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-actcode-patinfo"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.162": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-wirkstoffe-ages"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.164": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-sectionspflegesitber"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.165": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-auditeventtype-a-arr"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.166": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-dosisparameter"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.167": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-problemstatuscode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.168": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-diagnosesicherheit"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.169": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-problemkataloge"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.17": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-personalrelationship"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.171": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-kulturerregernachweis"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.172": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-laendercodes"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.173": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-humanlanguage"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.174": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-proficiencylevelcode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.175": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-languageabilitymode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.176": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-seitenlokalisation"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.177": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-allergyorintolerancetype"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.178": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-absentorunknownallergies"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.179": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-absentorunknownproblems"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.18": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-religiousaffiliation"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.180": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-allergyorintoleranceagent"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.181": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-allergyreaction"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.182": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-criticalityobservationvalue"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.183": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-allergystatuscode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.184": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-conditionverificationstatus"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.186": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-nachweisergebnis"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.187": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-probenmaterial"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.188": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-mikroorganismen"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.189": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-problemseverity"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.19": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-roleclass"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.191": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-absentorunknownmedication"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.192": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-absentorunknowndevices"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.193": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-absentorunknownprocedures"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.198": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-conditionstatuscode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.2": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-nullflavor"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.202": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-expecteddeliverydatemethod"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.203": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-pregnanciessummary"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.204": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-currentsmokingstatus"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.205": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-typeofproblem"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.206": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-allergietyp"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.210": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/atcdabbr-noinformationqualifier"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.211": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/atcdabbr-lateralityqualifiercode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.22": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-serviceeventslabor"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.25": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-urlscheme"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.26": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-rollen"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.27": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-entitynameuse"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.29": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-informationrecipienttype"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.3": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-realmcode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.30": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-medikationtherapieart"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.32": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-medikationmengenart"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.33": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-noinformation"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.34": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-vitalparameterarten"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.35": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-problemarten"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.36": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-telecomaddressuse"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.360": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-sectionsserviceevents"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.39": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-dokumentenklassen"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.4": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-administrativegender"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.42": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-medientyp"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.43": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-serviceeventperformer"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.44": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-laborparameter"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.46": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-specimentype"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.47": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-laborstruktur"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.48": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-sectionsentlassungaerztl"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.49": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-sectionsentlassungpflege"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.5": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-actencountercode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.50": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-sectionsradiologie"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.52": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-humanactsite"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.53": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-entlassungsmanagementa"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.55": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-mammogramassessment"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.57": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-serviceeventsentlassbr"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.58": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-significantpathogens"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.59": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-einnahmezeitpunkte"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.6": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-authorspeciality"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.60": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-formatcodezusatz"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.61": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-formatcode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.62": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/appc-modalitaet"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.63": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/appc-lateralitaet"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.64": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/appc-prozeduren"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.65": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/appc-anatomie"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.66": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-medikationartanwendung"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.67": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-medikationmengenartalternativ"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.68": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-medikationrezeptart"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.69": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-medikationfrequenz"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.7": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-confidentiality"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.70": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-medikationdarreichungsform"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.71": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-medikationpharmazeutischeempfehlungstatus"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.72": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-healthcarefacilitytypecode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.74": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-medikationrezeptpflichtstatus"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.75": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-practicesetting"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.86": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/hl7-at-xds-dokumentenklassen"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.9": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-insuredassocentity"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.90": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ems-anti-hcv-immunoassay"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.91": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ems-anti-hcv-immunoblot-assay"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.92": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ems-hcv-core-ag-assay"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.10.93": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ems-hbv-status"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.3.1.10": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/oeaek-berechtigungen"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.3.1.10.20": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/oeaek-fachrichtung"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.3.1.10.30": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/oeaek-additivfach"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.3.1.10.40": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/oeaek-spezialdiplom"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.3.1.10.50": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/oeaek-zertifikate"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.3.1.10.60": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/oeaek-spezialisierung"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.4.16": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/asp-liste"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.4.16.1": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/eimpf-impfstoffe"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.101": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-parameter"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.102": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-methoden"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.103": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-actcode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.104": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/rast-klassen"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.105": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-krankheitsmerkmale"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.106": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-hcv-rna"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.109": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-klinischemanifestation"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.11": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-laborparameterergaenzung"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.110": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-wurdekrankheitimportiert"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.12": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-practicesetting"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.150": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-auditeventid"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.151": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-auditeventtype"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.152": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-auditsourcetype"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.153": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-auditparticipantobjecttype"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.154": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-auditparticipantobjecttyperole"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.155": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-auditparticipantobjectidtype"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.156": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/medikation-ages-wirkstoffe"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.158": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-funktionsrollen"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.159": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-e-health-anwendungen"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.160": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-fachaerzte"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.161": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-kontakttypen"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.162": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-patienten-identifizierungsmethoden"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.165": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-auditeventtypea-arr"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.171": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/icd-10-bmg-2017"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.173": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-specimentype-ergaenzung"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.175": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/icpc2"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.179": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-ergaenzungsliste"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.180": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-allergietyp"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.183": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/eimpf-ergaenzung"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.184": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/icd-10-bmg-2020"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.186": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/eimpf-historischeimpfstoffe"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.187": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-ergaenzungmeldepflichtigekrankheiten"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.190": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-pflegestufen"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.191": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/eimpf-zuordnungsmatrix"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.194": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/exnds-sections"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.195": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/exnds-concepts"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.196": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-betreuung"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.197": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-listeschulen"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.198": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/exnds-metadaten"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.199": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/exnds-formatcodes"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.2": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-gtelvogdarollen"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.200": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/eimpf-schemamatrix"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.202": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/dgc-qr"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.203": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/dgc-antibody-test"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.205": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/dgc-ratnamemanufacturer"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.206": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/lkf-diagnose-typ"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.207": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/lkf-diagnose-art"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.208": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/lkf-diagnose-statauf"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.209": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/bmg-icd-10-2022"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.21": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-serviceeventsentlassbrief"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.211": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/lkf-ergaenzung"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.215": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-lebensmittelallergene"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.216": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/bmg-lkf-2023"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.217": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/austrian-designation-use"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.219": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/medikationpackaging"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.221": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/medikationactiveingredient"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.222": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/bmg-icd-10-2024"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.223": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/bmg-lkf-2024"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.224": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/hl7-at-administrativegender-ergaenzung"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.28": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-entlassungsmanagementart"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.3": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-gda-aggregatrollen"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.37": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-formatcode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.38.1": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/appc-modalitaet"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.38.2": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/appc-lateralitaet"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.38.3": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/appc-prozeduren"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.38.4": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/appc-anatomie"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.4": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/gda-attribute"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.40": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-sections"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.41": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-formatcodezusatz"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.45": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-significantpathogens"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.49": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-mammogramassessment"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.5": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/gda-org"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.55": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/elga-urlschemeergaenzung"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.56": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/icd-10-bmg-2014"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.58": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-material"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.59": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-janein"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.60": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-analysedetails"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.61": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-antigenh"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.62": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-artmalaria"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.63": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-artquartier"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.64": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-befundart"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.65": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-biotyp-biovar"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.66": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-antigeno"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.67": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-tbc-resistenzergaenzung"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.68": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-quartiercode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.69": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-aviditaet"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.70": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-genogruppe"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.71": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-genotyp"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.72": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-genotyppora-r1"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.73": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-genotyppora-r2"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.74": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-durchgefuehrt"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.75": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-tbc-resultat"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.76": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-ergebnis"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.77": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-wowurdekrankheiterworben"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.78": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-nachweisbar"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.79": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-testmethodemic-ipd"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.80": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-testmethodetypingipd"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.81": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-nachweis"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.82": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-multilocsequ"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.83": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-monoclonalsub"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.84": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-organ"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.85": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-yersinapathogen"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.86": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-phagentyp-vtec"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.87": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-phagentyp"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.88": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-posneg"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.89": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-ribotype"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.90": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-serogruppe"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.91": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-serotyp-gene-feta"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.92": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-serotyp"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.93": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-gewinnung"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.94": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-tbc-typ"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.95": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-orth20probe"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.96": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-reiseland"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.97": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-verotoxin-2-subtyp"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.98": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-verotoxin-1-subtyp"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.99": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ems-materialmethode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.10": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/eimpf-historischeimpfstoffe"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.11": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/eimpf-impfrollen"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.13": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/eimpf-antikoerperbestimmung"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.14": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/eimpf-impfstoffe"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.15": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/eimpf-specialsituationindication"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.16": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ems-materialmethode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.18": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ems-krankheitsmerkmale"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.19": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ems-meldepflichtige-krankheiten"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.2": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/eimpf-impfrelevanteerkrankung"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.21": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ems-taetigkeitsbereich"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.23": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-artderdiagnose"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.24": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ems-impfstatus"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.25": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ems-klinischemanifestation"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.26": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-serviceeventstelemonepi"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.27": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/hl7-at-actconsenttype"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.29": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ems-lebensmittelbedingteintoxikationen"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.3": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/eimpf-specialcasevaccination"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.30": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-alcoholconsumption"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.31": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ems-betreuung"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.4": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/eimpf-immunizationtarget"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.49": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ems-hospitalisierung"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.5": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/eimpf-impfschema"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.51": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ems-reiseland"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.52": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-pregnancystatus"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.53": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-antibiogramm"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.54": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/dgc-typeoftest"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.55": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/dgc-diseaseoragent"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.56": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/dgc-vaccine"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.57": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/dgc-medicinalproduct"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.58": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/dgc-vaccinemarketingauthorizationholder"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.59": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/dgc-doses"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.6": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/eimpf-impfdosis"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.60": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/dgc-resultofthetest"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.62": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/eimpf-zusatzklassifikation"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.63": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/dgc-country"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.65": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/dgc-ratnamemanufacturer"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.66": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-anamneselabormikrobiologie"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.67": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/lkf-diagnose-art"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.68": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/lkf-diagnose-statauf"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.69": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/lkf-diagnose-typ"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.7": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/eimpf-impfgrund"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.74": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/eimpf-mengenart"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.75": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-lebensmittelallergene"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.76": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/austrian-designation-use"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.77": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/hl7-at-patientidentifier"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.78": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/eimpf-zusatzklassifikation-impfprogramm"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.79": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/eimpf-zusatzklassifikation-impfsetting"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.8": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/elga-entitynamepartqualifier"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.81": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/hl7-at-administrativegender-v2"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.83": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/hl7-at-administrativegender-fhir-extension"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.84": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/orphanet-rare-diseases"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.85": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/snomed-rare-diseases"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.86": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/hl7-at-organizationtype"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.6.0.10.87": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/hl7-at-practitionerrole"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.840.10003.5.109": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/iana-mime-type"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.840.10008.2.16.4": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/dcm"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.840.10008.2.6.1": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/dicom-sopclasses"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.3.6.1.4.1.12559.11.10.1.3.1.42.1": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ehdsi-healthcare-professional-role"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.3.6.1.4.1.12559.11.10.1.3.1.42.12": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ehdsi-route-of-administration"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.3.6.1.4.1.12559.11.10.1.3.1.42.16": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ehdsi-unit"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.3.6.1.4.1.12559.11.10.1.3.1.42.2": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ehdsi-doseform"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.3.6.1.4.1.12559.11.10.1.3.1.42.24": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ehdsi-activeingredient"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.3.6.1.4.1.12559.11.10.1.3.1.42.3": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ehdsi-package"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.3.6.1.4.1.12559.11.10.1.3.1.42.31": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ehdsi-confidentiality"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.3.6.1.4.1.12559.11.10.1.3.1.42.34": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ehdsi-administrative-gender"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.3.6.1.4.1.12559.11.10.1.3.1.42.4": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ehdsi-country"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.3.6.1.4.1.12559.11.10.1.3.1.42.40": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ehdsi-telecom-address"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.3.6.1.4.1.12559.11.10.1.3.1.42.41": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ehdsi-timing-event"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.3.6.1.4.1.12559.11.10.1.3.1.42.56": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ehdsi-quantity-unit"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.3.6.1.4.1.12559.11.10.1.3.1.42.6": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ehdsi-language"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.3.6.1.4.1.12559.11.10.1.3.1.42.61": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ehdsi-substance"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.3.6.1.4.1.19376.1.9.2.1": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ihe-pharmaceutical-advice-status-list"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1dd183a6-6d2b-4a9d-8f5d-be09d6bb5a6e": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ehdsi-language"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.1.11.19708": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/ValueSet/ehdsi-actsubstanceadministrationcode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.12.1": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/hl7-administrative-sex"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.12.496": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/hl7-consent-type"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.12.497": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/hl7-consent-mode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.12.498": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/hl7-consent-status"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.12.548": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/hl7-signatorys-relationship-to-subject"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.18.108": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v2-0203"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.18.2": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v2-0001"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.18.320": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v2-0496"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.18.321": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v2-0497"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.18.322": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v2-0498"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.18.355": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v2-0548"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.2.16.1.4.1": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/hl7-at-religionaustria"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.2.16.1.4.10": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/hl7-at-formatcodes"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.2.9.6.2.7": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/isco"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.3.6905.2": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ehdsi-substance"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.3.7.1.7": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/sciphox-seitenlokalisation"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.3.7.1.8": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/sciphox-diagnosenzusatz"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.4.642.1.76": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://hl7.org/fhir/event-timing"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.4.642.3.115": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ips-conditionverificationstatus"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.4.642.3.155": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ips-conditionclinicalstatuscodes"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.1": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v3-AdministrativeGender"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.1008": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v3-NullFlavor"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.1052": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v3-ActSite"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.110": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v3-RoleClass"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.111": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v3-RoleCode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.1119": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v3-AddressUse"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.1150.1": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/ips-absentorunknowndata"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.129": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v3-SpecimenType"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.139": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v3-TimingEvent"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.14": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v3-ActStatus"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.143": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v3-URLScheme"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.2": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v3-MaritalStatus"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.25": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v3-Confidentiality"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.4": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v3-ActCode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.43": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v3-EntityNamePartQualifier"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.45": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v3-EntityNameUse"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.60": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v3-LanguageAbilityMode"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.61": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v3-LanguageAbilityProficiency"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.88": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v3-ParticipationFunction"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.5.90": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "http://terminology.hl7.org/CodeSystem/v3-ParticipationType"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.6.121": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/hl7-language-identification"
-                            },
-                            "source": "OIDtoURI"
-                        },
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "urn:ietf:bcp:47"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.6.24": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/mdc-medicaldevicecommunications"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.6.254-2005": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/icf"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "2.16.840.1.113883.6.43.1": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/icd-o-3"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ],
-                    "1.2.40.0.34.5.227": [
-                        {
-                            "relationship": "equivalent",
-                            "concept": {
-                                "system": "http://fhir.system",
-                                "code": "https://termgit.elga.gv.at/CodeSystem/hl7-at-maritalstatus-ergaenzung"
-                            },
-                            "source": "OIDtoURI"
-                        }
-                    ]
-                }
-            }
-        }
-    }
-}
 def II(src, tgt):
     Any(src, tgt)
     r = src.root
     if r:
         if src.extension is not None:
             tgt.system = string(value=translate_single('OIDtoURI', (r if isinstance(r, str) else r.value), 'code'))
-    r = src.root
-    if r:
-        if fhirpath.single(fhirpath_utils.bool_and([(src.extension is None)], [v2 for v1 in fhirpath_utils.get(src,'root') for v2 in fhirpath_utils.matches(v1, ['[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'])])):
-            tgt.system = uri(value='urn:ietf:rfc:3986')
-            tgt.value = string(value=fhirpath.single(fhirpath_utils.add(['urn:uuid:'], fhirpath_utils.lower(r))))
-    r = src.root
-    if r:
-        if fhirpath.single(fhirpath_utils.bool_and([(src.extension is None)], [v2 for v1 in fhirpath_utils.get(src,'root') for v2 in fhirpath_utils.contains(v1, ['.'])])):
-            tgt.system = uri(value='urn:ietf:rfc:3986')
+        if src.extension is None and root_fullmatch('[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}', r):
+            tgt.system = constant(uri, 'urn:ietf:rfc:3986')
+            tgt.value = string(value='urn:uuid:' + r.lower())
+        if src.extension is None and '.' in r:
+            tgt.system = constant(uri, 'urn:ietf:rfc:3986')
             tgt.value = string(value=('urn:oid:' + r))
     e = src.extension
     if e:
@@ -6056,7 +1440,7 @@ def TSInstant(src, tgt):
     Any(src, tgt)
     v = src.value
     if v:
-        tgt.value = dateutil.parser.parse(str(v))
+        tgt.value = parse_ts(str(v)).instant
 
 def IVL_TSDateTime(src, tgt):
     TSInstant(src, tgt)
@@ -6065,7 +1449,7 @@ def TSDateTime(src, tgt):
     Any(src, tgt)
     v = src.value
     if v:
-        tgt.value = dateutil.parser.parse(str(v)).isoformat()
+        tgt.value = parse_ts(str(v)).dateTime
 
 def IVXB_TSDateTime(src, tgt):
     TSDateTime(src, tgt)
@@ -6074,7 +1458,7 @@ def TSDate(src, tgt):
     Any(src, tgt)
     v = src.value
     if v:
-        tgt.value = dateutil.parser.parse(str(v)).isoformat()
+        tgt.value = parse_ts(str(v)).date
 
 def IVLTSPeriod(src, tgt):
     Any(src, tgt)
@@ -6095,7 +1479,7 @@ def STstring(src, tgt):
     Any(src, tgt)
     v = src
     if v:
-        tgt.value = fhirpath.single(fhirpath_utils.get(v,'valueOf_',strip=True))
+        tgt.value = (str(v.valueOf_).strip() or None if v.valueOf_ else None)
 
 def EDstring(src, tgt):
     STstring(src, tgt)
@@ -6104,7 +1488,7 @@ def ENstring(src, tgt):
     Any(src, tgt)
     v = src
     if v:
-        tgt.value = fhirpath.single(fhirpath_utils.get(v,'valueOf_',strip=True))
+        tgt.value = (str(v.valueOf_).strip() or None if v.valueOf_ else None)
 
 def ONstring(src, tgt):
     ENstring(src, tgt)
@@ -6168,39 +1552,25 @@ def CdaPersonNameCompilationToFhirHumanName(cda_name, fhir_humanName):
         if cda_name_item_xmlText:
             fhir_humanName.text = string(value=cda_name_item_xmlText)
         for cda_name_item_prefix in cda_name_item.prefix or []:
-            fhir_humanName_prefix = [string(value=v1) for v1 in fhirpath_utils.get(cda_name_item_prefix,'valueOf_',strip=True)]
+            fhir_humanName_prefix = [string(value=v1) for v1 in part_texts([cda_name_item_prefix])]
             for v2 in fhir_humanName_prefix:
                 fhir_humanName.prefix.append(v2)
             if cda_name_item_prefix.qualifier is not None:
                 qualifier = cda_name_item_prefix.qualifier
                 if qualifier:
-                    extension = []
-                    for _fhir_humanName_prefix in fhir_humanName_prefix:
-                        _extension = malac.models.fhir.r4.Extension()
-                        _fhir_humanName_prefix.extension.append(_extension)
-                        extension.append(_extension)
-                    for _extension in extension:
-                        _extension.url = 'http://hl7.org/fhir/StructureDefinition/iso21090-EN-qualifier'
-                    for _extension in extension:
-                        _extension.valueCode = string(value=translate_single('ELGAEntityNamePartQualifierFHIRNamePartQualifier', (qualifier if isinstance(qualifier, str) else qualifier.value), 'code'))
+                    if fhir_humanName_prefix:
+                        add_extensions(fhir_humanName_prefix, 'http://hl7.org/fhir/StructureDefinition/iso21090-EN-qualifier', 'valueCode', translate_single('ELGAEntityNamePartQualifierFHIRNamePartQualifier', (qualifier if isinstance(qualifier, str) else qualifier.value), 'code'))
         for cda_name_item_given in cda_name_item.given or []:
-            fhir_humanName_given = [string(value=v1) for v1 in fhirpath_utils.get(cda_name_item_given,'valueOf_',strip=True)]
+            fhir_humanName_given = [string(value=v1) for v1 in part_texts([cda_name_item_given])]
             for v2 in fhir_humanName_given:
                 fhir_humanName.given.append(v2)
             if cda_name_item_given.qualifier is not None:
                 qualifier = cda_name_item_given.qualifier
                 if qualifier:
-                    extension = []
-                    for _fhir_humanName_given in fhir_humanName_given:
-                        _extension = malac.models.fhir.r4.Extension()
-                        _fhir_humanName_given.extension.append(_extension)
-                        extension.append(_extension)
-                    for _extension in extension:
-                        _extension.url = 'http://hl7.org/fhir/StructureDefinition/iso21090-EN-qualifier'
-                    for _extension in extension:
-                        _extension.valueCode = string(value=translate_single('ELGAEntityNamePartQualifierFHIRNamePartQualifier', (qualifier if isinstance(qualifier, str) else qualifier.value), 'code'))
+                    if fhir_humanName_given:
+                        add_extensions(fhir_humanName_given, 'http://hl7.org/fhir/StructureDefinition/iso21090-EN-qualifier', 'valueCode', translate_single('ELGAEntityNamePartQualifierFHIRNamePartQualifier', (qualifier if isinstance(qualifier, str) else qualifier.value), 'code'))
         for cda_name_item_family in cda_name_item.family or []:
-            fhir_humanName_family = string(value=fhirpath.single(fhirpath_utils.get(cda_name_item_family,'valueOf_',strip=True)))
+            fhir_humanName_family = string(value=(str(cda_name_item_family.valueOf_).strip() or None if cda_name_item_family.valueOf_ else None))
             fhir_humanName.family = fhir_humanName_family
             if cda_name_item_family.qualifier is not None:
                 qualifier = cda_name_item_family.qualifier
@@ -6215,21 +1585,14 @@ def CdaPersonNameCompilationToFhirHumanName(cda_name, fhir_humanName):
                     if extension:
                         extension.valueCode = string(value=translate_single('ELGAEntityNamePartQualifierFHIRNamePartQualifier', (qualifier if isinstance(qualifier, str) else qualifier.value), 'code'))
         for cda_name_item_suffix in cda_name_item.suffix or []:
-            fhir_humanName_suffix = [string(value=v1) for v1 in fhirpath_utils.get(cda_name_item_suffix,'valueOf_',strip=True)]
+            fhir_humanName_suffix = [string(value=v1) for v1 in part_texts([cda_name_item_suffix])]
             for v2 in fhir_humanName_suffix:
                 fhir_humanName.suffix.append(v2)
             if cda_name_item_suffix.qualifier is not None:
                 qualifier = cda_name_item_suffix.qualifier
                 if qualifier:
-                    extension = []
-                    for _fhir_humanName_suffix in fhir_humanName_suffix:
-                        _extension = malac.models.fhir.r4.Extension()
-                        _fhir_humanName_suffix.extension.append(_extension)
-                        extension.append(_extension)
-                    for _extension in extension:
-                        _extension.url = 'http://hl7.org/fhir/StructureDefinition/iso21090-EN-qualifier'
-                    for _extension in extension:
-                        _extension.valueCode = string(value=translate_single('ELGAEntityNamePartQualifierFHIRNamePartQualifier', (qualifier if isinstance(qualifier, str) else qualifier.value), 'code'))
+                    if fhir_humanName_suffix:
+                        add_extensions(fhir_humanName_suffix, 'http://hl7.org/fhir/StructureDefinition/iso21090-EN-qualifier', 'valueCode', translate_single('ELGAEntityNamePartQualifierFHIRNamePartQualifier', (qualifier if isinstance(qualifier, str) else qualifier.value), 'code'))
 
 def CdaOrganizationCompilationToFhirOrganization(cda_organization, fhir_organization):
     for id_ in cda_organization.id or []:
@@ -6251,180 +1614,96 @@ def CdaAdressCompilationToFhirAustrianAddress(cda_address, fhir_address):
     if cda_use:
         fhir_address.use = string(value=translate_single('ELGA2FHIRAddressUse', (cda_use if isinstance(cda_use, str) else cda_use.value), 'code'))
         if cda_use != 'PHYS' and cda_use != 'PST':
-            fhir_address.type_ = string(value='both')
+            fhir_address.type_ = constant(string, 'both')
         if cda_use == 'PHYS':
-            fhir_address.type_ = string(value='physical')
+            fhir_address.type_ = constant(string, 'physical')
         if cda_use == 'PST':
-            fhir_address.type_ = string(value='postal')
+            fhir_address.type_ = constant(string, 'postal')
     cda_address_item = cda_address
     if cda_address_item:
         for cda_postalCode in cda_address_item.postalCode or []:
-            fhir_address.postalCode = string(value=fhirpath.single(fhirpath_utils.get(cda_postalCode,'valueOf_',strip=True)))
+            fhir_address.postalCode = string(value=(str(cda_postalCode.valueOf_).strip() or None if cda_postalCode.valueOf_ else None))
         for cda_city in cda_address_item.city or []:
-            fhir_address.city = string(value=fhirpath.single(fhirpath_utils.get(cda_city,'valueOf_',strip=True)))
+            fhir_address.city = string(value=(str(cda_city.valueOf_).strip() or None if cda_city.valueOf_ else None))
         for cda_state in cda_address_item.state or []:
-            fhir_address.state = string(value=fhirpath.single(fhirpath_utils.get(cda_state,'valueOf_',strip=True)))
+            fhir_address.state = string(value=(str(cda_state.valueOf_).strip() or None if cda_state.valueOf_ else None))
         for cda_country in cda_address_item.country or []:
-            fhir_address.country = string(value=fhirpath.single(fhirpath_utils.get(cda_country,'valueOf_',strip=True)))
+            fhir_address.country = string(value=(str(cda_country.valueOf_).strip() or None if cda_country.valueOf_ else None))
     if cda_address.streetName and cda_address.houseNumber and cda_address.additionalLocator:
-        fhir_address_line = [string(value=v1) for v1 in fhirpath_utils.add(fhirpath_utils.get(cda_address,'streetName','valueOf_',strip=True), [' '], fhirpath_utils.get(cda_address,'houseNumber','valueOf_',strip=True), [' '], fhirpath_utils.get(cda_address,'additionalLocator','valueOf_',strip=True))]
+        fhir_address_line = [string(value=v1) for v1 in fhirpath_utils.add(part_texts(cda_address.streetName), [' '], part_texts(cda_address.houseNumber), [' '], part_texts(cda_address.additionalLocator))]
         for v2 in fhir_address_line:
             fhir_address.line.append(v2)
         cda_address_item = cda_address
         if cda_address_item:
             for cda_address_item_streetName in cda_address_item.streetName or []:
-                extension = []
-                for _fhir_address_line in fhir_address_line:
-                    _extension = malac.models.fhir.r4.Extension()
-                    _fhir_address_line.extension.append(_extension)
-                    extension.append(_extension)
-                for _extension in extension:
-                    _extension.url = 'http://hl7.org/fhir/StructureDefinition/iso21090-ADXP-streetName'
-                for _extension in extension:
-                    _extension.valueString = string(value=fhirpath.single(fhirpath_utils.get(cda_address_item_streetName,'valueOf_',strip=True)))
+                if fhir_address_line:
+                    add_extensions(fhir_address_line, 'http://hl7.org/fhir/StructureDefinition/iso21090-ADXP-streetName', 'valueString', (str(cda_address_item_streetName.valueOf_).strip() or None if cda_address_item_streetName.valueOf_ else None))
             for cda_address_item_houseNumber in cda_address_item.houseNumber or []:
-                extension = []
-                for _fhir_address_line in fhir_address_line:
-                    _extension = malac.models.fhir.r4.Extension()
-                    _fhir_address_line.extension.append(_extension)
-                    extension.append(_extension)
-                for _extension in extension:
-                    _extension.url = 'http://hl7.org/fhir/StructureDefinition/iso21090-ADXP-houseNumber'
-                for _extension in extension:
-                    _extension.valueString = string(value=fhirpath.single(fhirpath_utils.get(cda_address_item_houseNumber,'valueOf_',strip=True)))
+                if fhir_address_line:
+                    add_extensions(fhir_address_line, 'http://hl7.org/fhir/StructureDefinition/iso21090-ADXP-houseNumber', 'valueString', (str(cda_address_item_houseNumber.valueOf_).strip() or None if cda_address_item_houseNumber.valueOf_ else None))
             for cda_address_item_additionalLocator in cda_address_item.additionalLocator or []:
                 if cda_address_item.additionalLocator:
-                    extension = []
-                    for _fhir_address_line in fhir_address_line:
-                        _extension = malac.models.fhir.r4.Extension()
-                        _fhir_address_line.extension.append(_extension)
-                        extension.append(_extension)
-                    for _extension in extension:
-                        _extension.url = 'http://hl7.org/fhir/StructureDefinition/iso21090-ADXP-additionalLocator'
-                    for _extension in extension:
-                        _extension.valueString = string(value=fhirpath.single(fhirpath_utils.get(cda_address_item_additionalLocator,'valueOf_',strip=True)))
+                    if fhir_address_line:
+                        add_extensions(fhir_address_line, 'http://hl7.org/fhir/StructureDefinition/iso21090-ADXP-additionalLocator', 'valueString', (str(cda_address_item_additionalLocator.valueOf_).strip() or None if cda_address_item_additionalLocator.valueOf_ else None))
     if cda_address.streetName and cda_address.houseNumber and not cda_address.additionalLocator:
-        fhir_address_line = [string(value=v1) for v1 in fhirpath_utils.add(fhirpath_utils.get(cda_address,'streetName','valueOf_',strip=True), [' '], fhirpath_utils.get(cda_address,'houseNumber','valueOf_',strip=True))]
+        fhir_address_line = [string(value=v1) for v1 in fhirpath_utils.add(part_texts(cda_address.streetName), [' '], part_texts(cda_address.houseNumber))]
         for v2 in fhir_address_line:
             fhir_address.line.append(v2)
         cda_address_item = cda_address
         if cda_address_item:
             for cda_address_item_streetName in cda_address_item.streetName or []:
-                extension = []
-                for _fhir_address_line in fhir_address_line:
-                    _extension = malac.models.fhir.r4.Extension()
-                    _fhir_address_line.extension.append(_extension)
-                    extension.append(_extension)
-                for _extension in extension:
-                    _extension.url = 'http://hl7.org/fhir/StructureDefinition/iso21090-ADXP-streetName'
-                for _extension in extension:
-                    _extension.valueString = string(value=fhirpath.single(fhirpath_utils.get(cda_address_item_streetName,'valueOf_',strip=True)))
+                if fhir_address_line:
+                    add_extensions(fhir_address_line, 'http://hl7.org/fhir/StructureDefinition/iso21090-ADXP-streetName', 'valueString', (str(cda_address_item_streetName.valueOf_).strip() or None if cda_address_item_streetName.valueOf_ else None))
             for cda_address_item_houseNumber in cda_address_item.houseNumber or []:
-                extension = []
-                for _fhir_address_line in fhir_address_line:
-                    _extension = malac.models.fhir.r4.Extension()
-                    _fhir_address_line.extension.append(_extension)
-                    extension.append(_extension)
-                for _extension in extension:
-                    _extension.url = 'http://hl7.org/fhir/StructureDefinition/iso21090-ADXP-houseNumber'
-                for _extension in extension:
-                    _extension.valueString = string(value=fhirpath.single(fhirpath_utils.get(cda_address_item_houseNumber,'valueOf_',strip=True)))
+                if fhir_address_line:
+                    add_extensions(fhir_address_line, 'http://hl7.org/fhir/StructureDefinition/iso21090-ADXP-houseNumber', 'valueString', (str(cda_address_item_houseNumber.valueOf_).strip() or None if cda_address_item_houseNumber.valueOf_ else None))
     if cda_address.streetAddressLine and cda_address.additionalLocator:
-        fhir_address_line = [string(value=v1) for v1 in fhirpath_utils.add(fhirpath_utils.get(cda_address,'streetAddressLine','valueOf_',strip=True), [' '], fhirpath_utils.get(cda_address,'additionalLocator','valueOf_',strip=True))]
+        fhir_address_line = [string(value=v1) for v1 in fhirpath_utils.add(part_texts(cda_address.streetAddressLine), [' '], part_texts(cda_address.additionalLocator))]
         for v2 in fhir_address_line:
             fhir_address.line.append(v2)
         cda_address_item = cda_address
         if cda_address_item:
             for cda_address_item_additionalLocator in cda_address_item.additionalLocator or []:
                 if cda_address_item.additionalLocator:
-                    extension = []
-                    for _fhir_address_line in fhir_address_line:
-                        _extension = malac.models.fhir.r4.Extension()
-                        _fhir_address_line.extension.append(_extension)
-                        extension.append(_extension)
-                    for _extension in extension:
-                        _extension.url = 'http://hl7.org/fhir/StructureDefinition/iso21090-ADXP-additionalLocator'
-                    for _extension in extension:
-                        _extension.valueString = string(value=fhirpath.single(fhirpath_utils.get(cda_address_item_additionalLocator,'valueOf_',strip=True)))
+                    if fhir_address_line:
+                        add_extensions(fhir_address_line, 'http://hl7.org/fhir/StructureDefinition/iso21090-ADXP-additionalLocator', 'valueString', (str(cda_address_item_additionalLocator.valueOf_).strip() or None if cda_address_item_additionalLocator.valueOf_ else None))
     if cda_address.streetAddressLine and not cda_address.additionalLocator:
-        for v2 in [string(value=v1) for v1 in fhirpath_utils.get(cda_address,'streetAddressLine','valueOf_',strip=True)]:
+        for v2 in [string(value=v1) for v1 in part_texts(cda_address.streetAddressLine)]:
             fhir_address.line.append(v2)
 
+telecom_schemes = {
+    'fax:': ('fax', 4),
+    'file:': ('other', 5),
+    'ftp:': ('url', 4),
+    'http:': ('url', 7),
+    'mailto:': ('email', 7),
+    'mllp:': ('url', 5),
+    'modem:': ('other', 6),
+    'nfs:': ('other', 4),
+    'tel:': ('phone', 4),
+    'telnet:': ('url', 7),
+}
+
 def TELContactPoint(src, tgt):
     Any(src, tgt)
     u = src.use
     if u:
-        if (src.use or '').startswith('H') or src.use == 'EC':
+        if ((src.use or '').startswith('H') or src.use == 'EC') or (src.use == 'WP' or src.use == 'AS') or (src.use == 'MC' or src.use == 'PG') or (src.use == 'TMP'):
             tgt.use = string(value=translate_single('ELGATelecomAddressUseFHIRContactPointUse', (u if isinstance(u, str) else u.value), 'code'))
-    u = src.use
-    if u:
-        if src.use == 'WP' or src.use == 'AS':
-            tgt.use = string(value=translate_single('ELGATelecomAddressUseFHIRContactPointUse', (u if isinstance(u, str) else u.value), 'code'))
-    u = src.use
-    if u:
-        if src.use == 'MC' or src.use == 'PG':
-            tgt.use = string(value=translate_single('ELGATelecomAddressUseFHIRContactPointUse', (u if isinstance(u, str) else u.value), 'code'))
-    u = src.use
-    if u:
-        if src.use == 'TMP':
-            tgt.use = string(value=translate_single('ELGATelecomAddressUseFHIRContactPointUse', (u if isinstance(u, str) else u.value), 'code'))
-    v = src.value
-    if v:
-        if (src.value or '').startswith('fax:'):
-            tgt.value = string(value=fhirpath.single(fhirpath_utils.substring(v,[4],[])))
-            tgt.system = string(value='fax')
-    v = src.value
-    if v:
-        if (src.value or '').startswith('file:'):
-            tgt.value = string(value=fhirpath.single(fhirpath_utils.substring(v,[5],[])))
-            tgt.system = string(value='other')
-    v = src.value
-    if v:
-        if (src.value or '').startswith('ftp:'):
-            tgt.value = string(value=fhirpath.single(fhirpath_utils.substring(v,[4],[])))
-            tgt.system = string(value='url')
-    v = src.value
-    if v:
-        if (src.value or '').startswith('http:'):
-            tgt.value = string(value=fhirpath.single(fhirpath_utils.substring(v,[7],[])))
-            tgt.system = string(value='url')
-    v = src.value
-    if v:
-        if (src.value or '').startswith('mailto:'):
-            tgt.value = string(value=fhirpath.single(fhirpath_utils.substring(v,[7],[])))
-            tgt.system = string(value='email')
     v = src.value
     if v:
-        if (src.value or '').startswith('mllp:'):
-            tgt.value = string(value=fhirpath.single(fhirpath_utils.substring(v,[5],[])))
-            tgt.system = string(value='url')
-    v = src.value
-    if v:
-        if (src.value or '').startswith('modem:'):
-            tgt.value = string(value=fhirpath.single(fhirpath_utils.substring(v,[6],[])))
-            tgt.system = string(value='other')
-    v = src.value
-    if v:
-        if (src.value or '').startswith('nfs:'):
-            tgt.value = string(value=fhirpath.single(fhirpath_utils.substring(v,[4],[])))
-            tgt.system = string(value='other')
-    v = src.value
-    if v:
-        if (src.value or '').startswith('tel:'):
-            tgt.value = string(value=fhirpath.single(fhirpath_utils.substring(v,[4],[])))
-            tgt.system = string(value='phone')
-    v = src.value
-    if v:
-        if (src.value or '').startswith('telnet:'):
-            tgt.value = string(value=fhirpath.single(fhirpath_utils.substring(v,[7],[])))
-            tgt.system = string(value='url')
+        scheme = telecom_schemes.get(v[:v.find(':') + 1])
+        if scheme is not None:
+            system, offset = scheme
+            tgt.value = string(value=(v[offset:] if offset < len(v) else None))
+            tgt.system = string(value=system)
     for useablePeriod in src.useablePeriod or []:
         tgt.period = malac.models.fhir.r4.Period()
         transform_default(useablePeriod, tgt.period)
 
 def PQQuantity(src, tgt):
     Any(src, tgt)
-    tgt.system = uri(value='http://unitsofmeasure.org')
+    tgt.system = constant(uri, 'http://unitsofmeasure.org')
     unit = src.unit
     if unit:
         tgt.code = string(value=unit)
@@ -6478,293 +1757,6 @@ def CdaNullFlavorToFhirNullFlavor(src, tgt):
 def Any(src, tgt):
     pass
 
-def unpack_container(resource_container):
-    if resource_container is None:
-        return None
-    if resource_container.Account is not None:
-        return resource_container.Account
-    if resource_container.ActivityDefinition is not None:
-        return resource_container.ActivityDefinition
-    if resource_container.AdministrableProductDefinition is not None:
-        return resource_container.AdministrableProductDefinition
-    if resource_container.AdverseEvent is not None:
-        return resource_container.AdverseEvent
-    if resource_container.AllergyIntolerance is not None:
-        return resource_container.AllergyIntolerance
-    if resource_container.Appointment is not None:
-        return resource_container.Appointment
-    if resource_container.AppointmentResponse is not None:
-        return resource_container.AppointmentResponse
-    if resource_container.AuditEvent is not None:
-        return resource_container.AuditEvent
-    if resource_container.Basic is not None:
-        return resource_container.Basic
-    if resource_container.Binary is not None:
-        return resource_container.Binary
-    if resource_container.BiologicallyDerivedProduct is not None:
-        return resource_container.BiologicallyDerivedProduct
-    if resource_container.BodyStructure is not None:
-        return resource_container.BodyStructure
-    if resource_container.Bundle is not None:
-        return resource_container.Bundle
-    if resource_container.CapabilityStatement is not None:
-        return resource_container.CapabilityStatement
-    if resource_container.CarePlan is not None:
-        return resource_container.CarePlan
-    if resource_container.CareTeam is not None:
-        return resource_container.CareTeam
-    if resource_container.CatalogEntry is not None:
-        return resource_container.CatalogEntry
-    if resource_container.ChargeItem is not None:
-        return resource_container.ChargeItem
-    if resource_container.ChargeItemDefinition is not None:
-        return resource_container.ChargeItemDefinition
-    if resource_container.Citation is not None:
-        return resource_container.Citation
-    if resource_container.Claim is not None:
-        return resource_container.Claim
-    if resource_container.ClaimResponse is not None:
-        return resource_container.ClaimResponse
-    if resource_container.ClinicalImpression is not None:
-        return resource_container.ClinicalImpression
-    if resource_container.ClinicalUseDefinition is not None:
-        return resource_container.ClinicalUseDefinition
-    if resource_container.CodeSystem is not None:
-        return resource_container.CodeSystem
-    if resource_container.Communication is not None:
-        return resource_container.Communication
-    if resource_container.CommunicationRequest is not None:
-        return resource_container.CommunicationRequest
-    if resource_container.CompartmentDefinition is not None:
-        return resource_container.CompartmentDefinition
-    if resource_container.Composition is not None:
-        return resource_container.Composition
-    if resource_container.ConceptMap is not None:
-        return resource_container.ConceptMap
-    if resource_container.Condition is not None:
-        return resource_container.Condition
-    if resource_container.Consent is not None:
-        return resource_container.Consent
-    if resource_container.Contract is not None:
-        return resource_container.Contract
-    if resource_container.Coverage is not None:
-        return resource_container.Coverage
-    if resource_container.CoverageEligibilityRequest is not None:
-        return resource_container.CoverageEligibilityRequest
-    if resource_container.CoverageEligibilityResponse is not None:
-        return resource_container.CoverageEligibilityResponse
-    if resource_container.DetectedIssue is not None:
-        return resource_container.DetectedIssue
-    if resource_container.Device is not None:
-        return resource_container.Device
-    if resource_container.DeviceDefinition is not None:
-        return resource_container.DeviceDefinition
-    if resource_container.DeviceMetric is not None:
-        return resource_container.DeviceMetric
-    if resource_container.DeviceRequest is not None:
-        return resource_container.DeviceRequest
-    if resource_container.DeviceUseStatement is not None:
-        return resource_container.DeviceUseStatement
-    if resource_container.DiagnosticReport is not None:
-        return resource_container.DiagnosticReport
-    if resource_container.DocumentManifest is not None:
-        return resource_container.DocumentManifest
-    if resource_container.DocumentReference is not None:
-        return resource_container.DocumentReference
-    if resource_container.Encounter is not None:
-        return resource_container.Encounter
-    if resource_container.Endpoint is not None:
-        return resource_container.Endpoint
-    if resource_container.EnrollmentRequest is not None:
-        return resource_container.EnrollmentRequest
-    if resource_container.EnrollmentResponse is not None:
-        return resource_container.EnrollmentResponse
-    if resource_container.EpisodeOfCare is not None:
-        return resource_container.EpisodeOfCare
-    if resource_container.EventDefinition is not None:
-        return resource_container.EventDefinition
-    if resource_container.Evidence is not None:
-        return resource_container.Evidence
-    if resource_container.EvidenceReport is not None:
-        return resource_container.EvidenceReport
-    if resource_container.EvidenceVariable is not None:
-        return resource_container.EvidenceVariable
-    if resource_container.ExampleScenario is not None:
-        return resource_container.ExampleScenario
-    if resource_container.ExplanationOfBenefit is not None:
-        return resource_container.ExplanationOfBenefit
-    if resource_container.FamilyMemberHistory is not None:
-        return resource_container.FamilyMemberHistory
-    if resource_container.Flag is not None:
-        return resource_container.Flag
-    if resource_container.Goal is not None:
-        return resource_container.Goal
-    if resource_container.GraphDefinition is not None:
-        return resource_container.GraphDefinition
-    if resource_container.Group is not None:
-        return resource_container.Group
-    if resource_container.GuidanceResponse is not None:
-        return resource_container.GuidanceResponse
-    if resource_container.HealthcareService is not None:
-        return resource_container.HealthcareService
-    if resource_container.ImagingStudy is not None:
-        return resource_container.ImagingStudy
-    if resource_container.Immunization is not None:
-        return resource_container.Immunization
-    if resource_container.ImmunizationEvaluation is not None:
-        return resource_container.ImmunizationEvaluation
-    if resource_container.ImmunizationRecommendation is not None:
-        return resource_container.ImmunizationRecommendation
-    if resource_container.ImplementationGuide is not None:
-        return resource_container.ImplementationGuide
-    if resource_container.Ingredient is not None:
-        return resource_container.Ingredient
-    if resource_container.InsurancePlan is not None:
-        return resource_container.InsurancePlan
-    if resource_container.Invoice is not None:
-        return resource_container.Invoice
-    if resource_container.Library is not None:
-        return resource_container.Library
-    if resource_container.Linkage is not None:
-        return resource_container.Linkage
-    if resource_container.List is not None:
-        return resource_container.List
-    if resource_container.Location is not None:
-        return resource_container.Location
-    if resource_container.ManufacturedItemDefinition is not None:
-        return resource_container.ManufacturedItemDefinition
-    if resource_container.Measure is not None:
-        return resource_container.Measure
-    if resource_container.MeasureReport is not None:
-        return resource_container.MeasureReport
-    if resource_container.Media is not None:
-        return resource_container.Media
-    if resource_container.Medication is not None:
-        return resource_container.Medication
-    if resource_container.MedicationAdministration is not None:
-        return resource_container.MedicationAdministration
-    if resource_container.MedicationDispense is not None:
-        return resource_container.MedicationDispense
-    if resource_container.MedicationKnowledge is not None:
-        return resource_container.MedicationKnowledge
-    if resource_container.MedicationRequest is not None:
-        return resource_container.MedicationRequest
-    if resource_container.MedicationStatement is not None:
-        return resource_container.MedicationStatement
-    if resource_container.MedicinalProductDefinition is not None:
-        return resource_container.MedicinalProductDefinition
-    if resource_container.MessageDefinition is not None:
-        return resource_container.MessageDefinition
-    if resource_container.MessageHeader is not None:
-        return resource_container.MessageHeader
-    if resource_container.MolecularSequence is not None:
-        return resource_container.MolecularSequence
-    if resource_container.NamingSystem is not None:
-        return resource_container.NamingSystem
-    if resource_container.NutritionOrder is not None:
-        return resource_container.NutritionOrder
-    if resource_container.NutritionProduct is not None:
-        return resource_container.NutritionProduct
-    if resource_container.Observation is not None:
-        return resource_container.Observation
-    if resource_container.ObservationDefinition is not None:
-        return resource_container.ObservationDefinition
-    if resource_container.OperationDefinition is not None:
-        return resource_container.OperationDefinition
-    if resource_container.OperationOutcome is not None:
-        return resource_container.OperationOutcome
-    if resource_container.Organization is not None:
-        return resource_container.Organization
-    if resource_container.OrganizationAffiliation is not None:
-        return resource_container.OrganizationAffiliation
-    if resource_container.PackagedProductDefinition is not None:
-        return resource_container.PackagedProductDefinition
-    if resource_container.Patient is not None:
-        return resource_container.Patient
-    if resource_container.PaymentNotice is not None:
-        return resource_container.PaymentNotice
-    if resource_container.PaymentReconciliation is not None:
-        return resource_container.PaymentReconciliation
-    if resource_container.Person is not None:
-        return resource_container.Person
-    if resource_container.PlanDefinition is not None:
-        return resource_container.PlanDefinition
-    if resource_container.Practitioner is not None:
-        return resource_container.Practitioner
-    if resource_container.PractitionerRole is not None:
-        return resource_container.PractitionerRole
-    if resource_container.Procedure is not None:
-        return resource_container.Procedure
-    if resource_container.Provenance is not None:
-        return resource_container.Provenance
-    if resource_container.Questionnaire is not None:
-        return resource_container.Questionnaire
-    if resource_container.QuestionnaireResponse is not None:
-        return resource_container.QuestionnaireResponse
-    if resource_container.RegulatedAuthorization is not None:
-        return resource_container.RegulatedAuthorization
-    if resource_container.RelatedPerson is not None:
-        return resource_container.RelatedPerson
-    if resource_container.RequestGroup is not None:
-        return resource_container.RequestGroup
-    if resource_container.ResearchDefinition is not None:
-        return resource_container.ResearchDefinition
-    if resource_container.ResearchElementDefinition is not None:
-        return resource_container.ResearchElementDefinition
-    if resource_container.ResearchStudy is not None:
-        return resource_container.ResearchStudy
-    if resource_container.ResearchSubject is not None:
-        return resource_container.ResearchSubject
-    if resource_container.RiskAssessment is not None:
-        return resource_container.RiskAssessment
-    if resource_container.Schedule is not None:
-        return resource_container.Schedule
-    if resource_container.SearchParameter is not None:
-        return resource_container.SearchParameter
-    if resource_container.ServiceRequest is not None:
-        return resource_container.ServiceRequest
-    if resource_container.Slot is not None:
-        return resource_container.Slot
-    if resource_container.Specimen is not None:
-        return resource_container.Specimen
-    if resource_container.SpecimenDefinition is not None:
-        return resource_container.SpecimenDefinition
-    if resource_container.StructureDefinition is not None:
-        return resource_container.StructureDefinition
-    if resource_container.StructureMap is not None:
-        return resource_container.StructureMap
-    if resource_container.Subscription is not None:
-        return resource_container.Subscription
-    if resource_container.SubscriptionStatus is not None:
-        return resource_container.SubscriptionStatus
-    if resource_container.SubscriptionTopic is not None:
-        return resource_container.SubscriptionTopic
-    if resource_container.Substance is not None:
-        return resource_container.Substance
-    if resource_container.SubstanceDefinition is not None:
-        return resource_container.SubstanceDefinition
-    if resource_container.SupplyDelivery is not None:
-        return resource_container.SupplyDelivery
-    if resource_container.SupplyRequest is not None:
-        return resource_container.SupplyRequest
-    if resource_container.Task is not None:
-        return resource_container.Task
-    if resource_container.TerminologyCapabilities is not None:
-        return resource_container.TerminologyCapabilities
-    if resource_container.TestReport is not None:
-        return resource_container.TestReport
-    if resource_container.TestScript is not None:
-        return resource_container.TestScript
-    if resource_container.ValueSet is not None:
-        return resource_container.ValueSet
-    if resource_container.VerificationResult is not None:
-        return resource_container.VerificationResult
-    if resource_container.VisionPrescription is not None:
-        return resource_container.VisionPrescription
-    if resource_container.Parameters is not None:
-        return resource_container.Parameters
-    return None
-
 default_types_maps = {
     (malac.models.cda.at_ext.II, malac.models.fhir.r4.Identifier): II,
     (malac.models.cda.at_ext.INT, malac.models.fhir.r4.integer): INT,
@@ -6799,61 +1791,10 @@ default_types_maps = {
 }
 default_types_maps_plus = {
 }
-
-def transform_default(source, target, target_type=None):
-    target_type = target_type or type(target)
-    source_type = type(source)
-    while source_type is not None:
-        default_map = default_types_maps.get((source_type, target_type))
-        if default_map:
-            default_map(source, target)
-            return
-        source_type = source_type.__bases__[0] if source_type.__bases__ else None
-    source_type = type(source)
-    while source_type is not None:
-        default_map_plus = default_types_maps_plus.get(source_type)
-        if default_map_plus:
-            default_map_plus(source, target)
-            return
-        source_type = source_type.__bases__[0] if source_type.__bases__ else None
-    raise BaseException('No default transform found for %s -> %s' % (type(source), target_type))
-
-def translate_unmapped(url, code):
-    if url == 'http://hl7.org/fhir/ConceptMap/special-oid2uri': return [{'uri': 'urn:oid:%s' % code}]
-    if url == 'OIDtoURI': return [{'code': 'urn:oid:%s' % code}]
-    if url == 'StructureMapGroupTypeMode': return [{'code': 'none'}]
-    if url == 'AllergyCategoryMap': return [{'code': None}]
-    raise BaseException('Code %s could not be mapped to any code in concept map %s and no exception defined' % (code, url))
-
-def translate_single(url, code, out_type):
-    trans_out = translate(url=url, code=code, silent=True)
-    matches = [match['concept'] for match in trans_out['match'] if match['relationship']=='equivalent' or match['relationship']=='equal']
-    # if there are mutliple 'equivalent' or 'equal' matches and CodeableConcept is not the output param, than throw an error
-    if len(matches) > 1:
-        raise BaseException("There are multiple 'equivalent' or 'equal' matches in the results of the translate and output type is not CodeableConcept!")
-    elif len(matches) == 0:
-        matches = translate_unmapped(url=url, code=code)
-    if out_type == "Coding":
-        return malac.models.fhir.r4.Coding(system=(malac.models.fhir.r4.uri(value=matches[0]['system']) if "system" in matches[0] else None), 
-                              version=(malac.models.fhir.r4.string(value=matches[0]['version']) if "version" in matches[0] else None), 
-                              code=(malac.models.fhir.r4.string(value=matches[0]['code']) if "code" in matches[0] else None), 
-                              display=(malac.models.fhir.r4.string(value=matches[0]['display']) if "display" in  matches[0] else None), 
-                              userSelected=(malac.models.fhir.r4.string(value=matches[0]['userSelected']) if "userSelected" in matches[0] else None))
-    else:
-        return matches[0][out_type]
-
-def translate_multi(url, code):
-    trans_out = translate(url=url, code=code, silent=True)
-    matches = [match['concept'] for match in trans_out['match'] if match['relationship']=='equivalent' or match['relationship']=='equal']
-    return malac.models.fhir.r4.CodeableConcept(coding=[malac.models.fhir.r4.Coding(system=(malac.models.fhir.r4.uri(value=matches[0]['system']) if "system" in matches[0] else None), 
-                                                          version=(malac.models.fhir.r4.string(value=matches[0]['version']) if "version" in matches[0] else None), 
-                                                          code=(malac.models.fhir.r4.string(value=matches[0]['code']) if "code" in matches[0] else None), 
-                                                          display=(malac.models.fhir.r4.string(value=matches[0]['display']) if "display" in  matches[0] else None), 
-                                                          userSelected=(malac.models.fhir.r4.string(value=matches[0]['userSelected']) if "userSelected" in matches[0] else None)
-                                                          ) for match in matches])
+register_default_types_maps(default_types_maps, default_types_maps_plus)
 
 
 if __name__ == "__main__":
     parser = init_argparse()
     args = parser.parse_args()
-    transform(args.source, args.target)
+    transform(args.source, args.target, **transform_options(args))
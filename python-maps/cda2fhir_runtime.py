@@ -0,0 +1,1600 @@
+# The runtime of the compiled map python-maps/CdaToBundle.4.py: the definitions replacing the compiled ones of the same
+# name (see replaced_definitions in patch_map.py) and the helpers the compiled groups are rewritten to call.
+# MaLaC-HD regenerates the compiled map from maps/CdaToBundle.4.map, patch_map.py then makes it import this module, so
+# that the groups stay compiled from the map and only the generated code around them lives here.
+import time
+import re
+import json
+import os
+import pickle
+import mmap
+import struct
+import zlib
+import queue
+import socket
+import http.client
+import urllib.parse
+from xml.etree import ElementTree
+import hashlib
+import threading
+import uuid
+import inspect
+from collections import OrderedDict
+from types import MappingProxyType
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache, cached_property
+import malac.models.cda.at_ext
+import malac.models.fhir.r4
+from malac.models.fhir.r4 import string, uri
+
+
+# output
+# 1..1 result (boolean)
+# 0..1 message with error details for human (string)
+# 0..* match with (list)
+#   0..1 equivalence/relationship
+#   0..1 concept
+#       0..1 system
+#       0..1 version
+#       0..1 code
+#       0..1 display 
+#       0..1 userSelected will always be false, because this is a translation
+#   0..1 source (conceptMap url)
+# reverse translates a code (and system) of the targets back to the source codes
+def translate(url=None, conceptMapVersion=None, code=None, system=None, version=None, source=None, coding=None, codeableConcept=None, target=None, targetsystem=None, reverse=None, silent=False)              -> dict [bool, str, list[dict[str, dict[str, str, str, str, bool], str]]]:
+    start = time.time()
+    
+    # start validation and recall of translate in simple from
+    if codeableConcept:
+        if isinstance(codeableConcept, str): 
+            codeableConcept = malac.models.fhir.r4.parseString(codeableConcept, silent)
+        elif isinstance(coding, malac.models.fhir.r4.CodeableConcept):
+            pass
+        else:
+            raise BaseException("The codeableConcept parameter has to be a string or a CodeableConcept Object (called method as library)!")
+        # the first fit will be returned, else the last unfitted value will be returned
+        # TODO check translate params
+        for one_coding in codeableConcept.get_coding:
+            if (ret := translate(url=url, source=source, coding=one_coding, 
+                                 target=target, targetsystem=targetsystem, 
+                                 reverse=reverse, silent=True))[0]:
+                return ret
+        else: return ret
+    elif coding:
+        if isinstance(coding, str): 
+            coding = malac.models.fhir.r4.parseString(coding, silent)
+        elif isinstance(coding, malac.models.fhir.r4.Coding):
+            pass
+        else:
+            raise BaseException("The coding parameter has to be a string or a Coding Object (called method as library)!")
+        # TODO check translate params
+        return translate(url=url,  source=source, coding=one_coding, 
+                         target=target, targetsystem=targetsystem, 
+                         reverse=reverse, silent=True)
+    elif code:
+        if not isinstance(code,str): 
+            raise BaseException("The code parameter has to be a string!")
+    elif target:
+        if not isinstance(code,str): 
+            raise BaseException("The target parameter has to be a string!")
+    elif targetsystem:
+        if not isinstance(code,str): 
+            raise BaseException("The targetsystem parameter has to be a string!")
+    else:
+        raise BaseException("At least codeableConcept, coding, code, target or targetSystem has to be given!")
+    # end validation and recall of translate in simplier from
+
+    # look for any information from the one ore more generated conceptMaps in the compiled conceptMap index
+    ensure_conceptMaps()
+    match = []
+    if url and url not in conceptMap_urls:
+        print('   #ERROR# ConceptMap with URL "'+ url +'" is not loaded to this compiled conceptMap #ERROR#')
+    else:
+        query = (str(url or ""), source, target, system, targetsystem, code)
+        if reverse:
+            # the code (and system) are looked up in the targets, the unmapped modes are not applicable
+            match = conceptMap_index_lookup(query, reverse=True)
+        else:
+            match = conceptMap_index_lookup(query)
+            # the unmapped modes are precompiled per conceptMap, see conceptMap_fallback_for
+            if not match:
+                match = conceptMap_fallback_lookup(query, system, version)
+
+    # see if any match is not in R4 "unmatched" or "disjoint" and in R5 "not-related-to"
+    result = False
+    message = ""
+    for one_match in match:
+        if one_match["relationship"] not in ['not-related-to']:
+            result = True 
+            # for printing only, if no url was initially given use the conceptmap
+            if not url:
+                url = one_match["source"]
+
+    if not silent:
+        print('Translation in '+str(round(time.time()-start,3))+' seconds for code "'+(code or "NONE")+'" with ConceptMap "'+url+'"')
+    return {"result": result, "message": message, "match": match}
+
+# the conceptMaps compiled into the map are dropped by patch_map.py, they are loaded from the FHIR mapping language files
+# the map was compiled from or from FHIR ConceptMap resources (JSON or XML) into conceptMap_as_7dimension_dict, see load_conceptMaps
+conceptMap_as_7dimension_dict = {}
+
+# the compiled conceptMap index replaces the scan over all levels of conceptMap_as_7dimension_dict
+# for every translate, the 7 dimensions are flattened once into a table of
+# (url, source, target, system, targetsystem, code) keys in the original iteration order
+# and for every combination of given translate parameters (query mask) a hash index is built
+# a "%" in the key is a wildcard, a not given translate parameter matches every key
+# for the reverse translation the targets are indexed the same way in conceptMap_reverse_table,
+# with the system of the given code looked up in the targetsystem and the targetsystem in the system
+conceptMap_urls = set()
+conceptMap_index_table = []
+conceptMap_reverse_table = []
+conceptMap_index_masks = {}
+conceptMap_segment = None
+
+# the relationship of a reverse match is the one of the forward match seen from the target, the symmetric ones are kept
+reverse_relationships = {"source-is-narrower-than-target": "source-is-broader-than-target",
+                         "source-is-broader-than-target": "source-is-narrower-than-target",
+                         "narrower": "wider", "wider": "narrower", "specializes": "subsumes", "subsumes": "specializes"}
+
+def compile_conceptMap_index():
+    global conceptMap_segment
+    conceptMap_segment = None
+    conceptMap_urls.clear()
+    conceptMap_urls.update(conceptMap_as_7dimension_dict)
+    conceptMap_index_table.clear()
+    conceptMap_reverse_table.clear()
+    conceptMap_index_masks.clear()
+    conceptMap_fallback_table.clear()
+    for url_lvl, source_dict in conceptMap_as_7dimension_dict.items():
+        for source_lvl, target_dict in source_dict.items():
+            for target_lvl, system_dict in target_dict.items():
+                for system_lvl, targetsystem_dict in system_dict.items():
+                    for targetsystem_lvl, code_dict in targetsystem_dict.items():
+                        for code_lvl, entries in code_dict.items():
+                            conceptMap_index_table.append(((url_lvl, source_lvl, target_lvl, system_lvl, targetsystem_lvl, code_lvl), entries))
+                            # unmapped values and "%" codes can not be reversed to a source code
+                            if code_lvl in ("|", "~", "#", "%"):
+                                continue
+                            for entry in entries:
+                                if not entry["concept"].get("code"):
+                                    continue
+                                concept = {"system": system_lvl, "code": code_lvl} if system_lvl != "%" else {"code": code_lvl}
+                                conceptMap_reverse_table.append(((url_lvl, source_lvl, target_lvl, entry["concept"].get("system") or targetsystem_lvl, system_lvl, entry["concept"]["code"]),
+                                                                 [{"relationship": reverse_relationships.get(entry["relationship"], entry["relationship"]), "concept": concept, "source": entry["source"]}]))
+    # the mask used by translate_single and translate_multi is built upfront, all others on first use
+    conceptMap_index_for_mask((True, False, False, False, False, True))
+    conceptMap_index_for_mask((True, False, False, False, False, False), unmapped_only=True)
+    conceptMap_index_for_mask((True, False, False, False, False, True), reverse=True)
+    check_conceptMap_chains()
+    for url_lvl in conceptMap_as_7dimension_dict:
+        conceptMap_fallback_for((url_lvl, None, None, None, None))
+
+def conceptMap_index_for_mask(mask, unmapped_only=False, reverse=False):
+    index = conceptMap_index_masks.get((mask, unmapped_only, reverse))
+    if index is None:
+        # an attached shared segment holds only the prebuilt masks, the tables are loaded for any other mask
+        if conceptMap_segment is not None and not conceptMap_index_table:
+            conceptMap_index_table[:], conceptMap_reverse_table[:] = conceptMap_segment.tables()
+        index = {}
+        for position, (keys, entries) in enumerate(conceptMap_reverse_table if reverse else conceptMap_index_table):
+            if unmapped_only and keys[5] not in ("|", "~", "#"):
+                continue
+            index_key = tuple(key for key, given in zip(keys, mask) if given)
+            index.setdefault(index_key, []).append((position, entries))
+        conceptMap_index_masks[(mask, unmapped_only, reverse)] = index
+    return index
+
+def conceptMap_index_lookup(query, unmapped_only=False, reverse=False):
+    mask = tuple(bool(value) for value in query)
+    index = conceptMap_index_for_mask(mask, unmapped_only, reverse)
+    # every given parameter is looked up with its own value and the "%" wildcard
+    index_keys = [()]
+    for value in query:
+        if value:
+            index_keys = [index_key + (one_value,) for index_key in index_keys for one_value in ((value,) if value == "%" else (value, "%"))]
+    found = []
+    for index_key in index_keys:
+        found += index.get(index_key, [])
+    # keep the order of the 7 dimension dict, as the first match is taken by translate_single
+    if len(index_keys) > 1:
+        found.sort(key=lambda one_found: one_found[0])
+    return [entry for position, entries in found for entry in entries]
+
+# the unmapped modes (provided from https://hl7.org/fhir/R4B/conceptmap-definitions.html#ConceptMap.group.unmapped.mode)
+# are resolved once per (url, source, target, system, targetsystem) into a fallback of
+# - the chain of other conceptMaps ("#"), flattened, which are tried in order for a direct match
+# - the steps of the last conceptMap in the chain, a prefix ("|") or a fixed concept ("~")
+# like in the former recursive translate, the first "#" wins over all other unmapped values
+conceptMap_fallback_table = {}
+
+def conceptMap_fallback_for(query):
+    fallback = conceptMap_fallback_table.get(query)
+    if fallback is None:
+        chain = []
+        steps = []
+        current = query
+        while current[0] in conceptMap_urls or current is query:
+            steps = []
+            chained = None
+            for one_unmapped in conceptMap_index_lookup(current + (None,), unmapped_only=True):
+                unmapped_code = one_unmapped["concept"]["code"]
+                if unmapped_code.startswith("|"):
+                    steps.append((one_unmapped["relationship"], unmapped_code[1:], None, one_unmapped["source"]))
+                elif unmapped_code.startswith("~"):
+                    concept = {}
+                    if tmp := one_unmapped["concept"].get("system"): concept["system"] = tmp
+                    if tmp := unmapped_code[1:]: concept["code"] = tmp
+                    if tmp := one_unmapped["concept"].get("display"): concept["display"] = tmp
+                    # if the concept dict is empty, than skip this broken value, it seems like the conceptmap has an empty group
+                    if concept:
+                        steps.append((one_unmapped["relationship"], None, concept, one_unmapped["source"]))
+                elif unmapped_code.startswith("#"):
+                    chained = (unmapped_code[1:],) + current[1:]
+                    break
+            if chained is None:
+                break
+            # a chain to a not loaded conceptMap ends without a match, as the former recursive translate did
+            steps = []
+            chain.append(chained)
+            current = chained
+        fallback = conceptMap_fallback_table[query] = (tuple(chain), tuple(steps))
+    return fallback
+
+def conceptMap_fallback_lookup(query, system, version):
+    chain, steps = conceptMap_fallback_for(query[:5])
+    code = query[5]
+    for chained_query in chain:
+        if chained_query[0] not in conceptMap_urls:
+            print('   #ERROR# ConceptMap with URL "'+ chained_query[0] +'" is not loaded to this compiled conceptMap #ERROR#')
+            return []
+        if match := conceptMap_index_lookup(chained_query + (code,)):
+            return match
+    match = []
+    for relationship, prefix, concept, source in steps:
+        if prefix is not None:
+            # replace all "|" values with to translated code
+            concept = {}
+            if system: concept["system"] = system
+            if version: concept["version"] = version
+            if tmp := prefix + code: concept["code"] = tmp
+            if not concept:
+                continue
+        match.append({"relationship": relationship, "concept": dict(concept), "source": source})
+    return match
+
+# chains of conceptMaps like conceptMapA -> conceptMapB -> conceptMapA -> ... are rejected when loading the conceptMaps
+def check_conceptMap_chains():
+    chained = {}
+    for keys, entries in conceptMap_index_table:
+        for entry in entries:
+            if keys[5] in ("|", "~", "#") and entry["concept"]["code"].startswith("#"):
+                chained.setdefault(keys[0], set()).add(entry["concept"]["code"][1:])
+    checked = set()
+    def check(url, path):
+        if url in path:
+            raise BaseException('The conceptMaps are chained in a cycle: ' + ' -> '.join(path[path.index(url):] + [url]))
+        if url in checked:
+            return
+        for chained_url in sorted(chained.get(url, ())):
+            check(chained_url, path + [url])
+        checked.add(url)
+    for url in chained:
+        check(url, [])
+
+# loading of the conceptMaps from the conceptmap blocks of FHIR mapping language files (.map)
+# or from FHIR ConceptMap resources and Bundles of them (.json, .xml)
+# the compiled conceptMap index is written to a versioned cache per set of sources, later runs with unchanged sources
+# only unpickle it; the conceptMaps are loaded on the first translation (or by load_conceptMaps), not on import
+conceptMap_cache_format = 2
+conceptMap_default_sources = [os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'maps', map_file)
+                              for map_file in ('CdaToBundle.4.map', 'CdaToFhirTypes.4.map', 'CdaToMed.4.map')]
+conceptMap_cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '__pycache__')
+conceptMap_sources = []
+conceptMap_version = None
+conceptMaps_lock = threading.Lock()
+
+fml_tokens = re.compile(r'\s+|//[^\n]*|/\*.*?\*/|"((?:[^"\\]|\\.)*)"|(==|!=|<=|>=|[{}:=~-])|([^\s{}:="]+)', re.S)
+fml_relationships = {"==": "equivalent", "=": "equal", "!=": "not-related-to", "-": "not-related-to",
+                     "<=": "source-is-narrower-than-target", ">=": "source-is-broader-than-target", "~": "related-to"}
+fhir_equivalences = {"unmatched": "not-related-to", "disjoint": "not-related-to"}
+fhir_repeating_elements = {("Bundle", "entry"), ("ConceptMap", "group"), ("group", "element"), ("element", "target")}
+
+def conceptMap_cache_path(sources):
+    # the sources loaded with --conceptmaps get their own cache instead of replacing the one of the default sources
+    key = hashlib.sha256('\n'.join(sources).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(conceptMap_cache_dir, os.path.basename(__file__)[:-len('.py')] + '.conceptmaps.' + key + '.pickle')
+
+def ensure_conceptMaps():
+    # the default conceptMaps (or the segment of the parent process of a worker, see attach_conceptMap_segment) are
+    # loaded on first use, so that importing this module neither reads ../maps nor writes a cache
+    if conceptMap_version is None:
+        with conceptMaps_lock:
+            if conceptMap_version is None:
+                if os.environ.get(conceptMap_segment_env):
+                    attach_conceptMap_segment(os.environ[conceptMap_segment_env])
+                else:
+                    load_conceptMaps()
+
+def load_conceptMaps(sources=None, cache_path=None):
+    # cache_path None is the cache of the sources, False does not cache; a cache that cannot be written (e.g. of a
+    # read-only installation) is skipped
+    global conceptMap_version, conceptMap_segment
+    sources = [os.path.abspath(source) for source in (sources or conceptMap_default_sources)]
+    if cache_path is None:
+        cache_path = conceptMap_cache_path(sources)
+    try:
+        stamps = [(source, os.stat(source).st_mtime_ns, os.stat(source).st_size) for source in sources]
+    except OSError as e:
+        raise BaseException('ConceptMap source could not be read: ' + str(e))
+    cached = None
+    if cache_path:
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception:
+            cached = None
+    if cached and cached.get("format") == conceptMap_cache_format and cached.get("sources") == stamps:
+        conceptMap_segment = None
+        conceptMap_as_7dimension_dict.clear()
+        conceptMap_as_7dimension_dict.update(cached["conceptMaps"])
+        conceptMap_urls.clear()
+        conceptMap_urls.update(conceptMap_as_7dimension_dict)
+        conceptMap_index_table[:] = cached["table"]
+        conceptMap_reverse_table[:] = cached["reverse"]
+        conceptMap_index_masks.clear()
+        conceptMap_index_masks.update(cached["masks"])
+        conceptMap_fallback_table.clear()
+        conceptMap_fallback_table.update(cached["fallbacks"])
+        conceptMap_version = cached["version"]
+    else:
+        conceptMaps = {}
+        for source in sources:
+            for url, conceptMap in read_conceptMaps(source).items():
+                conceptMaps[url] = conceptMap
+        conceptMap_as_7dimension_dict.clear()
+        conceptMap_as_7dimension_dict.update(conceptMaps)
+        compile_conceptMap_index()
+        conceptMap_version = conceptMap_fingerprint()[:12]
+        if cache_path:
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                with open(cache_path + '.tmp', 'wb') as f:
+                    pickle.dump({"format": conceptMap_cache_format, "sources": stamps, "version": conceptMap_version,
+                                 "conceptMaps": conceptMap_as_7dimension_dict, "table": conceptMap_index_table, "reverse": conceptMap_reverse_table,
+                                 "masks": conceptMap_index_masks, "fallbacks": conceptMap_fallback_table}, f, pickle.HIGHEST_PROTOCOL)
+                os.replace(cache_path + '.tmp', cache_path)
+            except OSError:
+                pass
+    conceptMap_sources[:] = sources
+    clear_translations()
+
+def read_conceptMaps(source):
+    if source.endswith('.map'):
+        with open(source, encoding='utf-8') as f:
+            return parse_fml_conceptMaps(f.read())
+    elif source.endswith('.json'):
+        with open(source, encoding='utf-8') as f:
+            return fhir_conceptMaps_to_7dimension_dict(json.load(f))
+    elif source.endswith('.xml'):
+        return fhir_conceptMaps_to_7dimension_dict(fhir_xml_to_json(ElementTree.parse(source).getroot()))
+    else:
+        raise BaseException('Unknown conceptMap file ending: ' + source)
+
+def parse_fml_conceptMaps(text):
+    tokens = []
+    for token in fml_tokens.finditer(text):
+        if token.group(1) is not None:
+            tokens.append(("string", token.group(1)))
+        elif token.group(2) is not None:
+            tokens.append(("operator", token.group(2)))
+        elif token.group(3) is not None:
+            tokens.append(("name", token.group(3)))
+    conceptMaps = {}
+    i = 0
+    while i < len(tokens):
+        if tokens[i] != ("name", "conceptmap"):
+            i += 1
+            continue
+        url = tokens[i + 1][1]
+        if tokens[i + 2] != ("operator", "{"):
+            raise BaseException('Broken conceptmap "%s", "{" expected' % url)
+        i += 3
+        prefixes = {}
+        systems = conceptMaps.setdefault(url, {"%": {"%": {}}})["%"]["%"]
+        while i < len(tokens) and tokens[i] != ("operator", "}"):
+            if tokens[i] == ("name", "prefix"):
+                prefixes[tokens[i + 1][1]] = tokens[i + 3][1]
+                i += 4
+                continue
+            # s:"code" == t:"code"
+            source_prefix, _, source_code, relationship, target_prefix, _, target_code = [token[1] for token in tokens[i:i + 7]]
+            if source_prefix not in prefixes or target_prefix not in prefixes or relationship not in fml_relationships:
+                raise BaseException('Broken conceptmap "%s" at "%s"' % (url, ' '.join(token[1] for token in tokens[i:i + 7])))
+            systems.setdefault(prefixes[source_prefix], {}).setdefault(prefixes[target_prefix], {}).setdefault(source_code, []).append(
+                {"relationship": fml_relationships[relationship],
+                 "concept": {"system": prefixes[target_prefix], "code": target_code},
+                 "source": url})
+            i += 7
+        i += 1
+    return conceptMaps
+
+def fhir_xml_to_json(element):
+    resource = {"resourceType": element.tag.split('}')[-1]}
+    parent = resource["resourceType"]
+    for child in element:
+        if not isinstance(child.tag, str):
+            continue
+        name = child.tag.split('}')[-1]
+        if name == "resource":
+            value = fhir_xml_to_json(child[0])
+        elif len(child):
+            value = fhir_xml_to_json(child)
+            del value["resourceType"]
+        else:
+            value = child.get("value")
+        if (parent, name) in fhir_repeating_elements:
+            resource.setdefault(name, []).append(value)
+        else:
+            resource[name] = value
+    return resource
+
+def fhir_conceptMaps_to_7dimension_dict(resource):
+    if resource.get("resourceType") == "Bundle":
+        resources = [entry["resource"] for entry in resource.get("entry", []) if "resource" in entry]
+    elif resource.get("resourceType") == "ConceptMap":
+        resources = [resource]
+    else:
+        raise BaseException('Neither a ConceptMap nor a Bundle of ConceptMaps: ' + str(resource.get("resourceType")))
+    # the conceptMaps are called by their name from the mapping, other-map references by their canonical url
+    urls = {}
+    for conceptMap in resources:
+        if conceptMap.get("url"):
+            urls[conceptMap["url"]] = conceptMap.get("name") or conceptMap["url"]
+    conceptMaps = {}
+    for conceptMap in resources:
+        if conceptMap.get("resourceType") != "ConceptMap":
+            continue
+        url = conceptMap.get("name") or conceptMap.get("url") or conceptMap.get("id")
+        source = conceptMap.get("sourceUri") or conceptMap.get("sourceCanonical") or conceptMap.get("sourceScopeUri") or conceptMap.get("sourceScopeCanonical") or "%"
+        target = conceptMap.get("targetUri") or conceptMap.get("targetCanonical") or conceptMap.get("targetScopeUri") or conceptMap.get("targetScopeCanonical") or "%"
+        targets = conceptMaps.setdefault(url, {}).setdefault(source, {}).setdefault(target, {})
+        for group in conceptMap.get("group", []):
+            codes = targets.setdefault(group.get("source") or "%", {}).setdefault(group.get("target") or "%", {})
+            for element in group.get("element", []):
+                for element_target in element.get("target", []):
+                    concept = {}
+                    if group.get("target"): concept["system"] = group["target"]
+                    if group.get("targetVersion"): concept["version"] = group["targetVersion"]
+                    if element_target.get("code"): concept["code"] = element_target["code"]
+                    if element_target.get("display"): concept["display"] = element_target["display"]
+                    relationship = element_target.get("relationship") or element_target.get("equivalence") or "equivalent"
+                    codes.setdefault(element.get("code") or "%", []).append(
+                        {"relationship": fhir_equivalences.get(relationship, relationship), "concept": concept, "source": url})
+            unmapped = group.get("unmapped")
+            if unmapped:
+                mode = unmapped.get("mode")
+                if mode in ("provided", "use-source-code"):
+                    codes.setdefault("|", []).append({"relationship": "equivalent", "concept": {"code": "|"}, "source": url})
+                elif mode == "fixed":
+                    concept = {"code": "~" + (unmapped.get("code") or "")}
+                    if group.get("target"): concept["system"] = group["target"]
+                    if unmapped.get("display"): concept["display"] = unmapped["display"]
+                    codes.setdefault("~", []).append({"relationship": unmapped.get("relationship") or "equivalent", "concept": concept, "source": url})
+                elif mode == "other-map":
+                    other_map = unmapped.get("url") or unmapped.get("otherMap") or ""
+                    codes.setdefault("#", []).append({"relationship": "equivalent", "concept": {"code": "#" + urls.get(other_map, other_map)}, "source": url})
+    return conceptMaps
+
+# for multi-process workers the compiled conceptMap index is written to a read-only memory-mapped segment,
+# which all workers attach to instead of loading their own copy of the conceptMaps (see attach_conceptMap_segment)
+# the prebuilt masks are stored as hash tables with buckets of (offset, length), pointing to the JSON encoded
+# [index_key, [[position, entries], ...]] pairs, which are decoded on lookup only
+# all offsets are relative to the body, which follows the magic, the header length and the JSON header
+conceptMap_segment_magic = b'CMSEG\x00\x00\x01'
+conceptMap_segment_env = 'CDA2FHIR_CONCEPTMAP_SEGMENT'
+
+class MappedConceptMapIndex:
+    def __init__(self, segment, body, offset, buckets):
+        self.segment = segment
+        self.body = body
+        self.offset = offset
+        self.buckets = buckets
+
+    def get(self, index_key, default=None):
+        index_key = list(index_key)
+        key = json.dumps(index_key, separators=(',', ':')).encode('utf-8')
+        offset, length = struct.unpack_from('<II', self.segment, self.body + self.offset + 8 * (zlib.crc32(key) % self.buckets))
+        if length:
+            for one_key, value in json.loads(self.segment[self.body + offset:self.body + offset + length]):
+                if one_key == index_key:
+                    return value
+        return default
+
+class ConceptMapSegment:
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.segment = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.segment[:8] != conceptMap_segment_magic:
+            raise BaseException('Not a conceptMap segment: ' + path)
+        header_length, = struct.unpack_from('<I', self.segment, 8)
+        self.header = json.loads(self.segment[12:12 + header_length])
+        self.body = 12 + header_length
+        self.masks = {(tuple(one_mask["mask"]), one_mask["unmapped_only"], one_mask["reverse"]):
+                      MappedConceptMapIndex(self.segment, self.body, one_mask["offset"], one_mask["buckets"]) for one_mask in self.header["masks"]}
+
+    def tables(self):
+        offset, length = self.header["tables"]
+        return pickle.loads(self.segment[self.body + offset:self.body + offset + length])
+
+def write_conceptMap_segment(path):
+    ensure_conceptMaps()
+    body = bytearray()
+    masks = []
+    for (mask, unmapped_only, reverse), index in conceptMap_index_masks.items():
+        if not isinstance(index, dict):
+            continue
+        buckets = max(1, 2 * len(index))
+        records = [[] for _ in range(buckets)]
+        for index_key, value in index.items():
+            key = json.dumps(list(index_key), separators=(',', ':')).encode('utf-8')
+            records[zlib.crc32(key) % buckets].append([list(index_key), value])
+        offset = len(body)
+        body += bytes(8 * buckets)
+        for bucket, bucket_records in enumerate(records):
+            if bucket_records:
+                record = json.dumps(bucket_records, separators=(',', ':')).encode('utf-8')
+                struct.pack_into('<II', body, offset + 8 * bucket, len(body), len(record))
+                body += record
+        masks.append({"mask": list(mask), "unmapped_only": unmapped_only, "reverse": reverse, "offset": offset, "buckets": buckets})
+    tables = pickle.dumps((conceptMap_index_table, conceptMap_reverse_table), pickle.HIGHEST_PROTOCOL)
+    header = json.dumps({"version": conceptMap_version, "sources": conceptMap_sources, "urls": sorted(conceptMap_urls),
+                         "masks": masks, "tables": [len(body), len(tables)]}).encode('utf-8')
+    with open(path + '.tmp', 'wb') as f:
+        f.write(conceptMap_segment_magic + struct.pack('<I', len(header)) + header + body + tables)
+    os.replace(path + '.tmp', path)
+
+def attach_conceptMap_segment(path):
+    global conceptMap_version, conceptMap_segment
+    segment = ConceptMapSegment(path)
+    conceptMap_as_7dimension_dict.clear()
+    conceptMap_urls.clear()
+    conceptMap_urls.update(segment.header["urls"])
+    conceptMap_index_table.clear()
+    conceptMap_reverse_table.clear()
+    conceptMap_index_masks.clear()
+    conceptMap_index_masks.update(segment.masks)
+    conceptMap_fallback_table.clear()
+    conceptMap_sources[:] = segment.header["sources"]
+    conceptMap_version = segment.header["version"]
+    conceptMap_segment = segment
+    clear_translations()
+
+# the resource attributes of the ResourceContainer, in the order unpack_container checks them
+resource_container_types = (
+    'Account', 'ActivityDefinition', 'AdministrableProductDefinition', 'AdverseEvent',
+    'AllergyIntolerance', 'Appointment', 'AppointmentResponse', 'AuditEvent', 'Basic', 'Binary',
+    'BiologicallyDerivedProduct', 'BodyStructure', 'Bundle', 'CapabilityStatement', 'CarePlan',
+    'CareTeam', 'CatalogEntry', 'ChargeItem', 'ChargeItemDefinition', 'Citation', 'Claim',
+    'ClaimResponse', 'ClinicalImpression', 'ClinicalUseDefinition', 'CodeSystem', 'Communication',
+    'CommunicationRequest', 'CompartmentDefinition', 'Composition', 'ConceptMap', 'Condition',
+    'Consent', 'Contract', 'Coverage', 'CoverageEligibilityRequest', 'CoverageEligibilityResponse',
+    'DetectedIssue', 'Device', 'DeviceDefinition', 'DeviceMetric', 'DeviceRequest',
+    'DeviceUseStatement', 'DiagnosticReport', 'DocumentManifest', 'DocumentReference', 'Encounter',
+    'Endpoint', 'EnrollmentRequest', 'EnrollmentResponse', 'EpisodeOfCare', 'EventDefinition',
+    'Evidence', 'EvidenceReport', 'EvidenceVariable', 'ExampleScenario', 'ExplanationOfBenefit',
+    'FamilyMemberHistory', 'Flag', 'Goal', 'GraphDefinition', 'Group', 'GuidanceResponse',
+    'HealthcareService', 'ImagingStudy', 'Immunization', 'ImmunizationEvaluation',
+    'ImmunizationRecommendation', 'ImplementationGuide', 'Ingredient', 'InsurancePlan', 'Invoice',
+    'Library', 'Linkage', 'List', 'Location', 'ManufacturedItemDefinition', 'Measure',
+    'MeasureReport', 'Media', 'Medication', 'MedicationAdministration', 'MedicationDispense',
+    'MedicationKnowledge', 'MedicationRequest', 'MedicationStatement',
+    'MedicinalProductDefinition', 'MessageDefinition', 'MessageHeader', 'MolecularSequence',
+    'NamingSystem', 'NutritionOrder', 'NutritionProduct', 'Observation', 'ObservationDefinition',
+    'OperationDefinition', 'OperationOutcome', 'Organization', 'OrganizationAffiliation',
+    'PackagedProductDefinition', 'Patient', 'PaymentNotice', 'PaymentReconciliation', 'Person',
+    'PlanDefinition', 'Practitioner', 'PractitionerRole', 'Procedure', 'Provenance',
+    'Questionnaire', 'QuestionnaireResponse', 'RegulatedAuthorization', 'RelatedPerson',
+    'RequestGroup', 'ResearchDefinition', 'ResearchElementDefinition', 'ResearchStudy',
+    'ResearchSubject', 'RiskAssessment', 'Schedule', 'SearchParameter', 'ServiceRequest', 'Slot',
+    'Specimen', 'SpecimenDefinition', 'StructureDefinition', 'StructureMap', 'Subscription',
+    'SubscriptionStatus', 'SubscriptionTopic', 'Substance', 'SubstanceDefinition',
+    'SupplyDelivery', 'SupplyRequest', 'Task', 'TerminologyCapabilities', 'TestReport',
+    'TestScript', 'ValueSet', 'VerificationResult', 'VisionPrescription', 'Parameters',
+)
+
+def make_resource_container(resource_type, resource):
+    # the resource type is recorded on the container, so that unpack_container does not need to search for it
+    resource_container = malac.models.fhir.r4.ResourceContainer(**{resource_type: resource})
+    resource_container.resource_type_ = resource_type
+    return resource_container
+
+def container_resource_type(resource_container):
+    resource_type = getattr(resource_container, 'resource_type_', None)
+    if resource_type is None or getattr(resource_container, resource_type) is None:
+        # containers not made by make_resource_container (e.g. parsed ones) are searched once and then tagged
+        resource_type = next((resource_type for resource_type in resource_container_types if getattr(resource_container, resource_type) is not None), None)
+        resource_container.resource_type_ = resource_type
+    return resource_type
+
+def unpack_container(resource_container):
+    if resource_container is None:
+        return None
+    resource_type = container_resource_type(resource_container)
+    if resource_type is None:
+        return None
+    return getattr(resource_container, resource_type)
+
+def iter_bundle_resources(fhir_bundle):
+    # yields (resource type, resource) for all entries of the bundle with a resource
+    for fhir_bundle_entry in fhir_bundle.entry:
+        resource_container = fhir_bundle_entry.resource
+        if resource_container is not None:
+            resource_type = container_resource_type(resource_container)
+            if resource_type is not None:
+                yield resource_type, getattr(resource_container, resource_type)
+
+class BundleIndex:
+    # the entries of a bundle by fullUrl and by resource type, maintained while the map adds them, so that passes over the
+    # bundle resolve a urn:uuid reference without scanning the entries
+    def __init__(self):
+        self.by_fullUrl = {}
+        self.by_resource_type = {}
+
+    def add(self, fhir_bundle_entry):
+        self.by_fullUrl[fhir_bundle_entry.fullUrl.value] = fhir_bundle_entry
+        self.by_resource_type.setdefault(container_resource_type(fhir_bundle_entry.resource), []).append(fhir_bundle_entry)
+
+    def remove(self, fhir_bundle_entry):
+        self.by_fullUrl.pop(fhir_bundle_entry.fullUrl.value, None)
+        entries = self.by_resource_type.get(container_resource_type(fhir_bundle_entry.resource), [])
+        if fhir_bundle_entry in entries:
+            entries.remove(fhir_bundle_entry)
+
+    def entry(self, fullUrl):
+        return self.by_fullUrl.get(fullUrl)
+
+    def entries(self, resource_type):
+        return self.by_resource_type.get(resource_type, [])
+
+    def resolve(self, fhir_reference):
+        # the resource a Reference (or reference string) of the bundle points to, None if it is not in the bundle
+        reference = fhir_reference if isinstance(fhir_reference, str) else (fhir_reference.reference.value if fhir_reference is not None and fhir_reference.reference is not None else None)
+        fhir_bundle_entry = self.by_fullUrl.get(reference)
+        return unpack_container(fhir_bundle_entry.resource) if fhir_bundle_entry is not None else None
+
+def bundle_index(fhir_bundle):
+    # the index of the entries of the bundle, kept on the bundle like the resource type on the ResourceContainer; a bundle
+    # built elsewhere is indexed with one scan on first use
+    index = getattr(fhir_bundle, 'index_', None)
+    if index is None:
+        index = fhir_bundle.index_ = BundleIndex()
+        for fhir_bundle_entry in fhir_bundle.entry:
+            if fhir_bundle_entry.fullUrl is not None and fhir_bundle_entry.resource is not None:
+                index.add(fhir_bundle_entry)
+    return index
+
+def index_bundle_entry(fhir_bundle, fhir_bundle_entry):
+    if getattr(fhir_bundle, 'index_', None) is None:
+        bundle_index(fhir_bundle)
+    else:
+        fhir_bundle.index_.add(fhir_bundle_entry)
+
+# called by the map once the fullUrl of an entry is set, the entry is added to the bundle (and its index) if the type of
+# its resource is selected (--resource-types)
+def add_bundle_entry(fhir_bundle, fhir_bundle_entry):
+    if not selected_resources(container_resource_type(fhir_bundle_entry.resource)):
+        return
+    fhir_bundle.entry.append(fhir_bundle_entry)
+    index_bundle_entry(fhir_bundle, fhir_bundle_entry)
+
+# side index of a parsed CDA document, built in one walk over the same elements as fhirpath descendants(): the templateId
+# roots and the (code, codeSystem) of every element, so that the routing of sections and entries are set lookups
+# the state of the document transformed by the current thread, set by start_document and reset by finish_document
+cda_documents = threading.local()
+
+element_attribute_names = {}
+
+def element_attributes(element_type):
+    if element_type not in element_attribute_names:
+        element_attribute_names[element_type] = tuple(inspect.get_annotations(element_type.__init__))
+    return element_attribute_names[element_type]
+
+element_member_sets = {}
+
+def element_members(element_type):
+    if element_type not in element_member_sets:
+        element_member_sets[element_type] = frozenset(element_attributes(element_type))
+    return element_member_sets[element_type]
+
+class CdaIndex:
+    no_templates = frozenset()
+    no_code = (None, None)
+
+    def __init__(self, document):
+        self.document = document
+        self.templates = {}
+        self.codes = {}
+        self.roots = {}
+        self.by_template = {}
+        self.section_kinds = {}
+        # the OIDs the map translates with OIDtoURI, the roots of the ids with extension and the codeSystems of the codes
+        self.oids = set()
+        queue = [document]
+        while queue:
+            element = queue.pop()
+            element_templates = getattr(element, 'templateId', None)
+            if element_templates:
+                templates = frozenset(template.root for template in element_templates if template.root is not None)
+                self.templates[id(element)] = templates
+                for root in templates:
+                    self.by_template.setdefault(root, []).append(element)
+            element_code = getattr(element, 'code', None)
+            if isinstance(element_code, malac.models.cda.at_ext.GeneratedsSuper):
+                self.codes[id(element)] = (getattr(element_code, 'code', None), getattr(element_code, 'codeSystem', None))
+            for name in element_attributes(type(element)):
+                value = getattr(element, name, None)
+                for child in (value if isinstance(value, list) else (value,)):
+                    if isinstance(child, malac.models.cda.at_ext.GeneratedsSuper):
+                        root = getattr(child, 'root', None)
+                        if root is not None:
+                            self.roots[root] = self.roots.get(root, 0) + 1
+                            if name != 'templateId' and getattr(child, 'extension', None) is not None:
+                                self.oids.add(root)
+                        codeSystem = getattr(child, 'codeSystem', None)
+                        if codeSystem:
+                            self.oids.add(codeSystem)
+                        queue.append(child)
+
+    def templateIds(self, element):
+        return self.templates.get(id(element), self.no_templates) if element is not None else self.no_templates
+
+    def code(self, element):
+        return self.codes.get(id(element), self.no_code) if element is not None else self.no_code
+
+    def has_template(self, element, *roots):
+        return not self.templateIds(element).isdisjoint(roots)
+
+    def has_code(self, element, code, codeSystem=None):
+        element_code, element_codeSystem = self.code(element)
+        return element_code == code and (codeSystem is None or element_codeSystem == codeSystem)
+
+    def root_count(self, root):
+        # how often an element with the root occurs below the document, e.g. a templateId or an id
+        return self.roots.get(root, 0)
+
+    def elements_with_template(self, root):
+        return self.by_template.get(root, [])
+
+# the kinds (the positions of the predicates in the table) a section of the document matches, classified once per
+# section, a section with several kinds is dispatched to each of them
+def section_kinds_of(section, kinds):
+    index = document_index()
+    key = (id(kinds), id(section))
+    matched = index.section_kinds.get(key)
+    if matched is None:
+        matched = index.section_kinds[key] = frozenset(kind for kind, predicate in enumerate(kinds) if predicate(section))
+    return matched
+
+def index_document(cda):
+    # the index of the document transformed by this thread, built once per document
+    index = getattr(cda_documents, 'current', None)
+    if index is None or index.document is not cda:
+        index = cda_documents.current = CdaIndex(cda)
+    return index
+
+def document_index():
+    return cda_documents.current
+
+class DocumentContext:
+    # the values derived from the header of the document, computed once per document (when first asked for) instead of
+    # once per result
+    def __init__(self, cda, resource_id_strategy='uuid4', shared_constants=False, resource_types=None):
+        self.cda = cda
+        self.index = index_document(cda)
+        # the resource types the bundle is restricted to, None for all
+        self.resource_types = frozenset(resource_types) if resource_types is not None else None
+        self.resource_id_strategy = resource_id_strategy
+        self.shared_constants = shared_constants
+        # the names the uuid5 resource ids were derived from, with the number of their occurrences
+        self.id_names = {}
+        # the Practitioner, PractitionerRole and Organization resources of the bundle by identity key, and how often each
+        # resource type was shared instead of added again
+        self.resources = {}
+        self.shared = {}
+
+    @cached_property
+    def service_event_performers(self):
+        cda_documentationOf = next(iter(self.cda.documentationOf or []), None)
+        cda_serviceEvent = cda_documentationOf.serviceEvent if cda_documentationOf is not None else None
+        return list(cda_serviceEvent.performer or []) if cda_serviceEvent else []
+
+    @cached_property
+    def organizer_issued(self):
+        # the issued instant of organizers without their own performer, [] if it is not set
+        return [self.instant_value(cda_performer.time) for cda_performer in self.service_event_performers if cda_performer.time][-1:]
+
+    @cached_property
+    def observation_issued(self):
+        # the issued instant of observations without their own performer, [] if it is not set
+        return [self.instant_value(cda_legalAuthenticator.time) for cda_legalAuthenticator in self.cda.legalAuthenticator or []
+                if cda_legalAuthenticator.time and cda_legalAuthenticator.time.nullFlavor is None][-1:]
+
+    @staticmethod
+    def instant_value(cda_time):
+        fhir_instant = malac.models.fhir.r4.instant()
+        transform_default(cda_time, fhir_instant)
+        return fhir_instant.value
+
+    @cached_property
+    def oids_prefetched(self):
+        # the OIDs of the document the loaded conceptMaps miss, asked in one batch when the first of them is translated
+        return prefetch_translations('OIDtoURI', self.index.oids)
+
+    def selected(self, *resource_types):
+        # whether a group producing resources of one of the types has to be executed
+        return self.resource_types is None or not self.resource_types.isdisjoint(resource_types)
+
+    @cached_property
+    def id_namespace(self):
+        # the namespace of the name-based resource ids (--resource-ids uuid5) of the document
+        return uuid.uuid5(uuid.NAMESPACE_OID, document_identity(self.cda))
+
+    def resource_id(self, path, cda_element=None):
+        # the mapping path, with the ids of the source element if it has any, and the occurrence of the name in the document
+        name = path
+        ids = [(id_.root or '') + '^' + (id_.extension or '') for id_ in getattr(cda_element, 'id', None) or [] if id_.nullFlavor is None]
+        if ids:
+            name += '|' + '|'.join(ids)
+        occurrence = self.id_names.get(name, 0)
+        self.id_names[name] = occurrence + 1
+        if occurrence:
+            name += '#' + str(occurrence)
+        return str(uuid.uuid5(self.id_namespace, name))
+
+    def reference(self, fhir_resource):
+        # the urn:uuid reference to a resource of the bundle
+        if fhir_resource.id is None or fhir_resource.id.value is None:
+            raise BaseException('The %s has no id to be referenced by' % type(fhir_resource).__name__)
+        return 'urn:uuid:' + fhir_resource.id.value
+
+    def bundle_resource(self, fhir_bundle, resource_type, key):
+        # (resource, True) for a new entry of the bundle, (resource, False) if the resource with the key is already in it
+        fhir_resource = self.resources.get((resource_type, key))
+        if fhir_resource is not None:
+            self.shared[resource_type] = self.shared.get(resource_type, 0) + 1
+            return fhir_resource, False
+        fhir_bundle_entry = malac.models.fhir.r4.Bundle_Entry()
+        fhir_resource = getattr(malac.models.fhir.r4, resource_type)()
+        fhir_bundle_entry.resource = make_resource_container(resource_type, fhir_resource)
+        fhir_resource_id = string(value=resource_id(resource_type + '/' + repr(key)))
+        fhir_resource.id = fhir_resource_id
+        fhir_bundle_entry.fullUrl = uri(value=('urn:uuid:' + fhir_resource_id.value))
+        add_bundle_entry(fhir_bundle, fhir_bundle_entry)
+        self.resources[(resource_type, key)] = fhir_resource
+        return fhir_resource, True
+
+def document_context():
+    return cda_documents.context
+
+# the resource types of the persons and organizations behind authors, performers and the like, mapped together
+practitioner_resource_types = ('PractitionerRole', 'Practitioner', 'Organization')
+
+# whether one of the resource types is selected for the document (--resource-types), without a document context (e.g.
+# groups called directly) all of them are
+def selected_resources(*resource_types):
+    context = getattr(cda_documents, 'context', None)
+    return context is None or context.selected(*resource_types)
+
+cda_content_ignored = frozenset(('gds_collector_', 'gds_elementtree_node_', 'parent_object_', 'original_tagname_', 'ns_prefix_', 'mixedclass_', 'extensiontype_'))
+
+def cda_content(element):
+    # the content of a CDA element as a hashable value, without the parser bookkeeping
+    if isinstance(element, list):
+        return tuple(cda_content(item) for item in element)
+    if hasattr(element, '__dict__'):
+        return (type(element).__name__,) + tuple((name, cda_content(value)) for name, value in vars(element).items()
+                                                 if name not in cda_content_ignored and not name.endswith('_nsprefix_'))
+    return element
+
+def entity_key(cda_entity):
+    # the identity of a CDA entity (person or organization): its ids without nullFlavor or, if it has none, its content
+    if cda_entity is None:
+        return None
+    ids = tuple(sorted((id_.root or '', id_.extension or '') for id_ in cda_entity.id or [] if id_.nullFlavor is None))
+    return ids if ids else cda_content(cda_entity)
+
+def document_identity(cda):
+    # the id of the document, else its setId and versionNumber, else (e.g. for test documents without ids) its content
+    if cda.id is not None and cda.id.root:
+        return 'id|' + cda.id.root + '^' + (cda.id.extension or '')
+    if cda.setId is not None and cda.setId.root:
+        return 'setId|' + cda.setId.root + '^' + (cda.setId.extension or '') + '|' + str(cda.versionNumber.value if cda.versionNumber is not None else '')
+    return 'content|' + hashlib.sha256(repr(cda_content(cda)).encode('utf-8')).hexdigest()
+
+# the resource ids and fullUrls: random (uuid4, the default) or name-based and reproducible across runs (uuid5), the
+# strategy is chosen per document by start_document, without it (e.g. groups called directly) the ids are random
+resource_id_strategies = ('uuid4', 'uuid5')
+
+def resource_id(path, cda_element=None):
+    context = getattr(cda_documents, 'context', None)
+    if context is None or context.resource_id_strategy == 'uuid4':
+        return str(uuid.uuid4())
+    return context.resource_id(path, cda_element)
+
+# the resources of all documents shared instead of added again, per resource type, and the empty resources pruned
+shared_resources = {}
+pruned_resources = 0
+resource_counts_lock = threading.Lock()
+
+# the values (e.g. of an observation) by their type, in one pass over them, for the dispatch of the map per type
+def values_by_type(values):
+    by_type = {}
+    for value in values or []:
+        by_type.setdefault(type(value), []).append(value)
+    return by_type
+
+# whether one of the values (e.g. of an observation) is the code of the codeSystem
+def has_value_code(values, code, codeSystem):
+    return any(getattr(value, 'code', None) == code and getattr(value, 'codeSystem', None) == codeSystem for value in values or [])
+
+# opt-in flyweight mode (--shared-constants), the constant primitives and codings of the map are interned and shared
+# across resources and documents as frozen instances, changing one needs a copy from writable (copy on write); it is
+# switched on per document by start_document, without it (e.g. groups called directly) the constants are fresh
+constant_pool = {}
+frozen_types = {}
+
+class FrozenConstant:
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError('%s is a shared constant, change the copy from writable() instead' % self.mutable_type_.__name__)
+
+def frozen_type(datatype):
+    if datatype not in frozen_types:
+        frozen_types[datatype] = type(datatype.__name__, (FrozenConstant, datatype), {'mutable_type_': datatype})
+    return frozen_types[datatype]
+
+def freeze(obj):
+    # the lists (e.g. extension) become tuples, so that they cannot be appended to either
+    frozen = frozen_type(type(obj)).__new__(frozen_type(type(obj)))
+    frozen.__dict__.update((name, tuple(value) if isinstance(value, list) else value) for name, value in vars(obj).items())
+    return frozen
+
+def thaw(obj):
+    mutable = obj.mutable_type_.__new__(obj.mutable_type_)
+    mutable.__dict__.update((name, list(value) if isinstance(value, tuple) else value) for name, value in vars(obj).items())
+    return mutable
+
+def constants_shared():
+    context = getattr(cda_documents, 'context', None)
+    return context is not None and context.shared_constants
+
+def constant(datatype, value):
+    if not constants_shared():
+        return datatype(value=value)
+    key = (datatype, value)
+    shared = constant_pool.get(key)
+    if shared is None:
+        shared = constant_pool[key] = freeze(datatype(value=value))
+    return shared
+
+def constant_coding(system, code):
+    if not constants_shared():
+        return malac.models.fhir.r4.Coding(system=uri(value=system), code=string(value=code))
+    key = (malac.models.fhir.r4.Coding, system, code)
+    shared = constant_pool.get(key)
+    if shared is None:
+        shared = constant_pool[key] = freeze(malac.models.fhir.r4.Coding(system=constant(uri, system), code=constant(string, code)))
+    return shared
+
+def writable(parent, name, index=None):
+    # the element of the parent to be changed, a shared constant is replaced by a mutable copy of it before
+    value = getattr(parent, name) if index is None else getattr(parent, name)[index]
+    if isinstance(value, FrozenConstant):
+        value = thaw(value)
+        if index is None:
+            setattr(parent, name, value)
+        else:
+            getattr(parent, name)[index] = value
+    return value
+
+# the pruning of the empty elements the map creates unconditionally and fills only if a condition holds (e.g. an empty
+# Meta, CodeableConcept or ContactPoint), and of the resources left empty (e.g. the Media of a Beilagen section without
+# observationMedia) with the references to them; done by finish_document unless --keep-empty
+primitive_members = frozenset(('id', 'extension', 'value'))
+primitive_types = {}
+# the value[x] members of Extension, an extension needs one of them or sub-extensions (FHIR ext-1)
+extension_value_members = None
+
+def is_empty(value):
+    return value is None or value == '' or (isinstance(value, list) and not value)
+
+def prune_element(element, removed_fullUrls):
+    # drops the empty members of the element in place, bottom up, and tells whether the element is empty itself; a
+    # Reference to a removed resource counts as empty, an Extension with nothing but its url too (its value may have been
+    # pruned, e.g. the valueAddress of a patient-birthPlace), shared constants are never empty
+    global extension_value_members
+    element_type = element.__class__
+    primitive = primitive_types.get(element_type)
+    if primitive is None:
+        primitive = primitive_types[element_type] = element_members(element_type) == primitive_members
+    if primitive and not element.extension:
+        # most elements are primitives, e.g. string
+        return element.id is None and (element.value is None or element.value == '')
+    if isinstance(element, FrozenConstant):
+        return False
+    if element_type is malac.models.fhir.r4.Reference and element.reference is not None and element.reference.value in removed_fullUrls:
+        return True
+    members = element_members(element_type)
+    empty = True
+    # only the members set are looked at, most of the (up to a hundred) members of an element are None or [] (the raw
+    # members of composite elements, e.g. Extension.url, are strings, for them an empty one is not set either)
+    for name, value in [(name, value) for name, value in element.__dict__.items() if value]:
+        if name not in members:
+            continue
+        if value.__class__ is list:
+            kept = [item for item in value if not (isinstance(item, malac.models.fhir.r4.GeneratedsSuper) and prune_element(item, removed_fullUrls))]
+            if len(kept) != len(value):
+                value[:] = kept
+            empty = empty and not kept
+        elif isinstance(value, malac.models.fhir.r4.GeneratedsSuper):
+            if prune_element(value, removed_fullUrls):
+                setattr(element, name, None)
+            else:
+                empty = False
+        else:
+            empty = False
+    if element_type is malac.models.fhir.r4.Extension:
+        if extension_value_members is None:
+            extension_value_members = tuple(name for name in element_members(element_type) if name.startswith('value'))
+        return not element.extension and all(getattr(element, name) is None for name in extension_value_members)
+    # the xhtml of a Narrative is mixed content
+    return empty and not getattr(element, 'content_', None) and not getattr(element, 'valueOf_', None)
+
+def resource_is_empty(fhir_resource):
+    members = element_members(fhir_resource.__class__)
+    return not any(name in members and name not in ('id', 'meta') and not is_empty(value) for name, value in vars(fhir_resource).items())
+
+def prune_bundle(fhir_bundle):
+    # drops the empty elements of the resources, then the resources with nothing but an id and meta together with the
+    # references to them, until nothing is left to drop (one more pass per removal), the number of removed resources
+    index = bundle_index(fhir_bundle)
+    removed_fullUrls = set()
+    removed_count = 0
+    while True:
+        removed_entries = []
+        for fhir_bundle_entry in fhir_bundle.entry:
+            fhir_resource = unpack_container(fhir_bundle_entry.resource)
+            if fhir_resource is None:
+                continue
+            prune_element(fhir_resource, removed_fullUrls)
+            if resource_is_empty(fhir_resource):
+                removed_entries.append(fhir_bundle_entry)
+        if not removed_entries:
+            return removed_count
+        for fhir_bundle_entry in removed_entries:
+            removed_fullUrls.add(fhir_bundle_entry.fullUrl.value)
+            index.remove(fhir_bundle_entry)
+        fhir_bundle.entry[:] = [fhir_bundle_entry for fhir_bundle_entry in fhir_bundle.entry if fhir_bundle_entry.fullUrl is None or fhir_bundle_entry.fullUrl.value not in removed_fullUrls]
+        removed_count += len(removed_entries)
+
+def drop_references(element, fullUrls, dropped):
+    # drops the urn:uuid references to resources not in the bundle in place (collected in dropped), together with the
+    # extensions whose value they were (FHIR ext-1), and tells whether the element is such a reference or extension
+    # itself, everything else is left to prune_element
+    element_type = element.__class__
+    if element_type is malac.models.fhir.r4.Reference:
+        if element.reference is not None and element.reference.value and element.reference.value.startswith('urn:uuid:') and element.reference.value not in fullUrls:
+            dropped.append(element)
+            return True
+        return False
+    primitive = primitive_types.get(element_type)
+    if primitive is None:
+        primitive = primitive_types[element_type] = element_members(element_type) == primitive_members
+    if primitive or isinstance(element, FrozenConstant):
+        return False
+    members = element_members(element_type)
+    value_dropped = False
+    for name, value in [(name, value) for name, value in element.__dict__.items() if value]:
+        if name not in members:
+            continue
+        if value.__class__ is list:
+            kept = [item for item in value if not (isinstance(item, malac.models.fhir.r4.GeneratedsSuper) and drop_references(item, fullUrls, dropped))]
+            if len(kept) != len(value):
+                value[:] = kept
+        elif isinstance(value, malac.models.fhir.r4.GeneratedsSuper) and drop_references(value, fullUrls, dropped):
+            setattr(element, name, None)
+            value_dropped = True
+    return value_dropped and element_type is malac.models.fhir.r4.Extension and element.valueReference is None and not element.extension
+
+def select_resources(fhir_bundle):
+    # drops the references to the resources of the types not selected, whose entries the map did not add; the bundle is no
+    # document but a collection without its Composition or if resources the Composition references are not selected (a
+    # document includes them)
+    index = bundle_index(fhir_bundle)
+    document = bool(index.entries('Composition'))
+    for fhir_bundle_entry in fhir_bundle.entry:
+        fhir_resource = unpack_container(fhir_bundle_entry.resource)
+        if fhir_resource is None:
+            continue
+        dropped = []
+        drop_references(fhir_resource, index.by_fullUrl, dropped)
+        if dropped and isinstance(fhir_resource, malac.models.fhir.r4.Composition):
+            document = False
+    if not document:
+        fhir_bundle.type_ = constant(string, 'collection')
+
+# the default maps of the compiled map, registered by it with register_default_types_maps
+registered_default_types_maps = {}
+registered_default_types_maps_plus = {}
+
+def register_default_types_maps(maps, maps_plus):
+    registered_default_types_maps.update(maps)
+    registered_default_types_maps_plus.update(maps_plus)
+    default_types_maps_resolved.clear()
+
+# the default map resolved per (source type, target type) along the full MRO of the source type,
+# None for pairs without a default map, so that they fail fast (clear it when changing the default maps)
+default_types_maps_resolved = {}
+
+def resolve_default_map(source_type, target_type):
+    for one_type in source_type.__mro__:
+        default_map = registered_default_types_maps.get((one_type, target_type))
+        if default_map:
+            return default_map
+    for one_type in source_type.__mro__:
+        default_map_plus = registered_default_types_maps_plus.get(one_type)
+        if default_map_plus:
+            return default_map_plus
+    return None
+
+def transform_default(source, target, target_type=None):
+    target_type = target_type or type(target)
+    key = (type(source), target_type)
+    try:
+        default_map = default_types_maps_resolved[key]
+    except KeyError:
+        default_map = default_types_maps_resolved[key] = resolve_default_map(*key)
+    if default_map is None:
+        raise BaseException('No default transform found for %s -> %s' % (type(source), target_type))
+    default_map(source, target)
+
+# the HL7 v3 TS grammar YYYY[MM[DD[HH[MM[SS[.S+]]]]]][+/-ZZZZ]
+ts_pattern = re.compile(r'(\d{4})(?:(\d{2})(?:(\d{2})(?:(\d{2})(?:(\d{2})(?:(\d{2})(\.\d+)?)?)?)?)?)?(?:([+-])(\d{2})(\d{2}))?')
+
+class ParsedTS:
+    # a TS as FHIR date (up to the day), as FHIR dateTime (in the precision and with the timezone of the source)
+    # and as datetime for FHIR instant (missing parts set to their minimum)
+    __slots__ = ('date', 'dateTime', 'instant')
+
+    def __init__(self, date, dateTime, instant):
+        self.date = date
+        self.dateTime = dateTime
+        self.instant = instant
+
+# the same timestamps repeat throughout a document (and often across the documents of a batch)
+@lru_cache(maxsize=1024)
+def parse_ts(value):
+    match = ts_pattern.fullmatch(value)
+    if match is None:
+        raise BaseException('The value "%s" is not a valid HL7 TS' % value)
+    year, month, day, hour, minute, second, fraction, sign, tz_hours, tz_minutes = match.groups()
+    tzinfo = None
+    if sign:
+        offset = timedelta(hours=int(tz_hours), minutes=int(tz_minutes))
+        tzinfo = timezone(-offset if sign == '-' else offset)
+    try:
+        instant = datetime(int(year), int(month or 1), int(day or 1), int(hour or 0), int(minute or 0), int(second or 0),
+                           int(fraction[1:7].ljust(6, '0')) if fraction else 0, tzinfo)
+    except ValueError as e:
+        raise BaseException('The value "%s" is not a valid HL7 TS: %s' % (value, e))
+    date = '-'.join(part for part in (year, month, day) if part)
+    dateTime = date
+    if hour:
+        # FHIR dateTime has no precision between the day and the second
+        dateTime += 'T%s:%s:%s%s' % (hour, minute or '00', second or '00', fraction or '')
+        if sign:
+            dateTime += '%s%s:%s' % (sign, tz_hours, tz_minutes)
+    return ParsedTS(date, dateTime, instant)
+
+# the identifier roots (II) matched against the patterns of the map, memoized per distinct root (the same roots repeat
+# on every resource of a document)
+@lru_cache(maxsize=4096)
+def root_fullmatch(pattern, root):
+    return re.fullmatch(pattern, root) is not None
+
+# the stripped texts of AD or PN parts, as the fhirpath get of their valueOf_ (without the empty ones)
+def part_texts(parts):
+    texts = []
+    for part in parts or []:
+        text = part.valueOf_
+        if text:
+            text = str(text).strip()
+            if text:
+                texts.append(text)
+    return texts
+
+# an extension with the url and the value (as string) per element, in one loop over the elements instead of the three
+# loops the map compiles to create, name and fill them
+def add_extensions(elements, url, value_name, value):
+    for element in elements:
+        extension = malac.models.fhir.r4.Extension()
+        element.extension.append(extension)
+        extension.url = url
+        setattr(extension, value_name, string(value=value))
+
+# memoized translation layer in front of translate_single and translate_multi
+# the cache holds the immutable matched concepts, the FHIR datatypes are built freshly for every call,
+# because they are attached to (and may be changed within) the resulting bundle
+class TranslationCache:
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, compute):
+        value = self.lookup(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def lookup(self, key):
+        # the cached value of the key (never None), None if it is not cached
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+        return None
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while self.maxsize is not None and len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "size": len(self.entries), "maxsize": self.maxsize}
+
+    # the persisted cache is only valid for the conceptMaps it was filled with
+    def save(self, path):
+        ensure_conceptMaps()
+        with self.lock:
+            entries = [[list(key), [dict(concept) for concept in value]] for key, value in self.entries.items()]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"conceptMaps": conceptMap_version, "entries": entries}, f)
+
+    def load(self, path):
+        ensure_conceptMaps()
+        try:
+            with open(path, encoding='utf-8') as f:
+                persisted = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if persisted.get("conceptMaps") != conceptMap_version:
+            return False
+        for key, value in persisted["entries"]:
+            self.put(tuple(key), freeze_concepts(value))
+        return True
+
+def conceptMap_fingerprint():
+    return hashlib.sha256(json.dumps(conceptMap_as_7dimension_dict, sort_keys=True).encode('utf-8')).hexdigest()
+
+def freeze_concepts(concepts):
+    return tuple(MappingProxyType(dict(concept)) for concept in concepts)
+
+translation_cache = TranslationCache()
+
+# the translation cache, for (re)loaded conceptMaps
+def clear_translations():
+    translation_cache.clear()
+
+def concept_to_coding(concept):
+    return malac.models.fhir.r4.Coding(system=(malac.models.fhir.r4.uri(value=concept['system']) if "system" in concept else None), 
+                                       version=(malac.models.fhir.r4.string(value=concept['version']) if "version" in concept else None), 
+                                       code=(malac.models.fhir.r4.string(value=concept['code']) if "code" in concept else None), 
+                                       display=(malac.models.fhir.r4.string(value=concept['display']) if "display" in  concept else None), 
+                                       userSelected=(malac.models.fhir.r4.string(value=concept['userSelected']) if "userSelected" in concept else None))
+
+# the exceptions of the conceptMaps are not cached, only the matches of the conceptMaps and the terminology server are
+def translate_unmapped(url, code):
+    if url == 'http://hl7.org/fhir/ConceptMap/special-oid2uri': return [{'uri': 'urn:oid:%s' % code}]
+    if url == 'OIDtoURI': return [{'code': 'urn:oid:%s' % code}]
+    if url == 'StructureMapGroupTypeMode': return [{'code': 'none'}]
+    if url == 'AllergyCategoryMap': return [{'code': None}]
+    raise BaseException('Code %s could not be mapped to any code in concept map %s and no exception defined' % (code, url))
+
+def translate_single_concepts(url, code):
+    trans_out = translate(url=url, code=code, silent=True)
+    matches = [match['concept'] for match in trans_out['match'] if match['relationship']=='equivalent' or match['relationship']=='equal']
+    # if there are mutliple 'equivalent' or 'equal' matches and CodeableConcept is not the output param, than throw an error
+    if len(matches) > 1:
+        raise BaseException("There are multiple 'equivalent' or 'equal' matches in the results of the translate and output type is not CodeableConcept!")
+    # no match in the loaded conceptMaps is cached as well, the terminology server and the unmapped exceptions are asked after it
+    return freeze_concepts(matches)
+
+# asks the terminology server in one batch for the codes of a document the loaded conceptMaps miss, translate_single
+# finds the answers in the cache of the terminology client instead of sending a request per code
+def prefetch_translations(url, codes):
+    unmatched = [code for code in codes if not translation_cache.get(('single', url, code), lambda: translate_single_concepts(url, code))]
+    if unmatched and terminology_client:
+        terminology_client.translate(url, unmatched)
+    return len(unmatched)
+
+def translate_single(url, code, out_type):
+    matches = translation_cache.get(('single', url, code), lambda: translate_single_concepts(url, code))
+    if not matches:
+        context = getattr(cda_documents, 'context', None)
+        if url == 'OIDtoURI' and terminology_client and context is not None:
+            context.oids_prefetched
+        matches = (terminology_client and terminology_client.translate(url, [code]).get(code)) or translate_unmapped(url=url, code=code)
+    if out_type == "Coding":
+        return concept_to_coding(matches[0])
+    else:
+        return matches[0][out_type]
+
+# translates a sequence of codes with one conceptMap, the results are in the order of the codes
+# and every distinct code is resolved only once, e.g. to translate all codes of a section or to warm up the
+# translation cache with the distinct codes of a batch of documents
+def translate_many(url, codes, out_type='code'):
+    concepts = {}
+    for code in codes:
+        if code not in concepts:
+            concepts[code] = translation_cache.get(('single', url, code), lambda: translate_single_concepts(url, code))
+    # the codes without a match in the loaded conceptMaps are sent as one batch to the terminology server
+    unmatched = [code for code, matches in concepts.items() if not matches]
+    if unmatched:
+        remote = terminology_client.translate(url, unmatched) if terminology_client else {}
+        for code in unmatched:
+            concepts[code] = remote.get(code) or translate_unmapped(url=url, code=code)
+    if out_type == "Coding":
+        return [concept_to_coding(concepts[code][0]) for code in codes]
+    else:
+        resolved = {code: matches[0][out_type] for code, matches in concepts.items()}
+        return [resolved[code] for code in codes]
+
+# optional client of a FHIR terminology server, asked with ConceptMap/$translate for codes not covered by the
+# loaded conceptMaps before the unmapped exceptions (e.g. urn:oid: for unknown OIDs) are applied
+# the lookups are sent as batch Bundles over pooled keep-alive connections and cached with a TTL (misses too) in a
+# bounded LRU cache, the expired entries are replaced when asked again or evicted as the least recently used
+# every document gets a strict time budget, once it is used up the server is not asked anymore for this document
+class TerminologyClient:
+    def __init__(self, base_url, ttl=3600, document_budget=2.0, batch_size=100, connections=4, cache_size=4096):
+        parsed = urllib.parse.urlsplit(base_url)
+        self.connection_type = http.client.HTTPSConnection if parsed.scheme == 'https' else http.client.HTTPConnection
+        self.netloc = parsed.netloc
+        self.path = parsed.path.rstrip('/') or '/'
+        self.ttl = ttl
+        self.document_budget = document_budget
+        self.batch_size = batch_size
+        self.pool = queue.LifoQueue(maxsize=connections)
+        self.cache = TranslationCache(maxsize=cache_size)
+        self.lock = threading.Lock()
+        self.document = threading.local()
+        self.requests = 0
+        self.timeouts = 0
+        self.skipped = 0
+
+    def start_document(self):
+        self.document.deadline = time.monotonic() + self.document_budget
+
+    def remaining(self):
+        deadline = getattr(self.document, 'deadline', None)
+        return self.document_budget if deadline is None else deadline - time.monotonic()
+
+    def translate(self, url, codes):
+        now = time.monotonic()
+        results = {}
+        missing = []
+        for code in codes:
+            cached = self.cache.lookup((url, code))
+            if cached and cached[0] > now:
+                results[code] = cached[1]
+            elif code not in missing:
+                missing.append(code)
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start:start + self.batch_size]
+            remaining = self.remaining()
+            if remaining <= 0:
+                with self.lock:
+                    self.skipped += len(missing) - start
+                break
+            translated = self.post_batch(url, batch, remaining)
+            if translated is None:
+                break
+            expires = time.monotonic() + self.ttl
+            for code in batch:
+                self.cache.put((url, code), (expires, translated.get(code, ())))
+            results.update(translated)
+        return {code: matches for code, matches in results.items() if matches}
+
+    def post_batch(self, url, codes, timeout):
+        bundle = {"resourceType": "Bundle", "type": "batch", "entry": [
+            {"request": {"method": "POST", "url": "ConceptMap/$translate"},
+             "resource": {"resourceType": "Parameters", "parameter": [{"name": "url", "valueUri": url}, {"name": "code", "valueCode": code}]}}
+            for code in codes]}
+        try:
+            connection = self.pool.get_nowait()
+        except queue.Empty:
+            connection = self.connection_type(self.netloc, timeout=timeout)
+        try:
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            else:
+                connection.timeout = timeout
+            with self.lock:
+                self.requests += 1
+            connection.request('POST', self.path, body=json.dumps(bundle),
+                               headers={"Content-Type": "application/fhir+json", "Accept": "application/fhir+json"})
+            response = connection.getresponse()
+            body = response.read()
+            if response.status != 200:
+                raise OSError('terminology server responded with status %s' % response.status)
+            entries = json.loads(body).get("entry", [])
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            connection.close()
+            if isinstance(e, socket.timeout):
+                with self.lock:
+                    self.timeouts += 1
+            print('   #WARNING# terminology server ' + self.netloc + ' not used for this document: ' + str(e))
+            self.document.deadline = 0
+            return None
+        try:
+            self.pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+        translated = {}
+        for code, entry in zip(codes, entries):
+            matches = []
+            for parameter in entry.get("resource", {}).get("parameter", []):
+                if parameter.get("name") != "match":
+                    continue
+                parts = {part.get("name"): part for part in parameter.get("part", [])}
+                relationship = (parts.get("relationship") or parts.get("equivalence") or {}).get("valueCode")
+                if relationship in ('equivalent', 'equal') and "concept" in parts:
+                    coding = parts["concept"].get("valueCoding", {})
+                    matches.append({key: coding[key] for key in ('system', 'version', 'code', 'display') if coding.get(key)})
+            translated[code] = freeze_concepts(matches)
+        return translated
+
+    def stats(self):
+        return {"requests": self.requests, "timeouts": self.timeouts, "skipped": self.skipped, "cached": self.cache.stats()["size"]}
+
+terminology_client = None
+
+def translate_multi_concepts(url, code):
+    trans_out = translate(url=url, code=code, silent=True)
+    return freeze_concepts(match['concept'] for match in trans_out['match'] if match['relationship']=='equivalent' or match['relationship']=='equal')
+
+def translate_multi(url, code):
+    matches = translation_cache.get(('multi', url, code), lambda: translate_multi_concepts(url, code))
+    return malac.models.fhir.r4.CodeableConcept(coding=[concept_to_coding(match) for match in matches])
+
+# the options of the transformation added to the compiled command line and transform(), with their defaults
+transform_option_defaults = {
+    'translation_cache_path': None,
+    'conceptmap_paths': None,
+    'terminology_server': None,
+    'terminology_budget': 2.0,
+    'shared_constants': False,
+    'resource_id_strategy': 'uuid4',
+    'keep_empty': False,
+    'resource_types': None,
+}
+
+def add_arguments(parser):
+    parser.add_argument(
+       '--translation-cache', dest='translation_cache_path', help='the file path the translation cache is loaded from and saved to, to keep it warm across runs'
+    )
+    parser.add_argument(
+       '--conceptmaps', dest='conceptmap_paths', nargs='+', help='the FHIR mapping language (.map) or FHIR ConceptMap (.json, .xml) files the conceptMaps are loaded from, instead of the maps this has been compiled from'
+    )
+    parser.add_argument(
+       '--terminology-server', help='the base URL of a FHIR terminology server asked with ConceptMap/$translate for codes not covered by the conceptMaps'
+    )
+    parser.add_argument(
+       '--terminology-budget', type=float, default=2.0, help='the time in seconds the terminology server may take per document, default 2.0'
+    )
+    parser.add_argument(
+       '--shared-constants', action='store_true', help='share the constant primitives and codings of the map as frozen instances across resources and documents'
+    )
+    parser.add_argument(
+       '--resource-ids', dest='resource_id_strategy', choices=resource_id_strategies, default='uuid4', help='random resource ids (uuid4, the default) or ids derived from the document id and the mapping path, the same in every run (uuid5)'
+    )
+    parser.add_argument(
+       '--keep-empty', action='store_true', help='keep the empty elements and resources the map creates, instead of pruning them before the bundle is written'
+    )
+    parser.add_argument(
+       '--resource-types', nargs='+', help='the FHIR resource types the bundle is restricted to, e.g. Observation Specimen, the groups of the map producing only other resources are skipped and the references to them dropped, default all'
+    )
+    return parser
+
+def transform_options(args):
+    return {name: getattr(args, name) for name in transform_option_defaults}
+
+# the options completed with their defaults
+def with_defaults(options):
+    unknown = sorted(set(options) - set(transform_option_defaults))
+    if unknown:
+        raise TypeError('unexpected options of the transformation: ' + ', '.join(unknown))
+    return dict(transform_option_defaults, **options)
+
+# called by transform() before the document is parsed, the options with their defaults are passed to finish_transform
+def start_transform(options):
+    global terminology_client
+    options = with_defaults(options)
+    if options['conceptmap_paths']:
+        load_conceptMaps(options['conceptmap_paths'])
+    ensure_conceptMaps()
+    print('conceptMaps in version '+conceptMap_version+' loaded from '+', '.join(conceptMap_sources))
+    if options['terminology_server']:
+        terminology_client = TerminologyClient(options['terminology_server'], document_budget=options['terminology_budget'])
+    if options['translation_cache_path']:
+        translation_cache.load(options['translation_cache_path'])
+    return options
+
+# called by transform() after the bundle is written
+def finish_transform(options):
+    if options['translation_cache_path']:
+        translation_cache.save(options['translation_cache_path'])
+    print('translation cache: '+', '.join(key+' '+str(value) for key, value in translation_cache.stats().items()))
+    if terminology_client:
+        print('terminology server: '+', '.join(key+' '+str(value) for key, value in terminology_client.stats().items()))
+    if shared_resources:
+        print('shared resources: '+', '.join(key+' '+str(value) for key, value in shared_resources.items()))
+    if pruned_resources:
+        print('pruned '+str(pruned_resources)+' empty resources')
+
+# the transformation of one document by a group of the map, called by transform() instead of the group (and by
+# benchmarks or other callers mapping documents with options), the options apply to this document only
+def transform_document(group, cda, fhir_bundle, **options):
+    options = start_document(cda, options)
+    group(cda, fhir_bundle)
+    finish_document(fhir_bundle, options)
+    return fhir_bundle
+
+def start_document(cda, options):
+    options = with_defaults(options)
+    ensure_conceptMaps()
+    # every document gets the time budget of the terminology server
+    if terminology_client:
+        terminology_client.start_document()
+    if options['resource_id_strategy'] not in resource_id_strategies:
+        raise BaseException('Unknown resource id strategy: ' + str(options['resource_id_strategy']))
+    unknown = sorted(set(options['resource_types'] or ()) - set(resource_container_types))
+    if unknown:
+        raise BaseException('Unknown resource types: ' + ', '.join(unknown))
+    cda_documents.context = DocumentContext(cda, options['resource_id_strategy'], options['shared_constants'], options['resource_types'])
+    return options
+
+# the version of the conceptMaps a bundle was transformed with, as a tag of the bundle: the code is the version, a hash of
+# the content of the loaded conceptMaps
+conceptMap_version_system = 'http://hl7.at/fhir/HL7ATCoreProfiles/4.0.1/CodeSystem/at-cda-to-bundle-conceptmap-version'
+
+def finish_document(fhir_bundle, options):
+    global pruned_resources
+    if options['resource_types'] is not None:
+        select_resources(fhir_bundle)
+    pruned = 0 if options['keep_empty'] else prune_bundle(fhir_bundle)
+    if fhir_bundle.meta is None:
+        fhir_bundle.meta = malac.models.fhir.r4.Meta()
+    fhir_bundle.meta.tag.append(malac.models.fhir.r4.Coding(system=uri(value=conceptMap_version_system), code=string(value=conceptMap_version)))
+    with resource_counts_lock:
+        for resource_type, count in cda_documents.context.shared.items():
+            shared_resources[resource_type] = shared_resources.get(resource_type, 0) + count
+        pruned_resources += pruned
+    cda_documents.context = None
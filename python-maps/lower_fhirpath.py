@@ -0,0 +1,279 @@
+import argparse
+import ast
+import inspect
+import typing
+import malac.models.cda.at_ext
+
+description_text = "Lowers the simple FHIRPath shapes of a map compiled by MaLaC-HD (attribute chains, equality filters, exists, and/or) to plain attribute access and short-circuit boolean logic, everything else is left to fhirpath_utils. Run it on the compiled map after MaLaC-HD, e.g. python python-maps/lower_fhirpath.py python-maps/CdaToBundle.4.py"
+
+def init_argparse() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=description_text)
+    parser.add_argument(
+       'source', help='the compiled map, it is rewritten in place unless a target is given'
+    )
+    parser.add_argument(
+       '-t', '--target', help='the file path the lowered map will be written to'
+    )
+    return parser
+
+# per attribute name of the CDA model, whether it is a list (None if that differs between the classes)
+def model_attributes(model=malac.models.cda.at_ext):
+    attributes = {}
+    for _, cls in inspect.getmembers(model, inspect.isclass):
+        if cls.__module__ != model.__name__:
+            continue
+        for name, annotation in inspect.get_annotations(cls.__init__).items():
+            is_list = typing.get_origin(annotation) is list
+            attributes[name] = is_list if attributes.get(name, is_list) == is_list else None
+    return attributes
+
+def is_call(node, owner, name):
+    return (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == name
+            and isinstance(node.func.value, ast.Name) and node.func.value.id == owner)
+
+def is_str(node):
+    return isinstance(node, ast.Constant) and isinstance(node.value, str)
+
+# an expression without side effects that can be evaluated repeatedly, a name or attributes of a name
+def is_plain(node):
+    while isinstance(node, ast.Attribute):
+        node = node.value
+    return isinstance(node, ast.Name)
+
+def grouped(expression):
+    return expression if expression.startswith('any(') else '(%s)' % expression
+
+# <node> == [True]
+def is_true_list_comparison(node):
+    return (isinstance(node, ast.Compare) and len(node.ops) == 1 and isinstance(node.ops[0], ast.Eq)
+            and isinstance(node.comparators[0], ast.List) and len(node.comparators[0].elts) == 1
+            and isinstance(node.comparators[0].elts[0], ast.Constant) and node.comparators[0].elts[0].value is True)
+
+class Collection:
+    def __init__(self, base, attributes, target=None, conditions=()):
+        self.base = base
+        self.attributes = attributes
+        self.target = target
+        self.conditions = conditions
+
+    # at most one element, so that it never raises in fhirpath.single() or the boolean operators
+    def single_valued(self):
+        return not any(is_list for _, is_list in self.attributes)
+
+class Lowering:
+    def __init__(self, source, attributes):
+        self.source = source
+        # the column offsets of ast are in UTF-8 bytes
+        self.data = source.encode('utf-8')
+        self.attributes = attributes
+        self.line_offsets = [0]
+        for line in self.data.splitlines(keepends=True):
+            self.line_offsets.append(self.line_offsets[-1] + len(line))
+        self.counter = 0
+        # the comprehension variables over elements of unknown type (e.g. of descendants()), their attributes are not lowered
+        self.untyped = set()
+        # the comprehension targets replaced by the attribute paths of their (single) element
+        self.substitutions = {}
+        self.lowered = 0
+
+    def offset(self, lineno, col):
+        return self.line_offsets[lineno - 1] + col
+
+    def segment(self, node):
+        return ast.get_source_segment(self.source, node)
+
+    def fresh(self):
+        self.counter += 1
+        return 'g%d' % self.counter
+
+    # the attribute chain of fhirpath_utils.get(base, 'a', 'b', ...) as (base node, [(attribute, is list)]), None if not lowerable
+    def chain(self, node):
+        if not is_call(node, 'fhirpath_utils', 'get') or node.keywords or len(node.args) < 2:
+            return None
+        base, names = node.args[0], node.args[1:]
+        if not all(is_str(name) for name in names):
+            return None
+        if isinstance(base, ast.Name) and base.id in self.untyped:
+            return None
+        attributes = [(name.value, self.attributes.get(name.value)) for name in names]
+        if any(is_list is None for _, is_list in attributes):
+            return None
+        return base, attributes
+
+    # a collection over a chain, optionally filtered, as Collection, None if not lowerable
+    # e.g. fhirpath_utils.get(x, 'a'), [v1 for v1 in fhirpath_utils.get(x, 'a') if ...] or [v2 for v1 in [x] for v2 in fhirpath_utils.get(v1, 'a')]
+    def collection(self, node):
+        chain = self.chain(node)
+        if chain:
+            return Collection(*chain)
+        if not isinstance(node, ast.ListComp) or not isinstance(node.elt, ast.Name) or node.generators[0].is_async:
+            return None
+        generators = node.generators
+        if len(generators) == 1 and isinstance(generators[0].target, ast.Name) and node.elt.id == generators[0].target.id:
+            chain = self.chain(generators[0].iter)
+            if chain:
+                return Collection(*chain, target=generators[0].target.id, conditions=generators[0].ifs)
+        if (len(generators) == 2 and isinstance(generators[0].iter, ast.List) and len(generators[0].iter.elts) == 1
+                and not generators[0].ifs and not generators[1].ifs
+                and isinstance(generators[0].target, ast.Name) and isinstance(generators[1].target, ast.Name)
+                and node.elt.id == generators[1].target.id):
+            chain = self.chain(generators[1].iter)
+            if chain and isinstance(chain[0], ast.Name) and chain[0].id == generators[0].target.id:
+                return Collection(generators[0].iter.elts[0], chain[1])
+        return None
+
+    # the comprehension clauses iterating over the collection, with the name of its element
+    def clauses(self, collection):
+        variable = self.fresh()
+        clauses = ['for %s in [%s] if %s is not None' % (variable, self.emit(collection.base), variable)]
+        for index, (name, is_list) in enumerate(collection.attributes):
+            previous = variable
+            variable = collection.target if collection.target and index == len(collection.attributes) - 1 else self.fresh()
+            if is_list:
+                clauses.append('for %s in %s.%s' % (variable, previous, name))
+            else:
+                clauses.append('for %s in [%s.%s] if %s' % (variable, previous, name, variable))
+        for condition in collection.conditions:
+            clauses.append('if %s' % self.condition(condition))
+        return ' '.join(clauses), variable
+
+    # a boolean whether the collection is not empty, with plain attribute access if it has at most one element
+    # and a base without side effects, e.g. x is not None and x.a and x.a.b (the element replaces the target in the conditions)
+    def exists(self, collection, comparison=None):
+        if collection.single_valued() and is_plain(collection.base):
+            path = self.emit(collection.base)
+            tests = ['%s is not None' % path]
+            for name, _ in collection.attributes:
+                path = '%s.%s' % (path, name)
+                tests.append(path)
+            if collection.target:
+                self.substitutions[collection.target] = path
+            tests.extend(self.condition(condition) for condition in collection.conditions)
+            self.substitutions.pop(collection.target, None)
+            if comparison:
+                tests.append('%s %s' % (path, comparison))
+            return ' and '.join(tests)
+        clauses, variable = self.clauses(collection)
+        return 'any(%s %s)' % ('%s %s' % (variable, comparison) if comparison else 'True', clauses)
+
+    def condition(self, node):
+        condition = self.emit(node)
+        return '(%s)' % condition if isinstance(node, (ast.BoolOp, ast.IfExp, ast.Lambda, ast.NamedExpr)) else condition
+
+    # fhirpath_utils.equals(<collection>, '==' or '!=', ['literal']) as (collection, comparison), None if not lowerable
+    def equality(self, node):
+        if not is_call(node, 'fhirpath_utils', 'equals') or len(node.args) != 3 or node.keywords:
+            return None
+        collection, operator, other = node.args
+        if not (is_str(operator) and operator.value in ('==', '!=') and isinstance(other, ast.List)
+                and len(other.elts) == 1 and is_str(other.elts[0])):
+            return None
+        collection = self.collection(collection)
+        if not collection or not collection.single_valued():
+            return None
+        return collection, '%s %s' % (operator.value, self.segment(other.elts[0]))
+
+    # a Python boolean for the node, None if not lowerable, in the mode
+    # 'test': the truthiness of the node (the test of an if), 'single': the truthiness of fhirpath.single() of the node,
+    # which is also how bool_and/bool_or take their operands, and 'true': whether the node equals [True]
+    def truth(self, node, mode):
+        if mode == 'test' and isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            operand = self.truth(node.operand, 'test')
+            return operand and 'not %s' % grouped(operand)
+        if mode == 'test' and is_call(node, 'fhirpath', 'single') and len(node.args) == 1:
+            return self.truth(node.args[0], 'single')
+        if mode == 'test' and is_true_list_comparison(node):
+            return self.truth(node.left, 'true')
+        if mode != 'test' and (is_call(node, 'fhirpath_utils', 'bool_and') or is_call(node, 'fhirpath_utils', 'bool_or')) and not node.keywords:
+            operands = [self.truth(operand, 'single') for operand in node.args]
+            if all(operands):
+                return grouped((' and ' if node.func.attr == 'bool_and' else ' or ').join(grouped(operand) for operand in operands))
+            return None
+        # [bool(<collection>)]
+        if (mode != 'test' and isinstance(node, ast.List) and len(node.elts) == 1 and isinstance(node.elts[0], ast.Call)
+                and isinstance(node.elts[0].func, ast.Name) and node.elts[0].func.id == 'bool' and len(node.elts[0].args) == 1):
+            collection = self.collection(node.elts[0].args[0])
+            return collection and self.exists(collection)
+        equality = self.equality(node)
+        if equality:
+            return self.exists(*equality) if mode != 'test' else self.exists(equality[0])
+        collection = self.collection(node)
+        # the elements of the chains are CDA elements, they are never True themselves
+        if collection and (mode == 'test' or mode == 'single' and collection.single_valued()):
+            return self.exists(collection)
+        return None
+
+    def emit(self, node):
+        if isinstance(node, ast.If):
+            truth = self.truth(node.test, 'test')
+            if truth is not None:
+                self.lowered += 1
+                return self.replace(node, {node.test: truth})
+            return self.replace(node, {})
+        # fhirpath.single(fhirpath_utils.get(x, 'valueOf_', strip=True))
+        if is_call(node, 'fhirpath', 'single') and len(node.args) == 1 and is_call(node.args[0], 'fhirpath_utils', 'get'):
+            get = node.args[0]
+            if (len(get.args) == 2 and isinstance(get.args[0], ast.Name) and get.args[0].id not in self.untyped
+                    and is_str(get.args[1]) and get.args[1].value == 'valueOf_'
+                    and [(keyword.arg, getattr(keyword.value, 'value', None)) for keyword in get.keywords] == [('strip', True)]):
+                self.lowered += 1
+                text = '%s.valueOf_' % get.args[0].id
+                return '(str(%s).strip() or None if %s else None)' % (text, text)
+        if isinstance(node, ast.Name) and node.id in self.substitutions:
+            return self.substitutions[node.id]
+        if is_true_list_comparison(node):
+            truth = self.truth(node.left, 'true')
+            if truth is not None:
+                self.lowered += 1
+                return grouped(truth)
+        equality = self.equality(node)
+        if equality:
+            self.lowered += 1
+            clauses, variable = self.clauses(equality[0])
+            return '[%s %s %s]' % (variable, equality[1], clauses)
+        collection = self.collection(node)
+        if collection:
+            self.lowered += 1
+            clauses, variable = self.clauses(collection)
+            return '[%s %s]' % (variable, clauses)
+        if isinstance(node, (ast.ListComp, ast.GeneratorExp, ast.SetComp, ast.DictComp)):
+            # the elements of other iterables (e.g. descendants()) have no known type
+            untyped = {target.id for generator in node.generators if not isinstance(generator.iter, ast.List)
+                       for target in ast.walk(generator.target) if isinstance(target, ast.Name)} - self.untyped
+            self.untyped |= untyped
+            emitted = self.replace(node, {})
+            self.untyped -= untyped
+            return emitted
+        return self.replace(node, {})
+
+    # the source of the node with its children emitted, the given children replaced by the given source
+    def replace(self, node, replacements):
+        start = self.offset(node.lineno, node.col_offset) if hasattr(node, 'lineno') else 0
+        end = self.offset(node.end_lineno, node.end_col_offset) if hasattr(node, 'lineno') else len(self.data)
+        parts, position = [], start
+        for child in ast.iter_child_nodes(node):
+            if not hasattr(child, 'lineno') or not hasattr(child, 'end_lineno') or child.end_lineno is None:
+                continue
+            child_start = self.offset(child.lineno, child.col_offset)
+            child_end = self.offset(child.end_lineno, child.end_col_offset)
+            if child_start < position:
+                continue
+            parts.append(self.data[position:child_start].decode('utf-8'))
+            parts.append(replacements[child] if child in replacements else self.emit(child))
+            position = child_end
+        parts.append(self.data[position:end].decode('utf-8'))
+        return ''.join(parts)
+
+def lower(source, attributes=None):
+    lowering = Lowering(source, model_attributes() if attributes is None else attributes)
+    return lowering.replace(ast.parse(source), {}), lowering.lowered
+
+if __name__ == "__main__":
+    parser = init_argparse()
+    args = parser.parse_args()
+    with open(args.source, encoding='utf-8') as f:
+        source = f.read()
+    lowered, count = lower(source)
+    with open(args.target or args.source, 'w', encoding='utf-8') as f:
+        f.write(lowered)
+    print('+++++++ %d FHIRPath expressions lowered to Python +++++++' % count)
@@ -0,0 +1,489 @@
+import argparse
+import ast
+import os
+import re
+import sys
+
+description_text = "Patches a map compiled by MaLaC-HD and lowered by lower_fhirpath.py to use the runtime (cda2fhir_runtime.py): the compiled definitions listed in replaced_definitions are dropped and imported from the runtime instead, and the generated code of the groups is rewritten by the rules to call the helpers of the runtime. A rule that does not apply fails the patch, so that a change of the map or of MaLaC-HD shows up instead of being skipped. Run it on the lowered map, e.g. python python-maps/patch_map.py python-maps/CdaToBundle.4.py"
+
+maps_dir = os.path.dirname(os.path.abspath(__file__))
+
+def init_argparse() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=description_text)
+    parser.add_argument(
+       'source', help='the lowered map, it is rewritten in place unless a target is given'
+    )
+    parser.add_argument(
+       '-t', '--target', help='the file path the patched map will be written to'
+    )
+    parser.add_argument(
+       '--runtime', default=os.path.join(maps_dir, 'cda2fhir_runtime.py'), help='the runtime module the map imports, default cda2fhir_runtime.py next to this script'
+    )
+    return parser
+
+runtime_import = '''
+# the runtime of the map, see cda2fhir_runtime.py
+if os.path.dirname(os.path.abspath(__file__)) not in sys.path:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import cda2fhir_runtime
+from cda2fhir_runtime import *
+'''
+
+# the top-level definitions of the compiled map the runtime replaces, they are dropped from the map, every other name
+# the runtime defines must not be compiled into the map (it would silently shadow the runtime)
+replaced_definitions = (
+    # the translation over the compiled conceptMap index, the conceptMaps are assigned to the dict of the runtime
+    'translate',
+    'conceptMap_as_7dimension_dict',
+    # the translations memoized in the translation cache, the exceptions of translate_unmapped are not
+    'translate_unmapped',
+    'translate_single',
+    'translate_multi',
+    # the default map resolved once per source and target type, from the default maps the map registers
+    'transform_default',
+    # the resource of a ResourceContainer looked up by the resource type recorded on it
+    'unpack_container',
+)
+
+# the modules the compiled map imports but does not use anymore once patched, e.g. dateutil (the TS are parsed by
+# parse_ts) and uuid (the ids are minted by resource_id), the patched map must not refer to them
+dropped_imports = (
+    'dateutil.parser',
+    'uuid',
+)
+
+# the dicts the compiled map fills item by item, the items are dropped from the map as the runtime fills the dicts itself
+# (the conceptMaps are loaded from the maps the map was compiled from, see load_conceptMaps)
+dropped_items = (
+    'conceptMap_as_7dimension_dict',
+)
+
+class Rule:
+    # a rewrite of the generated code of the top-level definitions (groups, transform, ...) of the map, to the runtime;
+    # it applies to the definitions named in groups (each of them has to match) or to all of them (one has to match),
+    # count is the number of matches expected per group or altogether, None for any number
+    # the replacement is a string or a function of the match, the name and the text of the definition
+    def __init__(self, description, pattern, replacement, groups=None, count=None):
+        self.description = description
+        self.pattern = re.compile(pattern, re.M) if isinstance(pattern, str) else pattern
+        self.replacement = replacement
+        self.groups = groups
+        self.count = count
+        self.matches = {}
+
+    def apply(self, name, text):
+        if self.groups is not None and name not in self.groups:
+            return text
+        if callable(self.replacement):
+            text, matches = self.pattern.subn(lambda match: self.replacement(match, name, text), text)
+        else:
+            text, matches = self.pattern.subn(self.replacement, text)
+        self.matches[name] = self.matches.get(name, 0) + matches
+        return text
+
+    def failures(self):
+        if self.groups is None:
+            matches = sum(self.matches.values())
+            if matches == 0 or self.count is not None and matches != self.count:
+                return ['%s: %d matches in the map, expected %s' % (self.description, matches, self.count or 'some')]
+            return []
+        return ['%s: %d matches in %s, expected %s' % (self.description, self.matches.get(group, 0), group, self.count or 'some')
+                for group in self.groups if self.matches.get(group, 0) == 0 or self.count is not None and self.matches[group] != self.count]
+
+# a compiled block of TELContactPoint mapping the telecom values of one URL scheme (scheme, offset of the value, system)
+telecom_scheme_block = re.compile(r"^    v = src\.value\n    if v:\n        if \(src\.value or ''\)\.startswith\('([\w.+-]+:)'\):\n"
+                                  r"            tgt\.value = string\(value=fhirpath\.single\(fhirpath_utils\.substring\(v,\[(\d+)\],\[\]\)\)\)\n"
+                                  r"            tgt\.system = string\(value='(\w+)'\)\n", re.M)
+
+# the table of the compiled scheme blocks, {scheme: (system, offset)}, put in front of TELContactPoint
+def telecom_schemes(match, name, text):
+    return 'telecom_schemes = {\n%s}\n\ndef TELContactPoint(' % ''.join(
+        '    %r: (%r, %s),\n' % (scheme, system, offset) for scheme, offset, system in telecom_scheme_block.findall(text))
+
+# a compiled block of TELContactPoint mapping the telecom uses of one condition
+telecom_use_block = re.compile(r"^    u = src\.use\n    if u:\n        if (.+):\n(            tgt\.use = string\(value=translate_single\('\w+', \(u if isinstance\(u, str\) else u\.value\), 'code'\)\)\n)", re.M)
+
+# the compiled use blocks in one, the conditions exclude each other so at most one translation is done per telecom
+def telecom_uses(match, name, text):
+    blocks = telecom_use_block.findall(match.group(0))
+    if len({assignment for _, assignment in blocks}) != 1:
+        raise ValueError('the use blocks of %s translate the uses differently, they cannot be merged' % name)
+    return '    u = src.use\n    if u:\n        if %s:\n%s' % (' or '.join('(%s)' % condition for condition, _ in blocks), blocks[0][1])
+
+# the three loops the map compiles to create, name and fill the extensions of the elements of a list
+extension_loops = re.compile(r"^( +)extension = \[\]\n\1for _(\w+) in \2:\n\1    _extension = malac\.models\.fhir\.r4\.Extension\(\)\n"
+                             r"\1    _\2\.extension\.append\(_extension\)\n\1    extension\.append\(_extension\)\n"
+                             r"\1for _extension in extension:\n\1    _extension\.url = ('[^'\\]+')\n"
+                             r"\1for _extension in extension:\n\1    _extension\.(value\w+) = string\(value=(.+)\)\n", re.M)
+
+# the extensions added by add_extensions, the value is the same for all of them and only evaluated for a non-empty list
+def add_extensions(match, name, text):
+    indent, elements, url, value_name, value = match.groups()
+    if re.search(r'\b_?extension\b', value):
+        raise ValueError('the value of the extensions in %s depends on the extension: %s' % (name, value))
+    return "%sif %s:\n%s    add_extensions(%s, %s, '%s', %s)\n" % (indent, elements, indent, elements, url, value_name, value)
+
+# a constant coding the map compiles into a fresh Coding with a constant system and code, appended to a CodeableConcept
+# and not changed afterwards
+constant_coding_block = re.compile(
+    r"^(?P<indent>[ ]*)(?P<coding>\w+) = malac\.models\.fhir\.r4\.Coding\(\)\n"
+    r"(?P=indent)(?P<parent>[\w.]+)\.coding\.append\((?P=coding)\)\n"
+    r"(?P=indent)(?P=coding)\.system = uri\(value=(?P<system>'[^'\\]*')\)\n"
+    r"(?P=indent)(?P=coding)\.code = string\(value=(?P<code>'[^'\\]*')\)\n"
+    r"(?!(?P=indent)(?P=coding)\.)", re.M)
+
+# the conditions of the sections the compiled CdaBodyToFhirComposition dispatches on, each of them once in the order of
+# the map, as the rows of its section kind table
+section_condition = re.compile(r"^( +)if cda_section:\n\1    if (.+):\n", re.M)
+
+def section_conditions(text):
+    conditions = []
+    for _, condition in section_condition.findall(text):
+        if condition not in conditions:
+            conditions.append(condition)
+    return conditions
+
+# the table of the section kinds, put in front of the group
+def section_kinds(match, name, text):
+    return '%s_section_kinds = (\n%s)\n\n%s' % (name, ''.join('    lambda cda_section: %s,\n' % condition for condition in section_conditions(text)), match.group(0))
+
+# the condition as the kind of the section, every kind the section matches is dispatched (the ifs stay independent)
+def section_kind(match, name, text):
+    return '%sif cda_section:\n%s    if %d in section_kinds_of(cda_section, %s_section_kinds):\n' % (
+        match.group(1), match.group(1), section_conditions(text).index(match.group(2)), name)
+
+# a compiled loop over the values of an element mapping those of one type, e.g. the PQ values of an observation
+typed_value_loop = re.compile(r"^( +)for (\w+) in (\w+)\.value or \[\]:\n\1    if type\(\2\) is ([\w.]+):\n((?:\1        .*\n)+)", re.M)
+
+# the loop over the values of the type only, from the values sorted by type in one pass before the first of the loops;
+# the loops stay in the order of the map, so the last value written of each value[x] is the same as before
+def typed_values(match, name, text):
+    indent, variable, element, value_type, body = match.groups()
+    loop = '%sfor %s in %s_values.get(%s, ()):\n%s' % (indent, variable, element, value_type, re.sub('(?m)^    ', '', body))
+    if text.find(match.group(0)) != min(found.start() for found in typed_value_loop.finditer(text)):
+        return loop
+    if indent != '    ':
+        raise ValueError('the first loop over the values of %s in %s is not at the top level of the group' % (element, name))
+    return '%s%s_values = values_by_type(%s.value)\n%s' % (indent, element, element, loop)
+
+# the check of a code among the values of an element, e.g. the pending (255599008) result of an observation
+value_code_check = re.compile(r"^( +)if (not )?\[v1 for v1 in fhirpath_utils\.get\((\w+),'value'\) if fhirpath_utils\.bool_and\("
+                              r"fhirpath_utils\.equals\(fhirpath_utils\.get\(v1,'code'\), '==', \[('[^'\\]+')\]\), "
+                              r"fhirpath_utils\.equals\(fhirpath_utils\.get\(v1,'codeSystem'\), '==', \[('[^'\\]+')\]\)\) == \[True\]\]:\n", re.M)
+
+# the check computed once, before its first use, the variable is named after the code
+def value_code(match, name, text):
+    indent, negation, element, code, codeSystem = match.groups()
+    variable = '%s_value_%s' % (element, re.sub(r'\W', '_', code.strip("'")))
+    check = '%sif %s%s:\n' % (indent, negation or '', variable)
+    if match.start() != min(found.start() for found in value_code_check.finditer(text) if found.group(3, 4, 5) == match.group(3, 4, 5)):
+        return check
+    if indent != '    ':
+        raise ValueError('the first check of the code %s among the values of %s in %s is not at the top level of the group' % (code, element, name))
+    return '%s%s = has_value_code(%s.value, %s, %s)\n%s' % (indent, variable, element, code, codeSystem, check)
+
+# a compiled entry of a Practitioner, PractitionerRole or Organization with the reference to it, and the statements after
+# it in the same block (up to the next entry of the block)
+shared_entry = re.compile(r"^( +)(\w+) = malac\.models\.fhir\.r4\.Bundle_Entry\(\)\n\1(\w+)\.entry\.append\(\2\)\n"
+                          r"\1(\w+) = malac\.models\.fhir\.r4\.(Practitioner|PractitionerRole|Organization)\(\)\n"
+                          r"\1\2\.resource = make_resource_container\('\5', \4\)\n\1(\w+) = string\(value=str\(uuid\.uuid4\(\)\)\)\n"
+                          r"\1\4\.id = \6\n\1\2\.fullUrl = uri\(value=\('urn:uuid:' \+ \6\.value\)\)\n"
+                          r"\1(\w+) = malac\.models\.fhir\.r4\.Reference\(\)\n\1([\w.]+(?: = \7|\.append\(\7\)))\n"
+                          r"\1\7\.reference = string\(value=\('urn:uuid:' \+ \6\.value\)\)\n\1\7\.type_ = constant\(uri, '\5'\)\n"
+                          r"((?:(?! *\w+ = malac\.models\.fhir\.r4\.Bundle_Entry\(\))\1.*\n)*)", re.M)
+
+# the identity keys (see entity_key) of the shared entries per group and resource type, a PractitionerRole is the entity
+# in its organization
+shared_entry_keys = {
+    ('CdaAssignedEntityToFhirPractitionerRole', 'Practitioner'): 'entity_key(cda_assignedEntity)',
+    ('CdaAssignedEntityToFhirPractitionerRole', 'Organization'): 'entity_key(cda_representedOrganization)',
+    ('CdaAssociatedEntityToFhirPractitionerRole', 'Practitioner'): 'entity_key(cda_associatedEntity)',
+    ('CdaAssociatedEntityToFhirPractitionerRole', 'Organization'): 'entity_key(cda_scopingOrganization)',
+    ('CdaPerformerToFhirObservationPerformer', 'PractitionerRole'):
+        '(entity_key(cda_performer_assignedEntity), entity_key(cda_performer_assignedEntity.representedOrganization))',
+    ('CdaSpecimenCollectionToFhirSpecimen', 'PractitionerRole'):
+        '(entity_key(cda_procedure_performer_assignedEntity), entity_key(cda_procedure_performer_assignedEntity.representedOrganization))',
+}
+
+# the statements of a block as [text], an assignment with the if on the assigned variable after it as one statement
+def block_statements(indent, text):
+    statements = []
+    for line in text.splitlines(keepends=True):
+        if line.startswith(indent) and not line[len(indent)].isspace():
+            previous = re.match(r" *(\w+) = ", statements[-1]) if statements else None
+            if not (previous and line == '%sif %s:\n' % (indent, previous.group(1))):
+                statements.append('')
+        statements[-1] += line
+    return statements
+
+# the entry looked up in the resources of the bundle by the identity key (DocumentContext.bundle_resource), the reference
+# is added in any case, the statements filling the resource (the leading ones using it) only for a new entry
+def bundle_resource(match, name, text):
+    indent, _, bundle, resource, resource_type, _, reference, link, rest = match.groups()
+    key = shared_entry_keys.get((name, resource_type))
+    if key is None:
+        raise ValueError('%s adds a %s entry without an identity key in shared_entry_keys' % (name, resource_type))
+    statements = block_statements(indent, rest)
+    filling = 0
+    while filling < len(statements) and re.search(r'\b%s\b' % resource, statements[filling]):
+        filling += 1
+    result = ("{0}{1}, {1}_new = document_context().bundle_resource({2}, '{3}', {4})\n{0}{5} = malac.models.fhir.r4.Reference()\n{0}{6}\n"
+              "{0}{5}.reference = string(value=document_context().reference({1}))\n{0}{5}.type_ = constant(uri, '{3}')\n").format(
+        indent, resource, bundle, resource_type, key, reference, link)
+    if filling:
+        result += '%sif %s_new:\n%s' % (indent, resource, re.sub('(?m)^(?=.)', '    ', ''.join(statements[:filling])))
+    return result + ''.join(statements[filling:])
+
+# the id of a compiled entry of the resource (the variables of the resource given as pattern)
+def resource_id_site(resources):
+    return re.compile(r"^( +)(\w+)\.resource = make_resource_container\('(\w+)', (%s)\)\n\1(\w+) = string\(value=str\(uuid\.uuid4\(\)\)\)\n" % resources, re.M)
+
+# the source element whose ids name a resource with --resource-ids uuid5, per (group, resource variable), for the
+# resources created once per CDA entry (the others are named by their mapping path and occurrence)
+resource_id_elements = {
+    ('CdaSpecimenSectionToFhirSpecimen', 'fhir_specimen'): 'cda_procedure',
+    ('CdaLaboratorySpecialtySectionToFhirSection', 'fhir_specimen'): 'cda_procedure',
+    ('CdaLaboratorySpecialtySectionToFhirSection', 'fhir_observation'): 'cda_laboratory_battery_organizer',
+    ('CdaLaboratorySpecialtySectionToFhirSection', 'fhir_laboratory_observation'): 'cda_laboratory_observation',
+    ('CdaLaboratorySpecialtySectionToFhirSectionWithSpecimen', 'fhir_observation'): 'cda_laboratory_battery_organizer',
+    ('CdaLaboratorySpecialtySectionToFhirSectionWithSpecimen', 'fhir_laboratory_observation'): 'cda_laboratory_observation',
+}
+
+# the id from resource_id, named by the group and the resource type (and the ids of the source element)
+def resource_id(element=None):
+    def replacement(match, name, text):
+        indent, entry, resource_type, resource, resource_id = match.groups()
+        arguments = repr('%s/%s' % (name, resource_type)) + (', ' + element if element else '')
+        return "%s%s.resource = make_resource_container('%s', %s)\n%s%s = string(value=resource_id(%s))\n" % (
+            indent, entry, resource_type, resource, indent, resource_id, arguments)
+    return replacement
+
+# an entry of the resources CdaToFhirBundle creates for the header and body groups, which fill them
+header_entry = re.compile(r"^( +)(\w+) = malac\.models\.fhir\.r4\.Bundle_Entry\(\)\n\1fhir_bundle\.entry\.append\(\2\)\n"
+                          r"\1((\w+) = malac\.models\.fhir\.r4\.(\w+)\(\)\n)\1(\2\.resource = make_resource_container\('\5', \4\)\n)"
+                          r"(\1\w+ = string\(value=resource_id\('[\w/]+'\)\)\n\1\4\.id = \w+\n)\1(\2\.fullUrl = .*\n)", re.M)
+
+# the resource types of the calls of the groups skipped unless one of them is selected (--resource-types), per group
+group_resource_types = {
+    'CdaHeaderToFhirComposition': ('Composition', 'Patient', 'ServiceRequest', 'Device', 'Encounter', 'PractitionerRole', 'Practitioner', 'Organization'),
+    'CdaHeaderToFhirDiagnosticReport': ('DiagnosticReport',),
+    'CdaToPractitionerRole': ('PractitionerRole', 'Practitioner', 'Organization'),
+}
+
+# the rewrites of the generated code, applied in this order
+rules = [
+    # the options of the runtime on the command line and in transform(), see transform_option_defaults
+    Rule('the options of the runtime on the command line', r"^    return parser$", "    return add_arguments(parser)", groups=('init_argparse',), count=1),
+    Rule('the options of transform()', r"^def transform\(source_path, target_path\):$", "def transform(source_path, target_path, **options):", groups=('transform',), count=1),
+    Rule('the start of transform()', r"^(    print\('\+{7} Transformation from '.*' started \+{7}'\)\n)", r"\1    options = start_transform(options)\n", groups=('transform',), count=1),
+    Rule('the end of transform()', r"^(    print\('altogether in )", r"    finish_transform(options)\n\1", groups=('transform',), count=1),
+    Rule('the options of the command line passed to transform()', r"^    transform\(args\.source, args\.target\)$", "    transform(args.source, args.target, **transform_options(args))", groups=('__main__',), count=1),
+    Rule('the registration of the default maps', r"\Z", "register_default_types_maps(default_types_maps, default_types_maps_plus)\n", groups=('default_types_maps_plus',), count=1),
+    Rule('the ResourceContainers recording their resource type', r"malac\.models\.fhir\.r4\.ResourceContainer\((\w+)=(\w+)\)", r"make_resource_container('\1', \2)"),
+    # the telecom values parsed by one lookup of their URL scheme in the table of the compiled schemes, instead of one
+    # startswith and substring per scheme
+    Rule('the table of the telecom schemes', r"^def TELContactPoint\(", telecom_schemes, groups=('TELContactPoint',), count=1),
+    Rule('the telecom schemes', r"(?:%s)+" % telecom_scheme_block.pattern,
+         "    v = src.value\n    if v:\n        scheme = telecom_schemes.get(v[:v.find(':') + 1])\n        if scheme is not None:\n"
+         "            system, offset = scheme\n            tgt.value = string(value=(v[offset:] if offset < len(v) else None))\n"
+         "            tgt.system = string(value=system)\n", groups=('TELContactPoint',), count=1),
+    Rule('the telecom uses', re.compile(r"(?:%s){2,}" % telecom_use_block.pattern, re.M), telecom_uses, groups=('TELContactPoint',), count=1),
+    # the HL7 TS parsed by parse_ts (in the precision and with the timezone of the source), instead of dateutil
+    Rule('the TS as FHIR instant', r"\bdateutil\.parser\.parse\(str\((\w+)\)\)$", r"parse_ts(str(\1)).instant", groups=('TSInstant',), count=1),
+    Rule('the TS as FHIR dateTime', r"\bdateutil\.parser\.parse\(str\((\w+)\)\)\.isoformat\(\)$", r"parse_ts(str(\1)).dateTime", groups=('TSDateTime',), count=1),
+    Rule('the TS as FHIR date', r"\bdateutil\.parser\.parse\(str\((\w+)\)\)\.isoformat\(\)$", r"parse_ts(str(\1)).date", groups=('TSDate',), count=1),
+    Rule('the TS assigned as FHIR dateTime in the groups', r"\bdateTime\(value=dateutil\.parser\.parse\((\w+)\)\.isoformat\(\)\)", r"dateTime(value=parse_ts(\1).dateTime)"),
+    # the identifier roots read once and classified by a memoized fullmatch and by in, instead of the fhirpath evaluation
+    Rule('the identifier root read once', r"^    r = src\.root\n    if r:\n(?=        if )",
+         lambda match, name, text: match.group(0) if text.find(match.group(0)) == match.start() else '', groups=('II',), count=3),
+    Rule('the identifier roots matching a pattern', r"\bfhirpath\.single\(fhirpath_utils\.bool_and\(\[\(src\.extension is None\)\], \[v2 for v1 in fhirpath_utils\.get\(src,'root'\) for v2 in fhirpath_utils\.matches\(v1, \[('[^'\\]+')\]\)\]\)\)",
+         r"src.extension is None and root_fullmatch(\1, r)", groups=('II',), count=1),
+    Rule('the identifier roots containing a string', r"\bfhirpath\.single\(fhirpath_utils\.bool_and\(\[\(src\.extension is None\)\], \[v2 for v1 in fhirpath_utils\.get\(src,'root'\) for v2 in fhirpath_utils\.contains\(v1, \[('[^'\\]+')\]\)\]\)\)",
+         r"src.extension is None and \1 in r", groups=('II',), count=1),
+    Rule('the UUID identifier values', r"\bfhirpath\.single\(fhirpath_utils\.add\(\[('[^'\\]+')\], fhirpath_utils\.lower\(r\)\)\)", r"\1 + r.lower()", groups=('II',), count=1),
+    # the AD and PN parts read once by part_texts and their extensions added in one loop
+    Rule('the texts of the AD parts', r"\bfhirpath_utils\.get\((\w+),'(\w+)','valueOf_',strip=True\)", r"part_texts(\1.\2)",
+         groups=('CdaAdressCompilationToFhirAustrianAddress',)),
+    Rule('the texts of the PN parts', r"\bfhirpath_utils\.get\((\w+),'valueOf_',strip=True\)", r"part_texts([\1])",
+         groups=('CdaPersonNameCompilationToFhirHumanName',), count=3),
+    Rule('the extensions of the AD and PN parts', extension_loops, add_extensions,
+         groups=('CdaAdressCompilationToFhirAustrianAddress', 'CdaPersonNameCompilationToFhirHumanName')),
+    # the constant primitives and codings of the map, shared as frozen instances with --shared-constants
+    Rule('the constant codings', constant_coding_block, lambda match, name, text: '%s%s.coding.append(constant_coding(%s, %s))\n' % (
+        match['indent'], match['parent'], match['system'], match['code'])),
+    Rule('the constant primitives', r"\b(string|uri|code)\(value=('[^'\\]*')\)", r"constant(\1, \2)"),
+    # the templateId, code and root count checks of the routing, as lookups in the index of the document (CdaIndex)
+    Rule('the templateId checks of an attribute', r"\bfhirpath\.single\(\[v1 for (g\d+) in \[(\w+)\] if \1 is not None for (g\d+) in \[\1\.(\w+)\] if \3 for v1 in \3\.templateId if v1\.root == ('[^'\\]+')\]\)",
+         r"document_index().has_template(\2.\4, \5)"),
+    Rule('the templateId checks', r"\bfhirpath\.single\(\[v1 for (g\d+) in \[(\w+)\] if \1 is not None for v1 in \1\.templateId if \(?(v1\.root == '[^'\\]+'(?: or v1\.root == '[^'\\]+')*)\)?\]\)",
+         lambda match, name, text: 'document_index().has_template(%s, %s)' % (match.group(2), ', '.join(re.findall(r"'[^'\\]+'", match.group(3))))),
+    Rule('the code checks', r"\b(\w+) is not None and \1\.code and (?:\1\.code\.code == ('[^'\\]+')|\(\1\.code\.code == ('[^'\\]+') and \1\.code\.codeSystem == ('[^'\\]+')\))(?=:)",
+         lambda match, name, text: 'document_index().has_code(%s, %s)' % (match.group(1), match.group(2) or '%s, %s' % (match.group(3), match.group(4)))),
+    Rule('the root counts of the document', r"\blen\(\[(v\d+) for \1 in fhirpath_utils\.descendants\(\[cda\]\) if fhirpath_utils\.equals\(fhirpath_utils\.get\(\1,'root'\), '==', \[('[^'\\]+')\]\) == \[True\]\]\)",
+         r"document_index().root_count(\2)", groups=('CdaBodyToFhirComposition',), count=3),
+    # the sections classified once into the kinds of the table, instead of evaluating the conditions per pass and target
+    Rule('the table of the section kinds', r"^def CdaBodyToFhirComposition\(", section_kinds, groups=('CdaBodyToFhirComposition',), count=1),
+    Rule('the section kinds', section_condition, section_kind, groups=('CdaBodyToFhirComposition',)),
+    # the issued instants and the references of the observations, from the context of the document (DocumentContext)
+    Rule('the issued instant of the organizers', r"^( +)if any\(True for (g\d+) in \[next\(iter\(cda\.documentationOf or \[\]\), None\)\] if \2 is not None for (g\d+) in \[\2\.serviceEvent\] if \3 for g\d+ in \3\.performer\):\n"
+         r"\1    if len\(cda\.documentationOf\) > 0:\n\1        cda_documentationOf = cda\.documentationOf\[0\]\n\1        cda_documentationOf_serviceEvent = cda_documentationOf\.serviceEvent\n"
+         r"\1        if cda_documentationOf_serviceEvent:\n\1            for cda_documentationOf_serviceEvent_performer in cda_documentationOf_serviceEvent\.performer or \[\]:\n"
+         r"\1                if cda_documentationOf_serviceEvent_performer\.time:\n\1                    (\w+)\.issued = malac\.models\.fhir\.r4\.instant\(\)\n"
+         r"\1                    transform_default\(cda_documentationOf_serviceEvent_performer\.time, \4\.issued\)\n",
+         r"\1for issued in document_context().organizer_issued:\n\1    \4.issued = malac.models.fhir.r4.instant(value=issued)\n", groups=('CdaOrganizerToFhirObservation',), count=1),
+    Rule('the issued instant of the observations', r"^( +)for cda_legalAuthenticator in cda\.legalAuthenticator or \[\]:\n\1    if cda_legalAuthenticator\.time:\n"
+         r"\1        if cda_legalAuthenticator\.time\.nullFlavor is None:\n\1            (\w+)\.issued = malac\.models\.fhir\.r4\.instant\(\)\n"
+         r"\1            TSInstant\(cda_legalAuthenticator\.time, \2\.issued\)\n",
+         r"\1for issued in document_context().observation_issued:\n\1    \2.issued = malac.models.fhir.r4.instant(value=issued)\n", groups=('CdaLaboratoryObservationToFhirObservation',), count=1),
+    Rule('the references to the resources of the document', r"^( +)if (\w+)\.id is None:\n\1    \2\.id = malac\.models\.fhir\.r4\.string\(\)\n\1(\w+) = \2\.id\n"
+         r"\1(\w+)\.reference = string\(value=\('urn:uuid:' \+ \3\.value\)\)\n", r"\1\4.reference = string(value=document_context().reference(\2))\n"),
+    # the values of the observations sorted by type in one pass and the pending check computed once
+    Rule('the code checks of the observation values', value_code_check, value_code, groups=('CdaLaboratoryObservationToFhirObservation',)),
+    Rule('the effectiveTime of the observation read once', r"^(    cda_effectiveTime = cda_laboratory_observation\.effectiveTime\n(?:    .*\n)*?)    if fhirpath\.single\(\[v1 for v1 in fhirpath_utils\.get\(cda_laboratory_observation,'effectiveTime'\) if v1\.nullFlavor == ('[^'\\]+')\]\):\n",
+         r"\1    if cda_effectiveTime and cda_effectiveTime.nullFlavor == \2:\n", groups=('CdaLaboratoryObservationToFhirObservation',), count=1),
+    Rule('the loops over the observation values per type', typed_value_loop, typed_values, groups=('CdaLaboratoryObservationToFhirObservation',)),
+    # the Practitioner, PractitionerRole and Organization entries shared within the bundle by the identity of the entity
+    Rule('the shared Practitioner and Organization entries', shared_entry, bundle_resource,
+         groups=('CdaAssignedEntityToFhirPractitionerRole', 'CdaAssociatedEntityToFhirPractitionerRole'), count=2),
+    Rule('the shared PractitionerRole entries', shared_entry, bundle_resource,
+         groups=('CdaPerformerToFhirObservationPerformer', 'CdaSpecimenCollectionToFhirSpecimen'), count=1),
+    # the resource ids and fullUrls from resource_id, random or name-based (--resource-ids)
+    *[Rule('the resource id of %s named by %s' % (resource, element), resource_id_site(resource), resource_id(element), groups=(group,), count=1)
+      for (group, resource), element in resource_id_elements.items()],
+    Rule('the resource ids', resource_id_site(r'\w+'), resource_id()),
+    Rule('the bundle id', r"^    fhir_bundle\.id = string\(value=str\(uuid\.uuid4\(\)\)\)$", "    fhir_bundle.id = string(value=resource_id('CdaToFhirBundle/Bundle'))",
+         groups=('CdaToFhirBundle',), count=1),
+    # the entries of the header and body resources only for the selected resource types (the resources, referenced by the
+    # groups, are created in any case), and the groups called only for them
+    Rule('the entries of the selected header and body resources', header_entry,
+         r"\1\3\7\1if selected_resources('\5'):\n\1    \2 = malac.models.fhir.r4.Bundle_Entry()\n\1    \6\1    \8\1    add_bundle_entry(fhir_bundle, \2)\n",
+         groups=('CdaToFhirBundle',), count=5),
+    *[Rule('the call of %s for the selected resource types' % group, r"^( +)(%s\(.*\)\n)" % group,
+           r"\1if selected_resources(%s):\n\1    \2" % ', '.join(map(repr, resource_types)), groups=('CdaToFhirBundle',), count=1)
+      for group, resource_types in group_resource_types.items()],
+    # the entries added to the bundle (if their resource type is selected) and indexed by fullUrl and resource type once
+    # their fullUrl is set (BundleIndex)
+    Rule('the entries added to the bundle', r"^( +)(\w+)\.entry\.append\((\w+)\)\n((?:\1.*\n)*?\1\3\.fullUrl = uri\(value=\('urn:uuid:' \+ \w+\.value\)\)\n)",
+         r"\4\1add_bundle_entry(\2, \3)\n"),
+    Rule('the transformation of the document in transform()', r"^    CdaToFhirBundle\(cda, fhir_bundle\)$", "    transform_document(CdaToFhirBundle, cda, fhir_bundle, **options)", groups=('transform',), count=1),
+    Rule('the bundle returned by transform()', r"^    print\('\+{7} Transformation from '.*' ended  \+{7}'\)\n", r"\g<0>    return fhir_bundle\n", groups=('transform',), count=1),
+]
+
+# the changes of a definition to the constants it assigned before (e.g. an extension appended to a constant string) go
+# to the mutable copy from writable, as the constants are shared and frozen with --shared-constants (copy on write)
+constant_assignment = re.compile(r"^ *([\w.]+) = constant(?:_coding)?\(")
+constant_change = re.compile(r"^( *)((\w+)(?:\.\w+)+)(?= *=[^=]|\.(?:append|extend|insert)\()")
+
+def writable_constants(name, text):
+    constants = set()
+    lines = text.splitlines(keepends=True)
+    for number, line in enumerate(lines):
+        change = constant_change.match(line)
+        if change:
+            indent, path = change.group(1), change.group(2)
+            changed = [constant for constant in constants if path.startswith(constant + '.')]
+            if changed:
+                constant = max(changed, key=len)
+                parent, _, attribute = constant.rpartition('.')
+                if not parent:
+                    raise ValueError('%s changes the constant %s, assign it to an attribute to change it with writable' % (name, constant))
+                lines[number] = indent + "writable(%s, '%s')" % (parent, attribute) + line[len(indent) + len(constant):]
+        assignment = re.match(r"^ *([\w.]+) = ", line)
+        if assignment:
+            constants.discard(assignment.group(1))
+            if constant_assignment.match(line):
+                constants.add(assignment.group(1))
+    return ''.join(lines)
+
+# the dict a top-level statement assigns an item of, None for other statements
+def item_of(node):
+    if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Subscript) and isinstance(node.targets[0].value, ast.Name):
+        return node.targets[0].value.id
+    return None
+
+# the top-level name of a definition, '__main__' for the main block
+def definition_name(node):
+    if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+        return node.name
+    if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+        return node.targets[0].id
+    if isinstance(node, ast.If) and '__main__' in ast.unparse(node.test):
+        return '__main__'
+    return None
+
+# the top-level statements of the source as [name, node, text], the text with the blank and comment lines above
+def definitions(source):
+    lines = source.splitlines(keepends=True)
+    result = []
+    end = 0
+    for node in ast.parse(source).body:
+        result.append([definition_name(node), node, ''.join(lines[end:node.end_lineno])])
+        end = node.end_lineno
+    if result:
+        result[-1][2] += ''.join(lines[end:])
+    return result
+
+# the patched map and the failures, nothing of the map is left unpatched silently
+def patch(source, runtime_source):
+    if re.search(r'^import cda2fhir_runtime$', source, re.M):
+        return source, ['the map is patched already, patch the map as compiled by MaLaC-HD and lowered by lower_fhirpath.py']
+    failures = []
+    compiled = definitions(source)
+    compiled_names = {name for name, _, _ in compiled if name}
+    runtime_names = {name for name, node, _ in definitions(runtime_source) if name and not isinstance(node, (ast.Import, ast.ImportFrom))}
+    failures += ['%s is replaced by the runtime, but not compiled into the map' % name for name in replaced_definitions if name not in compiled_names]
+    failures += ['%s is compiled into the map and defined by the runtime, but not listed in replaced_definitions' % name
+                 for name in sorted(compiled_names & runtime_names - set(replaced_definitions))]
+    failures += ['%s is listed in replaced_definitions, but not defined by the runtime' % name for name in replaced_definitions if name not in runtime_names]
+    for rule in rules:
+        rule.matches.clear()
+    result = []
+    last_import = 0
+    dropped = {}
+    for name, node, text in compiled:
+        if name in replaced_definitions:
+            continue
+        if item_of(node) in dropped_items:
+            dropped[item_of(node)] = dropped.get(item_of(node), 0) + 1
+            continue
+        if isinstance(node, (ast.FunctionDef, ast.Assign, ast.If)):
+            try:
+                for rule in rules:
+                    text = rule.apply(name, text)
+                text = writable_constants(name, text)
+            except ValueError as e:
+                failures.append(str(e))
+        if isinstance(node, ast.Import) and [alias.name for alias in node.names if alias.name in dropped_imports]:
+            dropped.update((alias.name, 1) for alias in node.names)
+            if len(node.names) > 1:
+                failures.append('%s imports more than the dropped modules, import them on their own line' % text.strip())
+            continue
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            last_import = len(result) + 1
+        result.append(text)
+    failures += ['the items of %s are dropped, but not compiled into the map' % name for name in dropped_items if name not in dropped]
+    failures += ['%s is dropped, but not imported by the map' % name for name in dropped_imports if name not in dropped]
+    for name in dropped_imports:
+        module = name.split('.')[0]
+        failures += ['%s is dropped, but still used by %s' % (name, definition)
+                     for definition, _, text in definitions(''.join(result)) if re.search(r'\b%s\.' % re.escape(module), text)]
+    for rule in rules:
+        failures += rule.failures()
+    result.insert(last_import, ('' if re.search('^import os$', source, re.M) else 'import os\n') + runtime_import)
+    return ''.join(result), failures
+
+if __name__ == "__main__":
+    parser = init_argparse()
+    args = parser.parse_args()
+    with open(args.source, encoding='utf-8') as f:
+        source = f.read()
+    with open(args.runtime, encoding='utf-8') as f:
+        runtime_source = f.read()
+    patched, failures = patch(source, runtime_source)
+    if failures:
+        for failure in failures:
+            print('Error: ' + failure, file=sys.stderr)
+        sys.exit('The map could not be patched, adapt the rules of patch_map.py or the runtime to the compiled map')
+    with open(args.target or args.source, 'w', encoding='utf-8') as f:
+        f.write(patched)
+    print('+++++++ map patched to use the runtime in %s +++++++' % os.path.basename(args.runtime))
@@ -0,0 +1,84 @@
+import sys
+import argparse
+import os
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import cda2fhir_runtime
+
+description_text = "Local stand-in for a FHIR terminology server, serving ConceptMap/$translate (also in batch Bundles) from the conceptMaps in FHIR mapping language (.map) or FHIR ConceptMap (.json, .xml) files, e.g. for testing CdaToBundle.4.py with --terminology-server."
+
+def init_argparse() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=description_text)
+    parser.add_argument(
+       'conceptmaps', nargs='+', help='the files the conceptMaps are loaded from'
+    )
+    parser.add_argument(
+       '-p', '--port', type=int, default=8090, help='the port to listen on, default 8090'
+    )
+    parser.add_argument(
+       '--delay', type=float, default=0.0, help='the delay in seconds added to every response, to simulate a slow terminology server'
+    )
+    return parser
+
+def load_conceptMaps(paths):
+    # the conceptMap readers of the runtime of the map are reused
+    concepts = {}
+    for path in paths:
+        for url, source_dict in cda2fhir_runtime.read_conceptMaps(os.path.abspath(path)).items():
+            for target_dict in source_dict.values():
+                for system_dict in target_dict.values():
+                    for targetsystem_dict in system_dict.values():
+                        for code_dict in targetsystem_dict.values():
+                            for code, entries in code_dict.items():
+                                if code not in ("|", "~", "#", "%"):
+                                    concepts.setdefault((url, code), []).extend(entries)
+    return concepts
+
+def translate(concepts, parameters):
+    values = {parameter.get("name"): next((value for key, value in parameter.items() if key.startswith("value")), None)
+              for parameter in parameters.get("parameter", [])}
+    matches = concepts.get((values.get("url"), values.get("code")), [])
+    return {"resourceType": "Parameters", "parameter": [{"name": "result", "valueBoolean": any(match["relationship"] != "not-related-to" for match in matches)}] + [
+        {"name": "match", "part": [{"name": "equivalence", "valueCode": match["relationship"]},
+                                   {"name": "concept", "valueCoding": match["concept"]},
+                                   {"name": "source", "valueUri": match["source"]}]} for match in matches]}
+
+def make_handler(concepts, delay):
+    class TranslateHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+            if delay:
+                time.sleep(delay)
+            if request.get("resourceType") == "Bundle":
+                response = {"resourceType": "Bundle", "type": "batch-response", "entry": [
+                    {"resource": translate(concepts, entry.get("resource", {})), "response": {"status": "200"}} for entry in request.get("entry", [])]}
+            else:
+                response = translate(concepts, request)
+            body = json.dumps(response).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/fhir+json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return TranslateHandler
+
+def serve(paths, port, delay=0.0):
+    concepts = load_conceptMaps(paths)
+    server = ThreadingHTTPServer(('localhost', port), make_handler(concepts, delay))
+    print('+++++++ Terminology stand-in with '+str(len(concepts))+' codes listening on http://localhost:'+str(server.server_address[1])+' +++++++')
+    return server
+
+if __name__ == "__main__":
+    parser = init_argparse()
+    args = parser.parse_args()
+    try:
+        serve(args.conceptmaps, args.port, args.delay).serve_forever()
+    except KeyboardInterrupt:
+        sys.exit(0)